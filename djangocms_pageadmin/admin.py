@@ -1,40 +1,80 @@
-import csv
 import datetime
-
-from django.contrib import admin
-from django.contrib.admin.utils import unquote
-from django.contrib.sites.shortcuts import get_current_site
-from django.core.exceptions import PermissionDenied
+import hashlib
+import os
+import time
+from contextlib import nullcontext
+from functools import partial
+from itertools import islice
+
+from django.apps import apps
+from django.contrib import admin, messages
+from django.contrib.admin.filters import FieldListFilter
+from django.contrib.admin.utils import get_fields_from_path, unquote
+from django.contrib.admin.views.main import (
+    IGNORED_PARAMS,
+    ORDER_VAR,
+    PAGE_VAR,
+    SEARCH_VAR,
+)
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
 from django.db import transaction
-from django.db.models import OuterRef, Prefetch, Q, Subquery
+from django.db.models import Count, Max, OuterRef, Prefetch, Q, Subquery
 from django.http import (
-    HttpResponse,
+    FileResponse,
+    Http404,
     HttpResponseBadRequest,
     HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
 )
-from django.shortcuts import redirect, render
+from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import path, re_path, reverse
+from django.utils.cache import (
+    add_never_cache_headers,
+    patch_cache_control,
+    patch_vary_headers,
+)
 from django.utils.decorators import method_decorator
 from django.utils.html import format_html, format_html_join
-from django.utils.translation import get_language, gettext_lazy as _, override
-from django.views.decorators.http import require_POST
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.utils.text import slugify
+from django.utils.translation import (
+    get_language,
+    gettext_lazy as _,
+    ngettext,
+    override,
+)
+from django.views.decorators.http import condition, require_POST
 
 from cms import api
 from cms.admin.pageadmin import PageContentAdmin as DefaultPageContentAdmin
 from cms.extensions import extension_pool
-from cms.models import PageContent, PageUrl
+from cms.models import Page, PageContent, PageUrl, TreeNode
 from cms.signals.apphook import set_restart_trigger
 from cms.toolbar.utils import get_object_preview_url
 
+from django_fsm import TransitionNotAllowed
 from djangocms_version_locking.helpers import version_is_locked
 from djangocms_version_locking.models import VersionLock
 from djangocms_versioning.admin import VersioningAdminMixin
-from djangocms_versioning.constants import DRAFT, PUBLISHED
+from djangocms_versioning.constants import DRAFT, PUBLISHED, VERSION_STATES
+from djangocms_versioning.exceptions import ConditionFailed
 from djangocms_versioning.helpers import version_list_url
 from djangocms_versioning.models import Version
 
+from . import conf
+from .changelist import CachedChangeListMixin, ListingChangeListMixin
 from .compat import DJANGO_4_2
+from .exporters import (
+    CSVExporter,
+    JSONLinesExporter,
+    XLSXExporter,
+    gzip_stream,
+)
 from .filters import (
     AuthorFilter,
     LanguageFilter,
@@ -42,7 +82,28 @@ from .filters import (
     UnpublishedFilter,
 )
 from .forms import DuplicateForm
-from .helpers import is_moderation_enabled, proxy_model
+from .helpers import (
+    accepts_gzip,
+    bump_changelist_generation,
+    get_changelist_generation,
+    get_duplicate_estimate,
+    get_expected_duplicate_duration,
+    get_request_context,
+    is_moderation_enabled,
+    pin_to_primary,
+    proxy_model,
+    record_duplicate_throughput,
+    use_read_database,
+)
+from .limiter import (
+    RETRY_AFTER,
+    ConcurrencyLimitReached,
+    ConcurrencySlot,
+    ReleasingStream,
+)
+from .models import ExportJob, PageContentListing, PendingDuplicate
+from .rows import PageContentRow
+from .timeouts import StatementTimeout, statement_timeout
 
 
 try:
@@ -58,6 +119,7 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
     change_list_template = "admin/djangocms_pageadmin/pagecontent/change_list.html"
     list_display_links = None
     list_filter = (LanguageFilter, UnpublishedFilter, TemplateFilter, AuthorFilter)
+    actions = ["publish_selected", "unpublish_selected"]
     _list_display = [
         "get_title",
         "url",
@@ -67,16 +129,117 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
     ]
     ordering = ['-versions__modified']
     search_fields = ("title",)
+    # Columns of the page contents and their pages that neither the
+    # changelist nor the export read
+    listing_deferred_fields = (
+        "page_title",
+        "menu_title",
+        "meta_description",
+        "redirect",
+        "created_by",
+        "changed_by",
+        "creation_date",
+        "changed_date",
+        "page__created_by",
+        "page__changed_by",
+        "page__creation_date",
+        "page__changed_date",
+        "page__reverse_id",
+        "page__navigation_extenders",
+    )
+    # Columns of the exports as (name, header) pairs. Names other than the
+    # built-in columns are methods of the admin called with the row dict.
+    export_columns = (
+        ("title", "Title"),
+        ("expires", "Expiry Date"),
+        ("state", "Version State"),
+        ("author", "Version Author"),
+        ("url", "Url"),
+        ("compliance_number", "Compliance Number"),
+    )
+    export_formats = (CSVExporter, JSONLinesExporter, XLSXExporter)
+    # Page content orderings of the export and the page listing columns
+    # sorting the same way
+    listing_ordering_fields = {
+        "pk": "page_content_id",
+        "title": "title",
+        "language": "language",
+        "versions__modified": "modified",
+        "versions__state": "state",
+        "versions__created_by": "author",
+    }
+    # Pages per response of the JSON API, and the most a ``limit`` can ask for
+    api_page_size = 100
+    api_max_page_size = 1000
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        bases = (ListingChangeListMixin, changelist)
+        if conf.CHANGELIST_CACHE_TIMEOUT:
+            bases = (CachedChangeListMixin,) + bases
+        return type("PageContentChangeList", bases, {})
 
     def get_list_display(self, request):
-        return self._list_display + [self._list_actions(request)]
+        return self._get_columns(request) + [self._list_actions(request)]
+
+    def _get_columns(self, request):
+        columns = list(self._list_display)
+        if is_moderation_enabled():
+            columns.append("moderation")
+        return columns
 
     def get_queryset(self, request):
         """Filter PageContent objects by current site of the request.
+
+        The queryset is built once per request and shared by the changelist
+        and the list filters. It reads from the database of the request
+        context.
         """
+        return get_request_context(request).get_queryset(
+            "base", partial(self._build_queryset, request)
+        )
+
+    def _build_queryset(self, request):
         url_subquery = PageUrl.objects.filter(
             language=OuterRef("language"), page=OuterRef("page")
         )
+        context = get_request_context(request)
+        queryset = (
+            super()
+            .get_queryset(request)
+            .using(context.database)
+            .filter(page__node__site=context.site)
+            .annotate(_path=Subquery(url_subquery.values("path")[:1]))
+        )
+        return queryset.select_related("page").prefetch_related(
+            Prefetch("versions", queryset=self._get_versions_queryset())
+        )
+
+    def get_listing_queryset(self, request):
+        """The queryset of the changelist and the export, which only loads
+        the columns they read.
+        """
+        return get_request_context(request).get_queryset(
+            "listing", partial(self._build_listing_queryset, request)
+        )
+
+    def _build_listing_queryset(self, request):
+        user_model = get_user_model()
+        user_fields = [
+            "created_by__{}".format(field.name)
+            for field in user_model._meta.concrete_fields
+            if field.name not in (user_model._meta.pk.name, user_model.USERNAME_FIELD)
+        ]
+        return (
+            self.get_queryset(request)
+            .defer(*self.listing_deferred_fields)
+            .prefetch_related(None)
+            .prefetch_related(
+                Prefetch("versions", queryset=self._get_versions_queryset().defer(*user_fields))
+            )
+        )
+
+    def _get_versions_queryset(self):
         # Collect locked status to handle the requirement that lock
         # on a draft version dictates the unpublish permission
         # on a published version
@@ -85,25 +248,28 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
             version__object_id=OuterRef("object_id"),
             version__state=DRAFT,
         ).order_by("-pk")
-        queryset = (
-            super()
-            .get_queryset(request)
-            .filter(page__node__site=get_current_site(request))
-            .annotate(_path=Subquery(url_subquery.values("path")[:1]))
-        )
-        return queryset.select_related("page").prefetch_related(
-            Prefetch(
-                "versions",
-                queryset=Version.objects.annotate(
-                    # used by locking
-                    _draft_version_user_id=Subquery(
-                        draft_version_lock_subquery.values("created_by")[:1]
-                    )
+        versions = (
+            Version.objects.annotate(
+                # used by locking
+                _draft_version_user_id=Subquery(
+                    draft_version_lock_subquery.values("created_by")[:1]
                 )
-                .select_related("created_by", "versionlock")
-                .prefetch_related("content"),
             )
+            .select_related("created_by", "versionlock")
+            .prefetch_related("content")
         )
+        if is_moderation_enabled():
+            from djangocms_moderation.models import ModerationRequest
+
+            # used by the moderation column
+            versions = versions.prefetch_related(
+                Prefetch(
+                    "moderationrequest_set",
+                    queryset=ModerationRequest.objects.filter(is_active=True).select_related("collection"),
+                    to_attr="_active_moderation_requests",
+                )
+            )
+        return versions
 
     def get_actions(self, request):
         """
@@ -117,8 +283,7 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         if not is_moderation_enabled():
             return actions
 
-        from djangocms_moderation.admin_actions import \
-            add_items_to_collection  # noqa
+        from .moderation import add_items_to_collection
 
         actions["add_items_to_collection"] = (
             add_items_to_collection,
@@ -127,6 +292,166 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         )
         return actions
 
+    @admin.action(
+        description=_("Publish selected pages"),
+        permissions=["change"],
+    )
+    def publish_selected(self, request, queryset):
+        return self._change_selected_state(
+            request, queryset, DRAFT, "publish", _("Publish selected pages")
+        )
+
+    publish_selected.queryset_fields = ("pk", "page_id", "language", "title")
+
+    @admin.action(
+        description=_("Unpublish selected pages"),
+        permissions=["change"],
+    )
+    def unpublish_selected(self, request, queryset):
+        return self._change_selected_state(
+            request, queryset, PUBLISHED, "unpublish", _("Unpublish selected pages")
+        )
+
+    unpublish_selected.queryset_fields = ("pk", "page_id", "language", "title")
+
+    def response_action(self, request, queryset):
+        """Run the selected action with a lean queryset.
+
+        The changelist queryset carries annotations and prefetches that
+        actions don't need, which adds up when all the items across pages
+        are selected. Actions get a queryset of the same rows that only loads
+        the fields listed in their ``queryset_fields`` attribute, or the
+        primary key by default.
+        """
+        action = self.get_actions(request).get(request.POST.get("action"))
+        fields = getattr(action[0], "queryset_fields", ("pk",)) if action else ("pk",)
+        lean_queryset = (
+            self.model._base_manager.filter(pk__in=queryset.values("pk"))
+            .only(*fields)
+            .order_by("pk")
+        )
+        return super().response_action(request, lean_queryset)
+
+    def _change_selected_state(self, request, queryset, state, operation, title):
+        """Move the versions of the selected page contents out of ``state``
+        by calling ``operation`` on each of them.
+
+        The contents are processed in chunks of BULK_ACTION_CHUNK_SIZE: the
+        eligibility and locks of a chunk are checked at once and its state
+        changes are applied in one transaction. Renders a summary of the
+        versions that were skipped.
+        """
+        changed, skipped = 0, []
+        chunk_size = conf.BULK_ACTION_CHUNK_SIZE
+        contents = queryset.iterator(chunk_size=chunk_size)
+        for chunk in iter(lambda: list(islice(contents, chunk_size)), []):
+            chunk_changed, chunk_skipped = self._change_chunk_state(
+                request, chunk, state, operation
+            )
+            changed += chunk_changed
+            skipped += chunk_skipped
+
+        if changed:
+            self.message_user(
+                request,
+                ngettext(
+                    "%(count)d page was changed.",
+                    "%(count)d pages were changed.",
+                    changed,
+                ) % {"count": changed},
+            )
+        if not skipped:
+            return None
+
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        context = dict(
+            self.admin_site.each_context(request),
+            title=title,
+            opts=self.model._meta,
+            changed=changed,
+            skipped=skipped,
+            back_url=reverse("admin:{}_{}_changelist".format(*info)),
+        )
+        return render(
+            request, "djangocms_pageadmin/admin/bulk_action_summary.html", context
+        )
+
+    @transaction.atomic
+    def _change_chunk_state(self, request, chunk, state, operation):
+        """Call ``operation`` on the versions of the page contents in
+        ``chunk`` that are in ``state``, not locked by another user and
+        that pass the ``check_<operation>`` conditions of versioning, which
+        other apps like moderation add to.
+
+        :returns: the number of changed versions and a list of (title, reason)
+            tuples for the skipped ones
+        """
+        contents = {content.pk: content for content in chunk}
+        versions = (
+            Version.objects.filter(
+                content_type=ContentType.objects.get_for_model(self.model),
+                object_id__in=list(contents),
+            )
+            .select_related("versionlock")
+            .prefetch_related("content__page")
+            .order_by("pk")
+        )
+        if operation == "unpublish":
+            # A lock on the draft of a page dictates the unpublish permission
+            # on its published version
+            locked = self._get_locked_drafts(
+                request, {content.page_id for content in chunk}
+            )
+        else:
+            locked = set()
+
+        changed, skipped = 0, []
+        for version in versions:
+            content = contents[version.object_id]
+            lock = getattr(version, "versionlock", None)
+            if version.state != state:
+                skipped.append((content.title, _("Version is not in %(state)s state") % {
+                    "state": dict(VERSION_STATES)[state].lower()
+                }))
+                continue
+            if (content.page_id, content.language) in locked or (
+                lock and lock.created_by_id != request.user.pk
+            ):
+                skipped.append((content.title, _("Version is locked by another user")))
+                continue
+            try:
+                getattr(version, "check_" + operation)(request.user)
+            except ConditionFailed as error:
+                skipped.append((content.title, str(error)))
+                continue
+            if not getattr(version, "can_be_{}ed".format(operation))():
+                skipped.append((content.title, _("Version can't be %(operation)sed") % {
+                    "operation": operation
+                }))
+                continue
+            try:
+                with transaction.atomic():
+                    getattr(version, operation)(request.user)
+            except TransitionNotAllowed as error:
+                skipped.append((content.title, str(error)))
+            else:
+                changed += 1
+        return changed, skipped
+
+    def _get_locked_drafts(self, request, page_ids):
+        """(page id, language) pairs of the pages in ``page_ids`` with a draft
+        locked by another user than the one of the request.
+        """
+        return set(
+            self.model._base_manager.filter(
+                page_id__in=page_ids,
+                versions__state=DRAFT,
+                versions__versionlock__isnull=False,
+            )
+            .exclude(versions__versionlock__created_by=request.user)
+            .values_list("page_id", "language")
+        )
+
     def get_search_results(self, request, queryset, search_term):
         """
         Override the ModelAdmin method for fetching search results to filter for urls associated with the pagecontent
@@ -173,15 +498,18 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         description=_("url")
     )
     def url(self, obj, csv=False):
-        path = obj._path
+        url = self._get_page_url(obj.language, obj._path, obj.page.is_home)
+        if url is not None and csv is False:
+            return format_html('<a class="js-page-admin-close-sideframe" href="{url}">{url}</a>', url=url)
+        return url
+
+    def _get_page_url(self, language, path, is_home):
         url = None
-        with override(obj.language):
-            if obj.page.is_home:
+        with override(language):
+            if is_home:
                 url = reverse("pages-root")
             if path:
                 url = reverse("pages-details-by-slug", kwargs={"slug": path})
-        if url is not None and csv is False:
-            return format_html('<a class="js-page-admin-close-sideframe" href="{url}">{url}</a>', url=url)
         return url
 
     @admin.display(
@@ -203,6 +531,19 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         version = self.get_version(obj)
         return version.created_by
 
+    @admin.display(
+        description=_("moderation")
+    )
+    def moderation(self, obj):
+        version = self.get_version(obj)
+        moderation_requests = getattr(version, "_active_moderation_requests", None)
+        if not moderation_requests:
+            return ""
+        collection = moderation_requests[0].collection
+        return "{name} ({status})".format(
+            name=collection.name, status=collection.get_status_display()
+        )
+
     def is_locked(self, obj):
         version = self.get_version(obj)
         if version.state == DRAFT and version_is_locked(version):
@@ -369,9 +710,176 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
             request.GET = request.GET.copy()
             del (request.GET['page_id'])
 
-        return admin.ModelAdmin.changelist_view(self, request, extra_context)
+        extra_context = {
+            "export_formats": [
+                exporter for exporter in self.export_formats if exporter.name != "csv"
+            ],
+            "export_job_formats": self.export_formats,
+            **(extra_context or {}),
+        }
+        view = "search" if request.GET.get(SEARCH_VAR) else "changelist"
+        # Actions write, they aren't cut short
+        timeout = conf.STATEMENT_TIMEOUTS.get(view) if request.method in ("GET", "HEAD") else None
+        slot = ConcurrencySlot("search", request).acquire() if view == "search" else None
+        try:
+            with statement_timeout(timeout, using=get_request_context(request).database, label=view):
+                # Waits for a search slot like the changelist queries
+                self._notify_export_jobs(request)
+                response = admin.ModelAdmin.changelist_view(self, request, extra_context)
+                # The results are only queried while rendering
+                if hasattr(response, "render"):
+                    response.render()
+        except StatementTimeout:
+            return self._timeout_response(request)
+        finally:
+            if slot is not None:
+                slot.release()
+        return response
+
+    def _notify_export_jobs(self, request):
+        """Tells the user about their background exports that finished
+        since they last saw the changelist.
+        """
+        jobs = list(ExportJob.objects.finished().filter(user=request.user, notified=False))
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        for job in jobs:
+            if job.status == ExportJob.DONE:
+                self.message_user(request, format_html(
+                    _('Your export of {rows} pages is ready: <a href="{url}">download</a>'),
+                    rows=job.rows,
+                    url=reverse("admin:{}_{}_export_job_download".format(*info), args=(job.pk,)),
+                ), messages.SUCCESS)
+            else:
+                self.message_user(request, _("Your export failed, please try again."), messages.ERROR)
+        if jobs:
+            ExportJob.objects.filter(pk__in=[job.pk for job in jobs]).update(notified=True)
+
+    def _get_etag(self, request):
+        """ETag of the changelist and the export for the user of ``request``,
+        from the versions of the current site and its changelist generation.
+        """
+        if not hasattr(request, "_pageadmin_etag"):
+            context = get_request_context(request)
+            site = context.site
+            aggregate = self.model._base_manager.using(context.database).filter(
+                page__node__site=site
+            ).aggregate(
+                last_modified=Max("versions__modified"),
+                count=Count("pk", distinct=True),
+            )
+            key = (
+                aggregate["last_modified"],
+                aggregate["count"],
+                get_changelist_generation(site.pk),
+                request.user.pk,
+                # The rendered forms carry the CSRF token, which rotates on
+                # login along with the session key
+                request.session.session_key,
+                get_language(),
+                request.get_full_path(),
+            )
+            request._pageadmin_etag = hashlib.md5(repr(key).encode()).hexdigest()
+        return request._pageadmin_etag
+
+    def _conditional_view(self, view):
+        """Wraps ``view`` to answer conditional GET requests with a 304
+        when the versions of the site haven't changed.
+        """
+        def get_etag(request, *args, **kwargs):
+            return self._get_etag(request)
+
+        # No Last-Modified: the latest version doesn't change with titles,
+        # urls, locks or deletions, which only bump the generation
+        conditional_view = condition(etag_func=get_etag)(view)
+
+        def inner(request, *args, **kwargs):
+            # Pending messages are only shown by a fresh response
+            if request.method not in ("GET", "HEAD") or len(messages.get_messages(request)):
+                return view(request, *args, **kwargs)
+            response = conditional_view(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            if len(messages.get_messages(request)) or response.status_code >= 400:
+                # Messages added by the view are only shown once and errors
+                # aren't revalidated
+                if response.has_header("ETag"):
+                    del response["ETag"]
+            etag = response.get("ETag")
+            if etag and response.has_header("Content-Encoding") and not etag.startswith("W/"):
+                # Like GZipMiddleware, the compressed representation only
+                # gets a weak ETag
+                response["ETag"] = "W/" + etag
+            return response
+        return inner
+
+    def _pinning_view(self, view):
+        """Wraps ``view`` to keep the reads of the user on the default
+        database for a while after they made changes through it.
+        """
+        def inner(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if request.method not in ("GET", "HEAD"):
+                pin_to_primary(request)
+            return response
+        return inner
+
+    def _routed_view(self, view):
+        """Wraps the read-only ``view`` to run its GET requests against the
+        READ_DATABASE. Its other requests, like the changelist actions, run
+        against the default database and pin the user to it.
+        """
+        view = self._pinning_view(view)
+
+        def inner(request, *args, **kwargs):
+            if request.method in ("GET", "HEAD"):
+                use_read_database(request)
+            return view(request, *args, **kwargs)
+        return inner
+
+    def _limited_view(self, view):
+        """Wraps ``view`` to answer with a busy page when one of its heavy
+        operations is refused by the concurrency limiter.
+        """
+        def inner(request, *args, **kwargs):
+            try:
+                return view(request, *args, **kwargs)
+            except ConcurrencyLimitReached as error:
+                return self._busy_response(request, error)
+        return inner
+
+    def _busy_response(self, request, error):
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        context = dict(
+            self.admin_site.each_context(request),
+            title=_("Busy"),
+            opts=self.model._meta,
+            operation=error.operation,
+            retry_after=RETRY_AFTER,
+            retry_url=request.get_full_path() if request.method == "GET" else None,
+            back_url=reverse("admin:{}_{}_changelist".format(*info)),
+        )
+        response = render(request, "djangocms_pageadmin/admin/busy.html", context, status=429)
+        response["Retry-After"] = RETRY_AFTER
+        add_never_cache_headers(response)
+        return response
+
+    def _timeout_response(self, request):
+        """A page asking the user to narrow down the changelist that took
+        too long, with its search term and filters.
+        """
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        changelist_url = reverse("admin:{}_{}_changelist".format(*info))
+        context = dict(
+            self.admin_site.each_context(request),
+            title=_("Refine your search"),
+            opts=self.model._meta,
+            search_term=request.GET.get(SEARCH_VAR, ""),
+            changelist_url=changelist_url,
+            has_filters=any(key not in (SEARCH_VAR, PAGE_VAR, ORDER_VAR) for key in request.GET),
+        )
+        response = render(request, "djangocms_pageadmin/admin/refine_search.html", context, status=503)
+        add_never_cache_headers(response)
+        return response
 
-    @transaction.atomic
     def duplicate_view(self, request, object_id):
         """Duplicate a specified PageContent.
 
@@ -386,71 +894,167 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
                 request, self.model._meta, object_id
             )
 
-        form = DuplicateForm(
-            user=request.user,
-            page_content=obj,
-            initial={
-                "site": obj.page.node.site,
-                "slug": obj.page.get_slug(obj.language),
-            },
-        )
+        estimate = self._get_duplicate_estimate(obj)
         info = (self.model._meta.app_label, self.model._meta.model_name)
         if request.method == "POST":
             form = DuplicateForm(request.POST, user=request.user, page_content=obj)
             if form.is_valid():
-                new_page = obj.page.copy(
-                    site=form.cleaned_data["site"],
-                    parent_node=obj.page.node.parent,
-                    translations=False,
-                    permissions=False,
-                    extensions=False,
-                )
-
-                new_page_content = api.create_title(
-                    page=new_page,
-                    language=obj.language,
-                    slug=form.cleaned_data["slug"],
-                    path=form.cleaned_data["path"],
-                    title=obj.title,
-                    template=obj.template,
-                    created_by=request.user,
-                )
-                new_page.title_cache[obj.language] = new_page_content
-
-                extension_pool.copy_extensions(
-                    source_page=obj.page, target_page=new_page, languages=[obj.language]
-                )
-
-                placeholders = obj.get_placeholders()
-                for source_placeholder in placeholders:
-                    # Keep all placeholders even if they are not in the template anymore to ensure the data is kept,
-                    # keeping only placeholders from rescanning the template would not keep any legacy content
-                    # which could in theory be remapped repaired at a later date
-                    target_placeholder, created = new_page_content.placeholders.get_or_create(
-                        slot=source_placeholder.slot
-                    )
-                    source_placeholder.copy_plugins(
-                        target_placeholder, language=obj.language
-                    )
+                slot = ConcurrencySlot("duplicate", request).acquire()
+                try:
+                    started = time.monotonic()
+                    if estimate["batched"]:
+                        self._duplicate_in_batches(obj, form, request.user)
+                    else:
+                        with transaction.atomic():
+                            new_page_content = self._create_duplicate_page(obj, form, request.user)
+                            self._copy_duplicate_content(obj, new_page_content)
+                    record_duplicate_throughput(estimate["items"], time.monotonic() - started)
+                finally:
+                    slot.release()
 
                 self.message_user(request, _("Page has been duplicated"))
                 return redirect(reverse("admin:{}_{}_changelist".format(*info)))
+        else:
+            form = DuplicateForm(user=request.user, page_content=obj)
+            form.initial = {
+                "site": obj.page.node.site,
+                "slug": form.get_unique_slug(obj.page.node.site),
+            }
 
         context = dict(
             obj=obj,
             form=form,
+            estimate=estimate,
             object_id=object_id,
             duplicate_url=reverse(
                 "admin:{}_{}_duplicate".format(*info), args=(obj.pk,)
             ),
+            check_slug_url=reverse(
+                "admin:{}_{}_duplicate_check_slug".format(*info), args=(obj.pk,)
+            ),
             back_url=reverse("admin:{}_{}_changelist".format(*info)),
         )
         return render(
             request, "djangocms_pageadmin/admin/duplicate_confirmation.html", context
         )
 
-    @require_POST
+    def _get_duplicate_estimate(self, obj):
+        """Estimate the cost of duplicating ``obj`` and decide whether it
+        should be copied in batches.
+        """
+        estimate = get_duplicate_estimate(obj)
+        estimate["items"] = sum(estimate.values())
+        estimate["expected_duration"] = get_expected_duplicate_duration(estimate["items"])
+        estimate["batched"] = estimate["plugins"] > conf.DUPLICATE_BATCH_THRESHOLD
+        return estimate
+
+    def _duplicate_in_batches(self, obj, form, user):
+        """Duplicate ``obj``, a page too large to be copied in a single
+        transaction.
+
+        The new page is committed on its own so that the locks on the tree
+        nodes are released before the content is copied, and is recorded as
+        a PendingDuplicate until the copy completes. A copy that fails here
+        removes the page, the pageadmin_cleanup_duplicates command removes
+        the pages of copies that never completed.
+        """
+        new_page_content = self._create_duplicate_page(obj, form, user, pending=True)
+        try:
+            self._copy_duplicate_content(obj, new_page_content, batched=True)
+        except Exception:
+            # Don't leave a half copied page behind
+            with transaction.atomic():
+                new_page_content.page.delete()
+            raise
+        PendingDuplicate.objects.filter(page=new_page_content.page).delete()
+
     @transaction.atomic
+    def _create_duplicate_page(self, obj, form, user, pending=False):
+        """Insert the page for a duplicate of ``obj`` into the tree, recorded
+        as a PendingDuplicate when ``pending`` is set.
+
+        The new page only has a draft version and stays invisible until it
+        is published.
+        """
+        new_page = obj.page.copy(
+            site=form.cleaned_data["site"],
+            parent_node=obj.page.node.parent,
+            translations=False,
+            permissions=False,
+            extensions=False,
+        )
+
+        new_page_content = api.create_title(
+            page=new_page,
+            language=obj.language,
+            slug=form.cleaned_data["slug"],
+            path=form.cleaned_data["path"],
+            title=obj.title,
+            template=obj.template,
+            created_by=user,
+        )
+        new_page.title_cache[obj.language] = new_page_content
+        if pending:
+            PendingDuplicate.objects.create(page=new_page)
+        return new_page_content
+
+    def _copy_duplicate_content(self, obj, new_page_content, batched=False):
+        """Copy the extensions, placeholders and plugins of ``obj`` to the
+        freshly created ``new_page_content`` in a transaction of its own.
+        """
+        with nullcontext() if batched else transaction.atomic():
+            extension_pool.copy_extensions(
+                source_page=obj.page, target_page=new_page_content.page, languages=[obj.language]
+            )
+            self._copy_placeholders(obj, new_page_content, batched=batched)
+
+    def _copy_placeholders(self, source_content, target_content, batched=False):
+        """Copy the placeholders and plugins of ``source_content`` in its
+        language to ``target_content``.
+
+        Large pages are copied in batches, one transaction per placeholder,
+        so that no single transaction has to hold every plugin row.
+        """
+        for source_placeholder in source_content.get_placeholders():
+            # Keep all placeholders even if they are not in the template anymore to ensure the data is kept,
+            # keeping only placeholders from rescanning the template would not keep any legacy content
+            # which could in theory be remapped repaired at a later date
+            with transaction.atomic() if batched else nullcontext():
+                target_placeholder, created = target_content.placeholders.get_or_create(
+                    slot=source_placeholder.slot
+                )
+                source_placeholder.copy_plugins(
+                    target_placeholder, language=source_content.language
+                )
+
+    def duplicate_check_slug_view(self, request, object_id):
+        """Report whether a slug is free for a duplicate of the specified
+        PageContent, together with a unique suggestion.
+
+        Used to check the slug of the duplicate form while the editor types.
+
+        :param request: Http request with ``slug`` and ``site`` GET parameters
+        :param object_id: PageContent ID (as a string)
+        """
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise self._get_404_exception(object_id)
+
+        try:
+            site = Site.objects.get(pk=request.GET.get("site"))
+        except (Site.DoesNotExist, ValueError, TypeError):
+            return HttpResponseBadRequest(force_str(_("Invalid site.")))
+
+        form = DuplicateForm(user=request.user, page_content=obj)
+        slug = slugify(request.GET.get("slug", ""))
+        suggestion = form.get_unique_slug(site, slug=slug)
+        return JsonResponse({
+            "slug": slug,
+            "available": bool(slug) and slug == suggestion,
+            "suggestion": suggestion,
+        })
+
+    @require_POST
     def set_home_view(self, request, object_id):
         page_content = self.get_object(request, object_id=unquote(object_id))
 
@@ -461,52 +1065,143 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         if not page.has_change_permission(request.user):
             raise PermissionDenied("You do not have permission to set 'home'.")
 
-        if not page.is_potential_home():
-            return HttpResponseBadRequest(
-                force_str(_("The page is not eligible to be home."))
-            )
+        if not page.is_home:
+            if not page.is_potential_home():
+                return HttpResponseBadRequest(
+                    force_str(_("The page is not eligible to be home."))
+                )
+            self._set_as_homepage(page, request.user)
 
-        new_home_tree, old_home_tree = page.set_as_homepage(request.user)
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        return HttpResponseRedirect(reverse("admin:{}_{}_changelist".format(*info)))
 
-        # Check if one of the affected pages either from the old homepage
-        # or the homepage had an apphook attached
-        if old_home_tree:
-            apphooks_affected = old_home_tree.has_apphooks()
-        else:
-            apphooks_affected = False
+    @transaction.atomic
+    def _set_as_homepage(self, page, user):
+        """Make ``page`` the home page of its site.
 
-        if not apphooks_affected:
-            apphooks_affected = new_home_tree.has_apphooks()
+        Only the rows of the current and the new home page are locked, always
+        in the same order, so that concurrent requests queue up behind each
+        other instead of deadlocking.
+        """
+        locked_pages = (
+            Page.objects.select_for_update(of=("self",))
+            .select_related("node")
+            .filter(Q(pk=page.pk) | Q(is_home=True, node__site=page.node.site_id))
+            .order_by("pk")
+        )
+        if any(locked.pk == page.pk and locked.is_home for locked in locked_pages):
+            # Another request made the page home while waiting for the lock
+            return
+
+        # The pages affected by this operation are the trees of the old and
+        # the new home page
+        nodes = Q(node__in=TreeNode.get_tree(page.node))
+        for old_home in locked_pages:
+            if old_home.pk != page.pk:
+                nodes |= Q(node__in=TreeNode.get_tree(old_home.node))
+        home_trees = Page.objects.filter(nodes)
+
+        apphook_urls = self._get_apphook_urls(home_trees)
+        page.set_as_homepage(user)
+        # The home flags change with queryset updates, which send no signals
+        transaction.on_commit(partial(bump_changelist_generation, [page.node.site_id]))
+        if conf.LISTING_ENABLED:
+            # The cms changes the home flag and the paths of the trees with
+            # queryset updates, which send no signals
+            PageContentListing.objects.refresh(
+                self.model._base_manager.filter(page__in=home_trees)
+            )
 
-        if apphooks_affected:
-            # One or more pages affected by this operation was attached to an apphook.
+        if apphook_urls != self._get_apphook_urls(home_trees):
+            # The url of one or more pages attached to an apphook changed.
             # As a result, fire the apphook reload signal to reload the url patterns.
             set_restart_trigger()
 
-        info = (self.model._meta.app_label, self.model._meta.model_name)
-        return HttpResponseRedirect(reverse("admin:{}_{}_changelist".format(*info)))
+    def _get_apphook_urls(self, pages):
+        """Paths of the pages in ``pages`` that have an apphook attached, keyed
+        by page id and language.
+        """
+        apphooked_pages = pages.exclude(application_urls=None).exclude(application_urls="")
+        return {
+            (page_id, language): path
+            for page_id, language, path in PageUrl.objects.filter(
+                page__in=apphooked_pages
+            ).values_list("page_id", "language", "path")
+        }
 
     def get_urls(self):
         info = self.model._meta.app_label, self.model._meta.model_name
         # we replace the duplicate with our function.
-        old_urls = [v for v in super().get_urls() if 'duplicate' not in str(v.name)]
+        old_urls = [
+            v for v in super().get_urls()
+            if 'duplicate' not in str(v.name) and v.name != "{}_{}_changelist".format(*info)
+        ]
         new_urls = [
             re_path(
                 r"^(.+)/duplicate-content/$",
-                self.admin_site.admin_view(self.duplicate_view),
+                self.admin_site.admin_view(self._limited_view(self._pinning_view(self.duplicate_view))),
                 name="{}_{}_duplicate".format(*info),
             ),
+            re_path(
+                r"^(.+)/duplicate-content/check-slug/$",
+                self.admin_site.admin_view(self.duplicate_check_slug_view),
+                name="{}_{}_duplicate_check_slug".format(*info),
+            ),
             re_path(
                 r"^(.+)/set-home-content/$",
-                self.admin_site.admin_view(self.set_home_view),
+                self.admin_site.admin_view(self._pinning_view(self.set_home_view)),
                 name="{}_{}_set_home_content".format(*info),
             ),
             path(
                 'export_csv/',
-                self.admin_site.admin_view(self.export_to_csv),
+                self.admin_site.admin_view(
+                    self._limited_view(self._routed_view(self._conditional_view(self.export_to_csv))),
+                    cacheable=True,
+                ),
                 name="{}_{}_export_csv".format(*info),
             ),
+            path(
+                "export/<str:export_format>/",
+                self.admin_site.admin_view(
+                    self._limited_view(self._routed_view(self._conditional_view(self.export_view))),
+                    cacheable=True,
+                ),
+                name="{}_{}_export".format(*info),
+            ),
+            path(
+                "export/background/",
+                self.admin_site.admin_view(self.export_job_view),
+                name="{}_{}_export_job".format(*info),
+            ),
+            path(
+                "export/background/<int:job_id>/",
+                self.admin_site.admin_view(self.export_job_download_view),
+                name="{}_{}_export_job_download".format(*info),
+            ),
+            path(
+                "api/pages/",
+                self.admin_site.admin_view(self._routed_view(self.api_view)),
+                name="{}_{}_api".format(*info),
+            ),
+            path(
+                "",
+                self.admin_site.admin_view(
+                    self._limited_view(self._routed_view(self._conditional_view(self.changelist_view))),
+                    cacheable=True,
+                ),
+                name="{}_{}_changelist".format(*info),
+            ),
         ]
+        if is_moderation_enabled():
+            from .moderation import CollectionItemsBulkView
+
+            new_urls.append(
+                path(
+                    "add-to-collection/",
+                    self.admin_site.admin_view(CollectionItemsBulkView.as_view(model_admin=self)),
+                    name="{}_{}_add_to_collection".format(*info),
+                )
+            )
         return new_urls + old_urls
 
     def _format_export_datetime(self, date):
@@ -524,25 +1219,280 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
         """
         Retrieves the queryset and exports to csv format
         """
-        queryset = self.get_exported_queryset(request)
-        meta = self.model._meta
-        field_names = ['Title', 'Expiry Date', 'Version State', 'Version Author', 'Url',
-                       'Compliance Number']
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename={}.csv'.format(meta)
-        writer = csv.writer(response)
-        writer.writerow(field_names)
-        for obj in queryset:
-            title = obj.title
-            expiry_date = self._format_export_datetime(self.get_expiry_date(obj))
-            version_state = self.state(obj)
-            version_author = self.author(obj)
-            url = self.url(obj, True)
-            compliance_number = self.get_compliance_number(obj)
-            writer.writerow([title, expiry_date, version_state, version_author, url, compliance_number])
+        return self.export_view(request, CSVExporter.name)
 
+    def export_view(self, request, export_format):
+        """
+        Streams the export of the filtered queryset in ``export_format``,
+        the name of one of the ``export_formats``.
+        """
+        exporters = {exporter.name: exporter for exporter in self.export_formats}
+        # "csv.gz" is a gzip compressed download of the csv export
+        export_format, _dot, suffix = export_format.partition(".")
+        exporter_class = exporters.get(export_format)
+        if exporter_class is None or suffix not in ("", "gz") or (
+            suffix and not exporter_class.compressible
+        ):
+            raise Http404
+        exporter = exporter_class(self.export_columns)
+        queryset = self.get_exported_queryset(request)
+        stream = exporter.stream(self.get_export_rows(queryset))
+        filename = "{}.{}".format(self.model._meta, exporter.extension)
+        content_type = exporter.content_type
+        content_encoding = None
+        if suffix:
+            stream = gzip_stream(stream, conf.EXPORT_GZIP_LEVEL)
+            filename += ".gz"
+            content_type = "application/gzip"
+        elif exporter.compressible and accepts_gzip(request):
+            stream = gzip_stream(stream, conf.EXPORT_GZIP_LEVEL)
+            content_encoding = "gzip"
+
+        slot = ConcurrencySlot("export", request).acquire()
+        # The export runs while the response is streamed
+        response = StreamingHttpResponse(ReleasingStream(stream, slot), content_type=content_type)
+        response['Content-Disposition'] = 'attachment; filename={}'.format(filename)
+        if content_encoding:
+            response["Content-Encoding"] = content_encoding
+        if exporter.compressible:
+            patch_vary_headers(response, ("Accept-Encoding",))
         return response
 
+    @require_POST
+    def export_job_view(self, request):
+        """
+        Queues a background export of the changelist with the filters of
+        the query string, unless the user already has EXPORT_JOB_LIMIT
+        exports waiting or running.
+        """
+        info = (self.model._meta.app_label, self.model._meta.model_name)
+        export_format = request.POST.get("export_format", CSVExporter.name)
+        if export_format not in {exporter.name for exporter in self.export_formats}:
+            return HttpResponseBadRequest(_("Unknown export format"))
+
+        with transaction.atomic():
+            # Serialises the jobs requested by the user
+            get_user_model()._base_manager.select_for_update().filter(pk=request.user.pk).exists()
+            if ExportJob.objects.active().filter(user=request.user).count() >= conf.EXPORT_JOB_LIMIT:
+                self.message_user(
+                    request,
+                    _("You already have exports in progress, please wait for them to finish."),
+                    messages.WARNING,
+                )
+            else:
+                context = get_request_context(request)
+                params = {key: value for key, value in request.GET.items() if key != PAGE_VAR}
+                # The language the changelist shows without the filter, the
+                # worker would fall back to the default language of the site
+                params.setdefault("language", context.language)
+                ExportJob.objects.create(
+                    user=request.user,
+                    site=context.site,
+                    export_format=export_format,
+                    params=params,
+                )
+                self.message_user(
+                    request, _("Your export was queued. You will be notified here when it is ready.")
+                )
+        changelist_url = reverse("admin:{}_{}_changelist".format(*info))
+        if request.GET:
+            changelist_url += "?" + request.GET.urlencode()
+        return redirect(changelist_url)
+
+    def export_job_download_view(self, request, job_id):
+        job = get_object_or_404(
+            ExportJob, pk=job_id, user=request.user, status=ExportJob.DONE
+        )
+        try:
+            export = job.file.open("rb")
+        except FileNotFoundError:
+            # Deleted from the storage
+            raise Http404(_("The file of this export no longer exists."))
+        return FileResponse(
+            export, as_attachment=True, filename=os.path.basename(job.file.name)
+        )
+
+    def get_export_rows(self, queryset):
+        """
+        Rows of the export of ``queryset`` as lists of the values of the
+        ``export_columns``.
+        """
+        for row in self.get_export_values(queryset):
+            yield [
+                row[name] if name in row else getattr(self, name)(row)
+                for name, _header in self.export_columns
+            ]
+
+    def get_export_values(self, queryset):
+        """
+        Dicts of the built-in export columns of ``queryset``, read from the
+        page listing table or built from values rows when either is enabled.
+        """
+        if conf.LISTING_ENABLED:
+            return self._get_listing_export_rows(queryset)
+        if conf.EXPORT_VALUES_ROWS:
+            return self._get_values_export_rows(queryset)
+        return self._get_instance_export_rows(queryset)
+
+    def _get_instance_export_rows(self, queryset):
+        # Prefetching is only supported by iterator() from Django 4.1
+        objects = queryset.iterator(chunk_size=2000) if DJANGO_4_2 else queryset
+        for obj in objects:
+            yield {
+                "pk": obj.pk,
+                "language": obj.language,
+                "title": obj.title,
+                "expires": self._format_export_datetime(self.get_expiry_date(obj)),
+                "state": self.state(obj),
+                "author": self.author(obj),
+                "url": self.url(obj, True),
+                "compliance_number": self.get_compliance_number(obj),
+            }
+
+    def _get_values_export_rows(self, queryset):
+        states = dict(VERSION_STATES)
+        for row in PageContentRow.from_queryset(queryset):
+            yield {
+                "pk": row.pk,
+                "language": row.language,
+                "title": row.title,
+                "expires": self._format_export_datetime(row.expires),
+                "state": states.get(row.state, row.state),
+                "author": row.author,
+                "url": self._get_page_url(row.language, row.path, row.is_home),
+                "compliance_number": row.compliance_number or "",
+            }
+
+    def _get_listing_export_rows(self, queryset):
+        states = dict(VERSION_STATES)
+        listings = (
+            PageContentListing.objects.using(queryset.db)
+            .filter(page_content__in=queryset.values("pk"))
+            .select_related("author")
+            .order_by(*self._get_listing_ordering(queryset.query.order_by))
+        )
+        for listing in listings.iterator(chunk_size=2000):
+            yield {
+                "pk": listing.page_content_id,
+                "language": listing.language,
+                "title": listing.title,
+                "expires": self._format_export_datetime(listing.expires),
+                "state": states.get(listing.state, listing.state),
+                "author": listing.author,
+                "url": self._get_page_url(listing.language, listing.path, listing.is_home),
+                "compliance_number": listing.compliance_number,
+            }
+
+    def get_api_fields(self):
+        """
+        Fields of the JSON API mapped to the lookups of the page content
+        queryset they are built from.
+        """
+        username = get_user_model().USERNAME_FIELD
+        fields = {
+            "title": ("title",),
+            "url": ("language", "_path", "page__is_home"),
+            "state": ("versions__state",),
+            "author": ("versions__created_by__{}".format(username),),
+            "modified": ("versions__modified",),
+            "lock": ("versions__versionlock__created_by__{}".format(username),),
+            "expiry": (),
+        }
+        if apps.is_installed("djangocms_content_expiry"):
+            fields["expiry"] = ("versions__contentexpiry__expires",)
+        return fields
+
+    def api_view(self, request):
+        """
+        Pages of the changelist as JSON, with the filters and search of the
+        changelist parameters.
+
+        ``fields`` is a comma separated list of the fields of the pages,
+        ``limit`` the number of pages of the response and ``cursor`` the
+        ``next_cursor`` of the previous response. Pages are ordered by
+        primary key, newest first, so that any cursor is an index lookup
+        however deep it is.
+
+        Searches take a slot of the concurrency limiter, and the queries are
+        cut short after the STATEMENT_TIMEOUTS of the changelist.
+        """
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+        available = self.get_api_fields()
+        names = [name for name in request.GET.get("fields", "").split(",") if name] or list(available)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            return JsonResponse(
+                {"error": "Unknown fields: {}".format(", ".join(unknown))}, status=400
+            )
+        try:
+            limit = min(int(request.GET.get("limit", self.api_page_size)), self.api_max_page_size)
+            cursor = request.GET.get("cursor")
+            cursor = int(urlsafe_base64_decode(cursor)) if cursor else None
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return JsonResponse({"error": "Invalid limit or cursor"}, status=400)
+
+        queryset = self.get_exported_queryset(request).prefetch_related(None).order_by("-pk")
+        if cursor is not None:
+            queryset = queryset.filter(pk__lt=cursor)
+        lookups = sorted({"pk"}.union(*(available[name] for name in names)))
+        view = "search" if request.GET.get(SEARCH_VAR) else "changelist"
+        try:
+            slot = ConcurrencySlot("search", request).acquire() if view == "search" else None
+        except ConcurrencyLimitReached:
+            response = JsonResponse({"error": "Too many searches running, retry later"}, status=429)
+            response["Retry-After"] = RETRY_AFTER
+            return response
+        try:
+            with statement_timeout(
+                conf.STATEMENT_TIMEOUTS.get(view), using=get_request_context(request).database, label=view
+            ):
+                rows = list(queryset.values(*lookups)[:limit + 1])
+        except StatementTimeout:
+            return JsonResponse({"error": "The query took too long, narrow it down"}, status=503)
+        finally:
+            if slot is not None:
+                slot.release()
+
+        next_cursor = next_url = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = urlsafe_base64_encode(str(rows[-1]["pk"]).encode())
+            params = request.GET.copy()
+            params["cursor"] = next_cursor
+            next_url = "{}?{}".format(request.path, params.urlencode())
+        return JsonResponse({
+            "results": [
+                dict(id=row["pk"], **{
+                    name: self._get_api_value(row, available[name], name) for name in names
+                })
+                for row in rows
+            ],
+            "next_cursor": next_cursor,
+            "next": next_url,
+        })
+
+    def _get_api_value(self, row, lookups, name):
+        if name == "url":
+            return self._get_page_url(*(row[lookup] for lookup in lookups))
+        return row[lookups[0]] if lookups else None
+
+    def _get_listing_ordering(self, ordering):
+        """
+        The page content ``ordering`` of the export translated to the
+        columns of the page listing, through the page content for the
+        fields the listing doesn't have.
+        """
+        listing_ordering = []
+        for field in ordering:
+            prefix, field = ("-", field[1:]) if field.startswith("-") else ("", field)
+            listing_ordering.append(prefix + self.listing_ordering_fields.get(
+                field, "page_content__{}".format(field)
+            ))
+        return listing_ordering
+
     def get_expiry_date(self, obj):
         version = self.get_version(obj)
         if hasattr(version, "contentexpiry"):
@@ -558,34 +1508,82 @@ class PageContentAdmin(VersioningAdminMixin, DefaultPageContentAdmin):
     def get_exported_queryset(self, request):
         """
         Returns export queryset by respecting applied filters.
-        """
-        list_display = self.get_list_display(request)
-        list_display_links = self.get_list_display_links(request, list_display)
-        list_filter = self.get_list_filter(request)
-        search_fields = self.get_search_fields(request)
-        changelist = self.get_changelist(request)
-
-        changelist_kwargs = {
-            'request': request,
-            'model': self.model,
-            'list_display': list_display,
-            'list_display_links': list_display_links,
-            'list_filter': list_filter,
-            'date_hierarchy': self.date_hierarchy,
-            'search_fields': search_fields,
-            'list_select_related': self.list_select_related,
-            'list_per_page': self.list_per_page,
-            'list_max_show_all': self.list_max_show_all,
-            'list_editable': self.list_editable,
-            'model_admin': self,
-            'sortable_by': self.sortable_by
-        }
 
-        if DJANGO_4_2:
-            changelist_kwargs.update({'search_help_text': self.search_help_text})
-        cl = changelist(**changelist_kwargs)
+        Only the filters, search and ordering of the request are applied to
+        the listing queryset, without building a ChangeList which would
+        compute the choices of every filter and count the results.
+        """
+        queryset = self._filter_exported_queryset(request, self.get_listing_queryset(request))
+        queryset, may_have_duplicates = self.get_search_results(
+            request, queryset, request.GET.get(SEARCH_VAR, "")
+        )
+        if may_have_duplicates:
+            queryset = queryset.distinct()
+        return queryset.order_by(*self._get_export_ordering(request, queryset))
 
-        return cl.get_queryset(request)
+    def _filter_exported_queryset(self, request, queryset):
+        """
+        Applies the list filters of the changelist to ``queryset``. The
+        filters of this admin skip their lookups; the field names, the
+        (field, filter class) pairs and the other filters subclasses may
+        add are built the way the ChangeList does.
+        """
+        params = {
+            key: value for key, value in request.GET.items()
+            if key not in IGNORED_PARAMS and key != PAGE_VAR
+        }
+        for list_filter in self.get_list_filter(request):
+            if hasattr(list_filter, "filter_queryset"):
+                queryset = list_filter.filter_queryset(request, queryset)
+                continue
+            if callable(list_filter):
+                spec = list_filter(request, params, self.model, self)
+            else:
+                if isinstance(list_filter, (tuple, list)):
+                    field_path, filter_class = list_filter
+                else:
+                    field_path, filter_class = list_filter, FieldListFilter.create
+                field = get_fields_from_path(self.model, field_path)[-1]
+                spec = filter_class(field, request, params, self.model, self, field_path=field_path)
+            queryset = spec.queryset(request, queryset) or queryset
+        return queryset
+
+    def _get_export_ordering(self, request, queryset):
+        """
+        The ordering the changelist applies for the ``o`` parameter of
+        ``request``, made deterministic with the primary key like the
+        ChangeList does.
+        """
+        ordering = list(self.get_ordering(request) or ())
+        if ORDER_VAR in request.GET:
+            # The indexes of the changelist count its action checkbox
+            columns = self._get_columns(request)
+            if self.get_actions(request):
+                columns = ["action_checkbox", *columns]
+            ordering = []
+            for param in request.GET[ORDER_VAR].split("."):
+                _none, prefix, index = param.rpartition("-")
+                try:
+                    order_field = self._get_column_ordering(columns[int(index)])
+                except (IndexError, ValueError):
+                    continue
+                if not order_field:
+                    continue
+                if order_field.startswith("-") and prefix == "-":
+                    ordering.append(order_field[1:])
+                else:
+                    ordering.append(prefix + order_field)
+        ordering.extend(queryset.query.order_by)
+        if not {"pk", "-pk"} & set(ordering):
+            ordering.append("-pk")
+        return ordering
+
+    def _get_column_ordering(self, name):
+        try:
+            return self.model._meta.get_field(name).name
+        except FieldDoesNotExist:
+            attr = getattr(self, name, None) or getattr(self.model, name, None)
+            return getattr(attr, "admin_order_field", None)
 
     class Media:
         css = {"all": ("djangocms_pageadmin/css/actions.css",)}
@@ -4,7 +4,17 @@ from django.utils.translation import gettext_lazy as _
 
 class PageAdminConfig(AppConfig):
     name = "djangocms_pageadmin"
+    default_auto_field = "django.db.models.AutoField"
     verbose_name = _("django CMS Pages")
 
     def ready(self):
         import djangocms_pageadmin.monkeypatch  # noqa: F401
+
+        from . import conf
+        if conf.LISTING_ENABLED:
+            from .handlers import connect_listing_handlers
+            connect_listing_handlers()
+        # The generation is part of the ETags of the changelist and the
+        # export even without the changelist cache
+        from .handlers import connect_changelist_cache_handlers
+        connect_changelist_cache_handlers()
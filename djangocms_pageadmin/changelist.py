@@ -0,0 +1,85 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import get_language
+
+from . import conf
+from .helpers import get_changelist_generation, get_request_context
+
+
+CHANGELIST_CACHE_KEY = "djangocms_pageadmin:changelist:{site_id}:{generation}:{digest}"
+
+
+class ListingChangeListMixin:
+    """
+    Lists the rows of the listing queryset of the model admin, which only
+    loads the columns the changelist and the export read.
+    """
+
+    def get_queryset(self, request, *args, **kwargs):
+        self.root_queryset = self.model_admin.get_listing_queryset(request)
+        return super().get_queryset(request, *args, **kwargs)
+
+
+class CachedChangeListMixin:
+    """
+    Caches the ids and counts of a changelist page.
+
+    The entries are keyed on the site, the database the request reads
+    from, the language and the query string, which holds the filters,
+    search, ordering and page, and on the
+    generation of the site bumped by the changelist cache handlers. The
+    rows themselves are loaded by primary key on every request, so the
+    columns depending on the user are always rendered for them.
+
+    The row values aren't cached: the action links of every row, which
+    depend on the user, read the same version, page and lock as the other
+    columns, so the instances are loaded anyway. Loading a page of rows by
+    primary key is cheap next to the filtered count and sorted query the
+    cache saves.
+    """
+
+    def get_cache_key(self, request):
+        context = get_request_context(request)
+        site_id = context.site.pk
+        params = sorted(
+            (key, value) for key, values in request.GET.lists() for value in values
+        )
+        # Users pinned to the default database don't get the lagging results
+        # of the read database
+        database = context.database or DEFAULT_DB_ALIAS
+        digest = hashlib.md5(repr((database, get_language(), params)).encode()).hexdigest()
+        return CHANGELIST_CACHE_KEY.format(
+            site_id=site_id,
+            generation=get_changelist_generation(site_id),
+            digest=digest,
+        )
+
+    def get_results(self, request):
+        key = self.get_cache_key(request)
+        cached = cache.get(key)
+        if cached is None:
+            super().get_results(request)
+            cache.set(key, {
+                "ids": [obj.pk for obj in self.result_list],
+                "result_count": self.result_count,
+                "full_result_count": self.full_result_count,
+            }, conf.CHANGELIST_CACHE_TIMEOUT)
+            return
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        # Paginator.count is a cached property
+        paginator.count = cached["result_count"]
+        objects = self.queryset.filter(pk__in=cached["ids"]).order_by().in_bulk()
+
+        self.result_count = cached["result_count"]
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.full_result_count = cached["full_result_count"]
+        self.show_admin_actions = not self.show_full_result_count or bool(
+            self.full_result_count
+        )
+        self.result_list = [objects[pk] for pk in cached["ids"] if pk in objects]
+        self.can_show_all = self.result_count <= self.list_max_show_all
+        self.multi_page = self.result_count > self.list_per_page
+        self.paginator = paginator
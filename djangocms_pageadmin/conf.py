@@ -0,0 +1,96 @@
+from django.conf import settings
+
+
+# Pages with more plugins than this are duplicated placeholder by
+# placeholder, each in its own transaction
+DUPLICATE_BATCH_THRESHOLD = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_DUPLICATE_BATCH_THRESHOLD", 1000
+)
+
+# Number of versions changing state in one transaction in the bulk
+# publish and unpublish actions
+BULK_ACTION_CHUNK_SIZE = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_BULK_ACTION_CHUNK_SIZE", 100
+)
+
+# Maintain the denormalised PageContentListing table and serve the export
+# from it. Run the pageadmin_rebuild_listing command after enabling it.
+LISTING_ENABLED = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_LISTING_ENABLED", False
+)
+
+# Seconds the ids and counts of changelist pages are cached for, 0 to
+# disable the cache. Changes to pages invalidate it through signals.
+CHANGELIST_CACHE_TIMEOUT = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_CHANGELIST_CACHE_TIMEOUT", 0
+)
+
+# Build the export rows from values_list() into slotted row objects instead
+# of model instances. Authors are exported by their username field.
+EXPORT_VALUES_ROWS = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_EXPORT_VALUES_ROWS", False
+)
+
+# zlib level of the gzip compressed exports, served to clients accepting
+# gzip and as explicit .gz downloads
+EXPORT_GZIP_LEVEL = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_EXPORT_GZIP_LEVEL", 6
+)
+
+# Days the artifacts of background export jobs are kept before the worker
+# deletes them
+EXPORT_JOB_RETENTION_DAYS = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_EXPORT_JOB_RETENTION_DAYS", 7
+)
+
+# Number of background export jobs a user can have waiting or running
+EXPORT_JOB_LIMIT = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_EXPORT_JOB_LIMIT", 2
+)
+
+# Seconds after which a running background export job is considered
+# abandoned by its worker and failed
+EXPORT_JOB_TIMEOUT = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_EXPORT_JOB_TIMEOUT", 60 * 60
+)
+
+# Maximum number of heavy operations ("export", "duplicate" and "search")
+# running at the same time per site and per user, for example
+# {"export": {"site": 4, "user": 1}}. Operations without limits aren't
+# counted.
+CONCURRENCY_LIMITS = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_CONCURRENCY_LIMITS", {}
+)
+
+# Seconds a heavy operation waits for a slot before it is refused
+CONCURRENCY_WAIT = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_CONCURRENCY_WAIT", 0
+)
+
+# Seconds the slots of running operations are kept in the cache, longer
+# than the slowest operation
+CONCURRENCY_TIMEOUT = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_CONCURRENCY_TIMEOUT", 3600
+)
+
+# Alias of the database the changelist, its filters and search and the
+# exports read from, for example a read replica. None reads from the
+# default database.
+READ_DATABASE = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_READ_DATABASE", None
+)
+
+# Seconds the reads of a user stay on the default database after they
+# changed pages through the page admin, so that they see their changes
+# before the replica catches up
+PRIMARY_PIN_SECONDS = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_PRIMARY_PIN_SECONDS", 10
+)
+
+# Seconds the statements of a changelist view may run before they are
+# cancelled and the user is asked to refine their search, per view:
+# "changelist" and "search" (a changelist with a search term), for example
+# {"changelist": 10, "search": 5}. Only applies to Postgres and SQLite.
+STATEMENT_TIMEOUTS = getattr(
+    settings, "DJANGOCMS_PAGEADMIN_STATEMENT_TIMEOUTS", {}
+)
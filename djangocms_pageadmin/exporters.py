@@ -0,0 +1,251 @@
+import csv
+import io
+import json
+import re
+import zipfile
+import zlib
+from itertools import islice
+from xml.sax.saxutils import escape
+
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from . import conf
+
+
+def _to_text(value):
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _chunked(rows, size):
+    rows = iter(rows)
+    return iter(lambda: list(islice(rows, size)), [])
+
+
+def gzip_stream(chunks, level=6):
+    """Compresses a stream of byte chunks into a gzip stream as it goes"""
+    # A wbits of 16 + 15 writes the gzip header and trailer
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class BaseExporter:
+    """
+    Writes the rows of an export as a stream of byte chunks.
+
+    ``columns`` are the (name, header) pairs of the export and every row is
+    a list of values in the same order.
+    """
+    name = None
+    label = None
+    content_type = None
+    extension = None
+    # Whether gzip makes the output any smaller
+    compressible = True
+    rows_per_chunk = 500
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @property
+    def headers(self):
+        return [header for _name, header in self.columns]
+
+    def stream(self, rows):
+        raise NotImplementedError
+
+
+class CSVExporter(BaseExporter):
+    name = "csv"
+    label = _("CSV")
+    content_type = "text/csv"
+    extension = "csv"
+
+    def stream(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.headers)
+        yield self._drain(buffer)
+        for chunk in _chunked(rows, self.rows_per_chunk):
+            writer.writerows(chunk)
+            yield self._drain(buffer)
+
+    def _drain(self, buffer):
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+
+class JSONLinesExporter(BaseExporter):
+    name = "jsonl"
+    label = _("JSON Lines")
+    content_type = "application/x-ndjson"
+    extension = "jsonl"
+
+    def stream(self, rows):
+        names = [name for name, _header in self.columns]
+        for chunk in _chunked(rows, self.rows_per_chunk):
+            yield "".join(
+                json.dumps(dict(zip(names, map(_to_text, row)))) + "\n" for row in chunk
+            ).encode()
+
+
+class _ChunkBuffer:
+    """Write-only file collecting what a ZipFile writes until it's drained"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+XLSX_PARTS = (
+    (
+        "[Content_Types].xml",
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>',
+    ),
+    (
+        "_rels/.rels",
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    ),
+    (
+        "xl/workbook.xml",
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Pages" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>',
+    ),
+    (
+        "xl/_rels/workbook.xml.rels",
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>',
+    ),
+    (
+        "xl/styles.xml",
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>',
+    ),
+)
+XLSX_SHEET = "xl/worksheets/sheet1.xml"
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+XLSX_SHEET_END = "</sheetData></worksheet>"
+# Characters XML 1.0 doesn't allow
+XML_ILLEGAL_CHARACTERS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class XLSXExporter(BaseExporter):
+    """
+    Writes a single sheet workbook with inline strings, so that the rows
+    are compressed into the zip stream as they come instead of being kept
+    for a shared strings table.
+    """
+    name = "xlsx"
+    label = _("XLSX")
+    content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+    compressible = False
+
+    def stream(self, rows):
+        output = _ChunkBuffer()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in XLSX_PARTS:
+                archive.writestr(name, data)
+            # The size of the sheet isn't known up front
+            with archive.open(XLSX_SHEET, "w", force_zip64=True) as sheet:
+                sheet.write((XLSX_SHEET_START + self._get_row(self.headers)).encode())
+                yield output.drain()
+                for chunk in _chunked(rows, self.rows_per_chunk):
+                    sheet.write("".join(self._get_row(row) for row in chunk).encode())
+                    yield output.drain()
+                sheet.write(XLSX_SHEET_END.encode())
+        yield output.drain()
+
+    def _get_row(self, values):
+        return "<row>{}</row>".format("".join(
+            '<c t="inlineStr"><is><t xml:space="preserve">{}</t></is></c>'.format(
+                escape(XML_ILLEGAL_CHARACTERS.sub("", _to_text(value)))
+            )
+            for value in values
+        ))
+
+
+def write_export(model_admin, request, exporter_class, output, compress=False,
+                 modified_since=None, progress=None):
+    """
+    Writes the export of the changelist ``request`` of ``model_admin`` to
+    the binary file ``output`` and returns the number of rows.
+
+    ``progress`` is called with the number of rows written so far after
+    every chunk of rows.
+    """
+    queryset = model_admin.get_exported_queryset(request)
+    if modified_since is not None:
+        queryset = queryset.filter(versions__modified__gt=modified_since)
+    exporter = exporter_class(model_admin.export_columns)
+    count = 0
+
+    def count_rows(rows):
+        nonlocal count
+        for count, row in enumerate(rows, 1):
+            yield row
+            if progress is not None and count % exporter.rows_per_chunk == 0:
+                progress(count)
+
+    with translation.override(request.GET.get("language")):
+        stream = exporter.stream(count_rows(model_admin.get_export_rows(queryset)))
+        if compress:
+            stream = gzip_stream(stream, conf.EXPORT_GZIP_LEVEL)
+        for chunk in stream:
+            output.write(chunk)
+    return count
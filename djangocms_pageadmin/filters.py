@@ -4,14 +4,30 @@ from django.contrib.auth import get_user_model
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
-from cms.utils import get_current_site
 from cms.utils.conf import get_cms_setting
-from cms.utils.i18n import get_language_tuple, get_site_language_from_request
+from cms.utils.i18n import get_language_tuple
 
 from djangocms_versioning.constants import UNPUBLISHED
 
+from .helpers import get_request_context
 
-class LanguageFilter(admin.SimpleListFilter):
+
+class LeanFilterMixin:
+
+    @classmethod
+    def filter_queryset(cls, request, queryset):
+        """
+        Filters ``queryset`` for the parameter of ``request`` without
+        computing the lookups of the filter.
+        """
+        list_filter = cls.__new__(cls)
+        list_filter.used_parameters = {}
+        if cls.parameter_name in request.GET:
+            list_filter.used_parameters[cls.parameter_name] = request.GET.get(cls.parameter_name)
+        return list_filter.queryset(request, queryset)
+
+
+class LanguageFilter(LeanFilterMixin, admin.SimpleListFilter):
     title = _("language")
     parameter_name = "language"
 
@@ -21,7 +37,7 @@ class LanguageFilter(admin.SimpleListFilter):
     def queryset(self, request, queryset):
         language = self.value()
         if language is None:
-            language = get_site_language_from_request(request)
+            language = get_request_context(request).language
         return queryset.filter(language=language)
 
     def choices(self, changelist):
@@ -40,7 +56,7 @@ class LanguageFilter(admin.SimpleListFilter):
             }
 
 
-class UnpublishedFilter(admin.SimpleListFilter):
+class UnpublishedFilter(LeanFilterMixin, admin.SimpleListFilter):
     title = _("unpublished")
     parameter_name = "unpublished"
 
@@ -70,12 +86,12 @@ class UnpublishedFilter(admin.SimpleListFilter):
             }
 
 
-class TemplateFilter(admin.SimpleListFilter):
+class TemplateFilter(LeanFilterMixin, admin.SimpleListFilter):
     title = _("template")
     parameter_name = "template"
 
     def lookups(self, request, model_admin):
-        site = get_current_site()
+        site = get_request_context(request).site
         site_templates = getattr(settings, "SITE_TEMPLATES", {})
         templates = site_templates.get(site.domain, None)
         if templates:
@@ -105,7 +121,7 @@ class TemplateFilter(admin.SimpleListFilter):
             }
 
 
-class AuthorFilter(admin.SimpleListFilter):
+class AuthorFilter(LeanFilterMixin, admin.SimpleListFilter):
     """
     An author filter limited to those users who have added expiration dates
     """
@@ -117,8 +133,7 @@ class AuthorFilter(admin.SimpleListFilter):
         User = get_user_model()
         options = []
         qs = model_admin.get_queryset(request)
-        authors = qs.values_list('versions__created_by', flat=True).distinct()
-        users = User.objects.filter(pk__in=authors)
+        users = User.objects.using(qs.db).filter(pk__in=qs.values('versions__created_by'))
 
         for user in users:
             options.append(
@@ -5,6 +5,8 @@ from django.utils.translation import gettext_lazy as _
 
 from cms.forms.validators import validate_url_uniqueness
 
+from .helpers import get_unique_slug
+
 
 class DuplicateForm(forms.Form):
     site = forms.ModelChoiceField(
@@ -24,6 +26,31 @@ class DuplicateForm(forms.Form):
         self.page_content = kwargs.pop("page_content")
         super().__init__(*args, **kwargs)
 
+    def get_parent_path(self):
+        """Path of the parent page in the language of the duplicated content,
+        empty when the page sits at the root of the tree.
+        """
+        parent_node = self.page_content.page.node.parent
+        if not parent_node:
+            return ""
+        return parent_node.item.get_path(self.page_content.language) or ""
+
+    def get_path(self, slug):
+        parent_path = self.get_parent_path()
+        return "%s/%s" % (parent_path, slug) if parent_path else slug
+
+    def get_unique_slug(self, site, slug=None):
+        """Suggest a slug that is free on ``site``, starting from ``slug``
+        or the slug of the duplicated content.
+        """
+        language = self.page_content.language
+        slug = slugify(slug or self.page_content.page.get_slug(language) or "")
+        if not slug:
+            return ""
+        return get_unique_slug(
+            site, language, slug, parent_path=self.get_parent_path()
+        )
+
     def clean_slug(self):
         slug = slugify(self.cleaned_data["slug"])
         if not slug:
@@ -37,13 +64,7 @@ class DuplicateForm(forms.Form):
             return cleaned_data
 
         language = self.page_content.language
-
-        slug = cleaned_data["slug"]
-        if self.page_content.page.node.parent:
-            parent_path = self.page_content.page.node.parent.item.get_path(language)
-            path = "%s/%s" % (parent_path, slug) if parent_path else slug
-        else:
-            path = cleaned_data["slug"]
+        path = self.get_path(cleaned_data["slug"])
 
         try:
             validate_url_uniqueness(
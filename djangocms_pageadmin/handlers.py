@@ -0,0 +1,195 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from cms.models import Page, PageContent, PageUrl, TreeNode
+from cms.operations import CHANGE_PAGE_TRANSLATION, MOVE_PAGE
+from cms.signals import post_obj_operation
+
+from djangocms_version_locking.models import VersionLock
+from djangocms_versioning import versionables
+from djangocms_versioning.models import Version
+
+from .helpers import bump_changelist_generation
+from .models import PageContentListing
+
+
+def _refresh_listing(**filters):
+    PageContentListing.objects.refresh(PageContent._base_manager.filter(**filters))
+
+
+def _is_page_content_version(instance):
+    return instance.content_type_id == ContentType.objects.get_for_model(PageContent).pk
+
+
+def _version_senders():
+    # Versions are saved through the proxy models of versioning too, which
+    # send the signals as the proxy
+    return [Version, versionables.for_content(PageContent).version_model_proxy]
+
+
+def update_listing_for_page_content(sender, instance, **kwargs):
+    _refresh_listing(pk=instance.pk)
+
+
+def update_listing_for_version(sender, instance, **kwargs):
+    if _is_page_content_version(instance):
+        _refresh_listing(pk=instance.object_id)
+
+
+def update_listing_for_version_lock(sender, instance, **kwargs):
+    _refresh_listing(versions=instance.version_id)
+
+
+def update_listing_for_content_expiry(sender, instance, **kwargs):
+    _refresh_listing(versions=instance.version_id)
+
+
+def _refresh_listing_tree(page, language=None):
+    # The cms rewrites the paths of the descendants with queryset updates,
+    # which send no signals
+    filters = {"page__node__in": TreeNode.get_tree(TreeNode.objects.get(pk=page.node_id))}
+    if language:
+        filters["language"] = language
+    _refresh_listing(**filters)
+
+
+def update_listing_for_page_url(sender, instance, **kwargs):
+    listed_path = PageContentListing.objects.filter(
+        page=instance.page_id, language=instance.language
+    ).values_list("path", flat=True).first()
+    if listed_path is not None and listed_path != (instance.path or ""):
+        _refresh_listing_tree(Page.objects.get(pk=instance.page_id), instance.language)
+    else:
+        _refresh_listing(page=instance.page_id, language=instance.language)
+
+
+def update_listing_for_page_operation(sender, operation, obj=None, **kwargs):
+    # Moves and slug changes of the page admin update the urls of the tree
+    # with queryset updates
+    if operation in (MOVE_PAGE, CHANGE_PAGE_TRANSLATION) and isinstance(obj, Page):
+        _refresh_listing_tree(obj, kwargs.get("language"))
+
+
+def update_listing_for_page(sender, instance, **kwargs):
+    if not instance.is_home:
+        return
+    # The cms unsets the previous home page with a queryset update, which
+    # sends no signals
+    PageContentListing.objects.filter(
+        site=instance.node.site_id, is_home=True
+    ).exclude(page=instance).update(is_home=False)
+    PageContentListing.objects.filter(page=instance).update(is_home=True)
+
+
+def _listing_handlers():
+    handlers = [
+        (post_save, update_listing_for_page_content, PageContent),
+        *((post_save, update_listing_for_version, sender) for sender in _version_senders()),
+        (post_save, update_listing_for_version_lock, VersionLock),
+        (post_delete, update_listing_for_version_lock, VersionLock),
+        (post_save, update_listing_for_page_url, PageUrl),
+        (post_delete, update_listing_for_page_url, PageUrl),
+        (post_save, update_listing_for_page, Page),
+        (post_obj_operation, update_listing_for_page_operation, None),
+    ]
+    if apps.is_installed("djangocms_content_expiry"):
+        content_expiry = apps.get_model("djangocms_content_expiry", "ContentExpiry")
+        handlers += [
+            (post_save, update_listing_for_content_expiry, content_expiry),
+            (post_delete, update_listing_for_content_expiry, content_expiry),
+        ]
+    return handlers
+
+
+def connect_listing_handlers():
+    """Keeps the rows of PageContentListing up to date with their sources."""
+    for signal, handler, sender in _listing_handlers():
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_listing_handlers():
+    for signal, handler, sender in _listing_handlers():
+        signal.disconnect(handler, sender=sender)
+
+
+def _bump_on_commit(site_ids):
+    # Bumped before the commit, a concurrent request could cache the rows it
+    # still sees under the new generation
+    site_ids = list(site_ids)
+    transaction.on_commit(lambda: bump_changelist_generation(site_ids))
+
+
+def _invalidate_changelist_cache(**filters):
+    _bump_on_commit(
+        PageContent._base_manager.filter(**filters).values_list("page__node__site_id", flat=True)
+    )
+
+
+def invalidate_changelist_cache_for_page(sender, instance, **kwargs):
+    # PageContent and PageUrl
+    _bump_on_commit(
+        Page.objects.filter(pk=instance.page_id).values_list("node__site_id", flat=True)
+    )
+
+
+def invalidate_changelist_cache_for_version(sender, instance, **kwargs):
+    if _is_page_content_version(instance):
+        _invalidate_changelist_cache(pk=instance.object_id)
+
+
+def invalidate_changelist_cache_for_version_lock(sender, instance, **kwargs):
+    _invalidate_changelist_cache(versions=instance.version_id)
+
+
+def invalidate_changelist_cache_for_content_expiry(sender, instance, **kwargs):
+    _invalidate_changelist_cache(versions=instance.version_id)
+
+
+def invalidate_changelist_cache_for_home(sender, instance, **kwargs):
+    if instance.is_home:
+        _bump_on_commit([instance.node.site_id])
+
+
+def invalidate_changelist_cache_for_page_operation(sender, operation, obj=None, **kwargs):
+    if operation in (MOVE_PAGE, CHANGE_PAGE_TRANSLATION) and isinstance(obj, Page):
+        _bump_on_commit([obj.node.site_id])
+
+
+def _changelist_cache_handlers():
+    handlers = [
+        (post_save, invalidate_changelist_cache_for_page, PageContent),
+        (post_delete, invalidate_changelist_cache_for_page, PageContent),
+        (post_save, invalidate_changelist_cache_for_page, PageUrl),
+        (post_delete, invalidate_changelist_cache_for_page, PageUrl),
+        *(
+            (signal, invalidate_changelist_cache_for_version, sender)
+            for signal in (post_save, post_delete)
+            for sender in _version_senders()
+        ),
+        (post_save, invalidate_changelist_cache_for_version_lock, VersionLock),
+        (post_delete, invalidate_changelist_cache_for_version_lock, VersionLock),
+        (post_save, invalidate_changelist_cache_for_home, Page),
+        (post_obj_operation, invalidate_changelist_cache_for_page_operation, None),
+    ]
+    if apps.is_installed("djangocms_content_expiry"):
+        content_expiry = apps.get_model("djangocms_content_expiry", "ContentExpiry")
+        handlers += [
+            (post_save, invalidate_changelist_cache_for_content_expiry, content_expiry),
+            (post_delete, invalidate_changelist_cache_for_content_expiry, content_expiry),
+        ]
+    return handlers
+
+
+def connect_changelist_cache_handlers():
+    """Invalidates the changelist cache and the ETags of a site when its
+    pages change.
+    """
+    for signal, handler, sender in _changelist_cache_handlers():
+        signal.connect(handler, sender=sender)
+
+
+def disconnect_changelist_cache_handlers():
+    for signal, handler, sender in _changelist_cache_handlers():
+        signal.disconnect(handler, sender=sender)
@@ -1,11 +1,31 @@
+import re
+import time
 from copy import deepcopy
+from functools import lru_cache
 
 from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.db.models import F, Func, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.http import HttpRequest, QueryDict
+from django.utils.functional import cached_property
 
-from cms.models import PageContent
+from cms.extensions import extension_pool
+from cms.models import CMSPlugin, PageContent, PageUrl, Placeholder
+from cms.utils.i18n import get_site_language_from_request
 
 from djangocms_versioning import versionables
 
+from . import conf
+
+
+DUPLICATE_THROUGHPUT_CACHE_KEY = "djangocms_pageadmin:duplicate_throughput"
+CHANGELIST_GENERATION_CACHE_KEY = "djangocms_pageadmin:changelist_generation:{site_id}"
+PRIMARY_PIN_SESSION_KEY = "_pageadmin_primary_until"
+
 
 def proxy_model(obj):
     versionable = versionables.for_content(PageContent)
@@ -14,11 +34,15 @@ def proxy_model(obj):
     return obj_
 
 
+@lru_cache(maxsize=None)
 def is_moderation_enabled():
     """
     Returns True if the PageContent model is enabled for moderation.
     If it is not, or djangocms_moderation is not installed, returns False.
 
+    The moderation config doesn't change once the apps are loaded, so the
+    result is cached. Use ``is_moderation_enabled.cache_clear()`` to reset it.
+
     :returns: True or False
     """
     try:
@@ -27,3 +51,245 @@ def is_moderation_enabled():
         return False
 
     return PageContent in moderation_config.cms_extension.moderated_models
+
+
+def get_unique_slug(site, language, slug, parent_path=""):
+    """
+    Returns ``slug`` if no page on ``site`` uses the resulting path in
+    ``language``, otherwise the first free ``slug-<n>`` variant (``slug-2``,
+    ``slug-3``...).
+
+    The taken paths are fetched with a single prefix query against the
+    indexed ``PageUrl.path`` column.
+
+    :param site: Site the page will be created in
+    :param language: Language code of the page url
+    :param slug: Slug to make unique
+    :param parent_path: Path of the parent page, empty for root pages
+    :returns: A slug that does not collide with any sibling
+    """
+    base_path = "%s/%s" % (parent_path, slug) if parent_path else slug
+    taken_paths = set(
+        PageUrl.objects.filter(
+            Q(path=base_path) | Q(path__startswith=base_path + "-"),
+            page__node__site=site,
+            language=language,
+        ).values_list("path", flat=True)
+    )
+    if base_path not in taken_paths:
+        return slug
+
+    suffix = 2
+    while "%s-%d" % (base_path, suffix) in taken_paths:
+        suffix += 1
+    return "%s-%d" % (slug, suffix)
+
+
+def _count_subquery(queryset):
+    """Wraps ``queryset`` in a ``COUNT`` subquery usable as an annotation."""
+    count = Func(F("pk"), function="COUNT", output_field=IntegerField())
+    return Coalesce(
+        Subquery(queryset.order_by().annotate(count=count).values("count")[:1]),
+        0,
+    )
+
+
+def _get_content_extensions():
+    # Content extensions were called title extensions before django CMS 4
+    return getattr(
+        extension_pool,
+        "page_content_extensions",
+        getattr(extension_pool, "title_extensions", ()),
+    )
+
+
+def get_duplicate_estimate(page_content):
+    """
+    Estimates how much data duplicating ``page_content`` copies.
+
+    Placeholders, plugins in the language of the content and page and content
+    extensions are counted with a single aggregate query.
+
+    :param page_content: PageContent to be duplicated
+    :returns: dict with the ``placeholders``, ``plugins`` and ``extensions`` counts
+    """
+    content_type = ContentType.objects.get_for_model(PageContent)
+    annotations = {
+        "placeholders": _count_subquery(
+            Placeholder.objects.filter(
+                content_type=content_type, object_id=OuterRef("pk")
+            )
+        ),
+        "plugins": _count_subquery(
+            CMSPlugin.objects.filter(
+                placeholder__content_type=content_type,
+                placeholder__object_id=OuterRef("pk"),
+                language=OuterRef("language"),
+            )
+        ),
+    }
+    extension_counts = []
+    for index, extension in enumerate(extension_pool.page_extensions):
+        name = "_page_extension_%d" % index
+        annotations[name] = _count_subquery(
+            extension.objects.filter(extended_object=OuterRef("page"))
+        )
+        extension_counts.append(name)
+    for index, extension in enumerate(_get_content_extensions()):
+        name = "_content_extension_%d" % index
+        annotations[name] = _count_subquery(
+            extension.objects.filter(extended_object=OuterRef("pk"))
+        )
+        extension_counts.append(name)
+
+    counts = (
+        PageContent._base_manager.filter(pk=page_content.pk)
+        .annotate(**annotations)
+        .values(*annotations)
+        .get()
+    )
+    return {
+        "placeholders": counts["placeholders"],
+        "plugins": counts["plugins"],
+        "extensions": sum(counts[name] for name in extension_counts),
+    }
+
+
+def record_duplicate_throughput(items, seconds):
+    """
+    Records how long copying ``items`` objects took when duplicating a page.
+
+    A moving average of the seconds spent per item is kept in the cache.
+    """
+    if not items:
+        return
+    sample = seconds / items
+    average = cache.get(DUPLICATE_THROUGHPUT_CACHE_KEY)
+    if average is not None:
+        sample = 0.8 * average + 0.2 * sample
+    cache.set(DUPLICATE_THROUGHPUT_CACHE_KEY, sample, None)
+
+
+def get_expected_duplicate_duration(items):
+    """
+    Expected number of seconds it takes to copy ``items`` objects, based on
+    previously recorded duplications. ``None`` when nothing was recorded yet.
+    """
+    average = cache.get(DUPLICATE_THROUGHPUT_CACHE_KEY)
+    if average is None:
+        return None
+    return items * average
+
+
+def get_changelist_generation(site_id):
+    """
+    Current generation of the changelist cache of ``site_id``.
+
+    A missing counter starts from the current time, so entries cached
+    before it was evicted can't be picked up again.
+    """
+    key = CHANGELIST_GENERATION_CACHE_KEY.format(site_id=site_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_changelist_generation(site_ids):
+    """Invalidates the changelist cache of the sites in ``site_ids``."""
+    for site_id in set(site_ids):
+        key = CHANGELIST_GENERATION_CACHE_KEY.format(site_id=site_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+class PageAdminRequestContext:
+    """
+    Values of a page admin request resolved once and shared by the model
+    admin, its changelist and the list filters.
+
+    ``database`` is the alias the querysets of the request read from, None
+    for the default routing.
+    """
+    database = None
+
+    def __init__(self, request):
+        self.request = request
+        self._querysets = {}
+
+    @cached_property
+    def site(self):
+        return get_current_site(self.request)
+
+    @cached_property
+    def language(self):
+        """Language of the site the changelist shows by default"""
+        return get_site_language_from_request(self.request)
+
+    def get_queryset(self, name, build):
+        """
+        The queryset ``name`` of the request, built by calling ``build`` the
+        first time. Each call returns a fresh copy of it.
+        """
+        if name not in self._querysets:
+            self._querysets[name] = build()
+        return self._querysets[name].all()
+
+
+def get_request_context(request):
+    """The PageAdminRequestContext of ``request``"""
+    if not hasattr(request, "_pageadmin_context"):
+        request._pageadmin_context = PageAdminRequestContext(request)
+    return request._pageadmin_context
+
+
+def pin_to_primary(request):
+    """
+    Keeps the reads of the user of ``request`` on the default database for
+    PRIMARY_PIN_SECONDS, so that they see what they just changed.
+    """
+    session = getattr(request, "session", None)
+    if conf.READ_DATABASE and session is not None:
+        session[PRIMARY_PIN_SESSION_KEY] = time.time() + conf.PRIMARY_PIN_SECONDS
+
+
+def is_pinned_to_primary(request):
+    session = getattr(request, "session", None)
+    return session is not None and session.get(PRIMARY_PIN_SESSION_KEY, 0) > time.time()
+
+
+def use_read_database(request):
+    """
+    Routes the page admin querysets of ``request`` to READ_DATABASE, unless
+    its user is pinned to the default database.
+    """
+    if conf.READ_DATABASE and not is_pinned_to_primary(request):
+        get_request_context(request).database = conf.READ_DATABASE
+
+
+def get_export_request(site, params, user=None):
+    """
+    A changelist request of ``site`` with the filter, search and ordering
+    ``params``, for exports made outside of a request.
+    """
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = "/"
+    request.GET = QueryDict(mutable=True)
+    for key, value in params.items():
+        request.GET[key] = str(value)
+    request.user = user or AnonymousUser()
+    get_request_context(request).site = site
+    use_read_database(request)
+    return request
+
+
+# The pattern GZipMiddleware matches Accept-Encoding with
+re_accepts_gzip = re.compile(r"\bgzip\b")
+
+
+def accepts_gzip(request):
+    return bool(re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
@@ -0,0 +1,118 @@
+import logging
+import time
+import uuid
+
+from django.core.cache import cache
+
+from . import conf
+from .helpers import get_request_context
+from .signals import concurrency_limit_reached
+
+
+logger = logging.getLogger(__name__)
+
+LIMITER_CACHE_KEY = "djangocms_pageadmin:limiter:{operation}:{scope}:{id}:{index}"
+# Seconds a refused client is asked to wait before retrying
+RETRY_AFTER = 10
+# Seconds between attempts while waiting for a slot
+POLL_INTERVAL = 0.1
+
+
+class ConcurrencyLimitReached(Exception):
+
+    def __init__(self, operation, scope):
+        super().__init__(operation, scope)
+        self.operation = operation
+        self.scope = scope
+
+
+class ConcurrencySlot:
+    """
+    A running heavy ``operation`` of the site and the user of ``request``,
+    kept in the cache so that the limits of ``CONCURRENCY_LIMITS`` hold
+    across processes.
+
+    A limit of ``n`` is ``n`` cache keys, each taken with an atomic add by
+    one running operation. The keys expire after ``CONCURRENCY_TIMEOUT``
+    seconds, so that slots a crashed process didn't release free up
+    eventually, and an expired slot never counts twice: it is only
+    released by the operation holding it.
+    """
+
+    def __init__(self, operation, request):
+        self.operation = operation
+        self.request = request
+        limits = conf.CONCURRENCY_LIMITS.get(operation) or {}
+        ids = {
+            "site": get_request_context(request).site.pk,
+            "user": request.user.pk,
+        }
+        self.limits = [
+            (scope, ids[scope], limits[scope])
+            for scope in ("site", "user")
+            if limits.get(scope)
+        ]
+        self.token = uuid.uuid4().hex
+        self.taken = []
+
+    def acquire(self):
+        """
+        Takes the slot, waiting up to ``CONCURRENCY_WAIT`` seconds for one to
+        free up. Raises ConcurrencyLimitReached when none did.
+        """
+        deadline = time.monotonic() + conf.CONCURRENCY_WAIT
+        while True:
+            scope = self._take()
+            if scope is None:
+                return self
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(POLL_INTERVAL)
+        logger.warning(
+            "Refused %s of %s: the %s limit is reached", self.operation, self.request.path, scope
+        )
+        concurrency_limit_reached.send(
+            sender=self.__class__, operation=self.operation, scope=scope, request=self.request
+        )
+        raise ConcurrencyLimitReached(self.operation, scope)
+
+    def release(self):
+        while self.taken:
+            key = self.taken.pop()
+            # Unless it expired and another operation took it since
+            if cache.get(key) == self.token:
+                cache.delete(key)
+
+    def _take(self):
+        """Takes a free slot of each limit, returns the scope of the first
+        limit without one
+        """
+        for scope, scope_id, limit in self.limits:
+            keys = [
+                LIMITER_CACHE_KEY.format(operation=self.operation, scope=scope, id=scope_id, index=index)
+                for index in range(limit)
+            ]
+            key = next((key for key in keys if cache.add(key, self.token, conf.CONCURRENCY_TIMEOUT)), None)
+            if key is None:
+                self.release()
+                return scope
+            self.taken.append(key)
+        return None
+
+
+class ReleasingStream:
+    """Iterates over ``stream`` and releases ``slot`` when it is closed"""
+
+    def __init__(self, stream, slot):
+        self.stream = stream
+        self.slot = slot
+
+    def __iter__(self):
+        return iter(self.stream)
+
+    def close(self):
+        try:
+            if hasattr(self.stream, "close"):
+                self.stream.close()
+        finally:
+            self.slot.release()
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from cms.models import Page
+
+from djangocms_pageadmin.models import PendingDuplicate
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the pages of duplicates whose content copy was interrupted, "
+        "for example by a killed worker"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=60,
+            help="Minutes after which a duplicate still being copied is considered interrupted",
+        )
+
+    def handle(self, *args, **options):
+        stale = PendingDuplicate.objects.stale(timedelta(minutes=options["older_than"]))
+        count = 0
+        for page in Page.objects.filter(pk__in=stale.values("page")):
+            with transaction.atomic():
+                page.delete()
+            count += 1
+        self.stdout.write(
+            self.style.SUCCESS("Deleted {} interrupted duplicates".format(count))
+        )
@@ -0,0 +1,242 @@
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from django.contrib import admin
+from django.contrib.admin.views.main import SEARCH_VAR
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from cms.models import PageContent
+from cms.utils.i18n import get_default_language_for_site
+
+from djangocms_pageadmin.exporters import write_export
+from djangocms_pageadmin.helpers import get_export_request
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def timestamp(value):
+    date = parse_datetime(value)
+    if date is None:
+        day = parse_date(value)
+        if day is None:
+            raise argparse.ArgumentTypeError("'{}' is not a valid date or datetime".format(value))
+        date = datetime.datetime.combine(day, datetime.time.min)
+    if timezone.is_naive(date):
+        date = timezone.make_aware(date)
+    return date
+
+
+def get_exporter_class(export_format):
+    model_admin = admin.site._registry[PageContent]
+    exporters = {exporter.name: exporter for exporter in model_admin.export_formats}
+    if export_format not in exporters:
+        raise CommandError("Unknown format '{}', choose from {}".format(
+            export_format, ", ".join(exporters)
+        ))
+    return exporters[export_format]
+
+
+def export_site(site, params, output, export_format, compress=False, modified_since=None, progress=None,
+                user=None):
+    """
+    Writes the export of the pages of ``site`` to the binary file
+    ``output`` and returns the number of rows.
+    """
+    params = dict(params)
+    if not params.get("language"):
+        params["language"] = get_default_language_for_site(site.pk)
+    return write_export(
+        admin.site._registry[PageContent],
+        get_export_request(site, params, user),
+        get_exporter_class(export_format),
+        output,
+        compress=compress,
+        modified_since=modified_since,
+        progress=progress,
+    )
+
+
+def export_site_to_file(site_id, params, path, export_format, compress, modified_since):
+    """
+    Exports a site to ``path`` in a worker of the process pool and returns
+    its entry of the manifest.
+    """
+    started = time.monotonic()
+    try:
+        site = Site.objects.get(pk=site_id)
+        with open(path, "wb") as output:
+            rows = export_site(site, params, output, export_format, compress, modified_since)
+    finally:
+        # Each worker has connections of its own
+        connections.close_all()
+    return {
+        "site": site.pk,
+        "domain": site.domain,
+        "file": os.path.basename(path),
+        "rows": rows,
+        "seconds": round(time.monotonic() - started, 3),
+    }
+
+
+def _export_site_task(task):
+    return export_site_to_file(*task)
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports the pages of one or more sites with the columns and filters "
+        "of the page admin changelist"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            type=int,
+            action="append",
+            help="Id of a site to export, can be repeated. The current site by default",
+        )
+        parser.add_argument("--all-sites", action="store_true", help="Export every site")
+        parser.add_argument("--language", help="Language of the pages, the default of each site by default")
+        parser.add_argument("--template", help="Template of the pages")
+        parser.add_argument("--author", help="Username of the author of the current versions")
+        parser.add_argument(
+            "--unpublished", action="store_true", help="Export the unpublished pages instead of the others"
+        )
+        parser.add_argument("--search", help="Search term of the changelist")
+        parser.add_argument(
+            "--since",
+            type=timestamp,
+            help="Only export pages whose current version changed after this date or datetime",
+        )
+        parser.add_argument("--format", default="csv", help="Export format, csv by default")
+        parser.add_argument("--gzip", action="store_true", help="Compress the export with gzip")
+        parser.add_argument(
+            "--output", "-o", default="-", help="File the export of a site is written to, stdout by default"
+        )
+        parser.add_argument(
+            "--output-dir",
+            help="Directory the export of each site and a manifest are written to, for several sites",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of sites exported at the same time with --output-dir, the number of CPUs by default",
+        )
+
+    def handle(self, *args, **options):
+        exporter_class = get_exporter_class(options["format"])
+        params = self.get_params(options)
+        if options["all_sites"]:
+            sites = list(Site.objects.order_by("pk"))
+        else:
+            sites = [self.get_site(site_id) for site_id in options["site"] or [None]]
+
+        if options["output_dir"]:
+            self.export_sites(sites, params, exporter_class, options)
+            return
+        if len(sites) > 1:
+            raise CommandError("Exporting several sites needs --output-dir")
+
+        def progress(count):
+            self.stderr.write("Exported {} rows".format(count))
+
+        export = dict(
+            site=sites[0],
+            params=params,
+            export_format=exporter_class.name,
+            compress=options["gzip"],
+            modified_since=options["since"],
+            progress=progress if options["verbosity"] else None,
+        )
+        if options["output"] == "-":
+            count = export_site(output=sys.stdout.buffer, **export)
+        else:
+            with open(options["output"], "wb") as output:
+                count = export_site(output=output, **export)
+        # The export itself may be written to stdout
+        self.stderr.write(self.style.SUCCESS("Exported {} rows".format(count)))
+
+    def export_sites(self, sites, params, exporter_class, options):
+        """
+        Exports each site to a file of the output directory in a pool of
+        processes and writes a manifest of the files.
+        """
+        output_dir = options["output_dir"]
+        os.makedirs(output_dir, exist_ok=True)
+        extension = exporter_class.extension + (".gz" if options["gzip"] else "")
+        tasks = [
+            (
+                site.pk,
+                params,
+                os.path.join(output_dir, "site_{}.{}".format(site.pk, extension)),
+                exporter_class.name,
+                options["gzip"],
+                options["since"],
+            )
+            for site in sites
+        ]
+        started = time.monotonic()
+        entries = []
+        # Forked workers would share the open connections otherwise
+        connections.close_all()
+        # Forked workers inherit the configured project. A worker exits after
+        # its site, which bounds the memory a worker holds on to.
+        context = multiprocessing.get_context("fork")
+        with context.Pool(min(options["processes"], len(tasks)) or 1, maxtasksperchild=1) as pool:
+            for entry in pool.imap_unordered(_export_site_task, tasks):
+                if options["verbosity"]:
+                    self.stderr.write("Site {site}: {rows} rows in {seconds}s".format(**entry))
+                entries.append(entry)
+        entries.sort(key=lambda entry: entry["site"])
+
+        manifest = {
+            "format": exporter_class.name,
+            "compressed": options["gzip"],
+            "since": options["since"].isoformat() if options["since"] else None,
+            "created": timezone.now().isoformat(),
+            "seconds": round(time.monotonic() - started, 3),
+            "rows": sum(entry["rows"] for entry in entries),
+            "sites": entries,
+        }
+        with open(os.path.join(output_dir, MANIFEST_NAME), "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        self.stderr.write(self.style.SUCCESS(
+            "Exported {} rows of {} sites".format(manifest["rows"], len(entries))
+        ))
+
+    def get_site(self, site_id):
+        if site_id is None:
+            return Site.objects.get_current()
+        try:
+            return Site.objects.get(pk=site_id)
+        except Site.DoesNotExist:
+            raise CommandError("Site {} does not exist".format(site_id))
+
+    def get_params(self, options):
+        """The changelist parameters of the filters and search of ``options``"""
+        params = {"language": options["language"]}
+        if options["template"]:
+            params["template"] = options["template"]
+        if options["author"]:
+            User = get_user_model()
+            try:
+                params["created_by"] = User._default_manager.get_by_natural_key(options["author"]).pk
+            except User.DoesNotExist:
+                raise CommandError("User '{}' does not exist".format(options["author"]))
+        if options["unpublished"]:
+            params["unpublished"] = "1"
+        if options["search"]:
+            params[SEARCH_VAR] = options["search"]
+        return params
@@ -0,0 +1,96 @@
+import logging
+import tempfile
+import time
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from djangocms_pageadmin.helpers import bump_changelist_generation
+from djangocms_pageadmin.management.commands.pageadmin_export import (
+    export_site,
+)
+from djangocms_pageadmin.models import ExportJob
+
+
+logger = logging.getLogger(__name__)
+
+
+def run_export_job(job):
+    """Generates the file of ``job`` into the default storage"""
+    try:
+        with tempfile.TemporaryFile() as output:
+            job.rows = export_site(job.site, job.params, output, job.export_format, user=job.user)
+            output.seek(0)
+            job.file.save(
+                "pages-{}-{}.{}".format(job.site_id, job.pk, job.export_format),
+                File(output),
+                save=False,
+            )
+        job.status = ExportJob.DONE
+    except Exception as error:
+        logger.exception("Export job %s failed", job.pk)
+        job.status = ExportJob.FAILED
+        job.error = str(error)
+    job.finished = timezone.now()
+    job.save(update_fields=["rows", "file", "status", "error", "finished"])
+    # The changelist of the site notifies the user, and conditional requests
+    # would answer it with a 304 otherwise
+    bump_changelist_generation([job.site_id])
+
+
+def fail_stale_export_jobs():
+    """Fails the jobs left running by a worker that died, which the users
+    are notified about and the cleanup deletes like any finished job
+    """
+    jobs = list(ExportJob.objects.stale().values_list("pk", "site_id"))
+    failed = ExportJob.objects.stale().filter(pk__in=[pk for pk, _site_id in jobs]).update(
+        status=ExportJob.FAILED,
+        error="The export was interrupted",
+        finished=timezone.now(),
+    )
+    if failed:
+        bump_changelist_generation([site_id for _pk, site_id in jobs])
+    return failed
+
+
+def delete_expired_export_jobs():
+    """Deletes the jobs older than the retention period and their files"""
+    jobs = list(ExportJob.objects.finished().expired())
+    for job in jobs:
+        if job.file:
+            job.file.delete(save=False)
+    ExportJob.objects.filter(pk__in=[job.pk for job in jobs]).delete()
+    return len(jobs)
+
+
+class Command(BaseCommand):
+    help = "Generates the files of the background page exports requested in the admin"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true", help="Process the pending jobs and exit instead of polling"
+        )
+        parser.add_argument(
+            "--interval", type=float, default=5, help="Seconds between polls for pending jobs"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            failed = fail_stale_export_jobs()
+            if failed and options["verbosity"]:
+                self.stdout.write("Failed {} interrupted export jobs".format(failed))
+            deleted = delete_expired_export_jobs()
+            if deleted and options["verbosity"]:
+                self.stdout.write("Deleted {} expired export jobs".format(deleted))
+            jobs = ExportJob.objects.filter(status=ExportJob.PENDING).select_related("site", "user")
+            for job in jobs.order_by("created"):
+                # Several workers may be polling
+                if not ExportJob.objects.claim(job):
+                    continue
+                run_export_job(job)
+                if options["verbosity"]:
+                    self.stdout.write("Export job {}: {}".format(job.pk, job.get_status_display()))
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from cms.models import PageContent
+
+from djangocms_pageadmin.models import PageContentListing
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the page listing table of the page admin from scratch"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of page contents to rebuild at once",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        pks = list(PageContent._base_manager.order_by("pk").values_list("pk", flat=True))
+        with transaction.atomic():
+            PageContentListing.objects.all().delete()
+            for start in range(0, len(pks), chunk_size):
+                PageContentListing.objects.refresh(
+                    PageContent._base_manager.filter(pk__in=pks[start:start + chunk_size])
+                )
+        self.stdout.write(
+            self.style.SUCCESS("Rebuilt the listing of {} page contents".format(len(pks)))
+        )
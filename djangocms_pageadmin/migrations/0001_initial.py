@@ -0,0 +1,94 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("sites", "0002_alter_domain_unique"),
+        ("cms", "0034_remove_pagecontent_placeholders"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageContentListing",
+            fields=[
+                (
+                    "page_content",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="pageadmin_listing",
+                        serialize=False,
+                        to="cms.pagecontent",
+                    ),
+                ),
+                ("language", models.CharField(max_length=15, verbose_name="language")),
+                ("title", models.CharField(max_length=255, verbose_name="title")),
+                ("path", models.CharField(blank=True, max_length=255, verbose_name="path")),
+                ("is_home", models.BooleanField(default=False, verbose_name="is home")),
+                ("template", models.CharField(blank=True, max_length=100, verbose_name="template")),
+                ("state", models.CharField(blank=True, max_length=100, verbose_name="state")),
+                ("modified", models.DateTimeField(null=True, verbose_name="modified")),
+                ("expires", models.DateTimeField(null=True, verbose_name="expires")),
+                (
+                    "compliance_number",
+                    models.CharField(blank=True, max_length=255, verbose_name="compliance number"),
+                ),
+                (
+                    "author",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "lock_owner",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="cms.page",
+                    ),
+                ),
+                (
+                    "site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="sites.site",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "page listing",
+                "verbose_name_plural": "page listings",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="pagecontentlisting",
+            index=models.Index(
+                fields=["site", "language", "-modified"], name="pageadmin_listing_lang_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagecontentlisting",
+            index=models.Index(
+                fields=["site", "state", "-modified"], name="pageadmin_listing_state_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("sites", "0002_alter_domain_unique"),
+        ("djangocms_pageadmin", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("export_format", models.CharField(max_length=10, verbose_name="format")),
+                ("params", models.JSONField(blank=True, default=dict, verbose_name="parameters")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        blank=True, upload_to="djangocms_pageadmin/exports/", verbose_name="file"
+                    ),
+                ),
+                ("rows", models.PositiveIntegerField(null=True, verbose_name="rows")),
+                ("error", models.TextField(blank=True, verbose_name="error")),
+                ("created", models.DateTimeField(auto_now_add=True, verbose_name="created")),
+                ("started", models.DateTimeField(null=True, verbose_name="started")),
+                ("finished", models.DateTimeField(null=True, verbose_name="finished")),
+                ("notified", models.BooleanField(default=False, verbose_name="notified")),
+                (
+                    "site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="sites.site",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "export job",
+                "verbose_name_plural": "export jobs",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="exportjob",
+            index=models.Index(fields=["user", "status"], name="pageadmin_exportjob_user_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="exportjob",
+            index=models.Index(fields=["status", "created"], name="pageadmin_exportjob_status_idx"),
+        ),
+    ]
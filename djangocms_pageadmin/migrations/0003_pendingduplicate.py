@@ -0,0 +1,33 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cms", "0034_remove_pagecontent_placeholders"),
+        ("djangocms_pageadmin", "0002_exportjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingDuplicate",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="cms.page",
+                    ),
+                ),
+                ("started", models.DateTimeField(auto_now_add=True, verbose_name="started")),
+            ],
+            options={
+                "verbose_name": "pending duplicate",
+                "verbose_name_plural": "pending duplicates",
+            },
+        ),
+    ]
@@ -0,0 +1,249 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.db import models, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from cms.models import Page, PageContent, PageUrl
+
+from djangocms_versioning.models import Version
+
+from . import conf
+
+
+class PageContentListingManager(models.Manager):
+
+    def refresh(self, page_contents):
+        """
+        (Re)builds the listing rows of ``page_contents``, a PageContent
+        queryset, with one query for the contents and one for their versions.
+        """
+        url_subquery = PageUrl.objects.filter(
+            language=OuterRef("language"), page=OuterRef("page")
+        )
+        contents = list(
+            page_contents.select_related("page__node")
+            .annotate(_path=Subquery(url_subquery.values("path")[:1]))
+        )
+        related = ["versionlock"]
+        if apps.is_installed("djangocms_content_expiry"):
+            related.append("contentexpiry")
+        versions = {
+            version.object_id: version
+            for version in Version.objects.filter(
+                content_type=ContentType.objects.get_for_model(PageContent),
+                object_id__in=[content.pk for content in contents],
+            ).select_related(*related)
+        }
+        rows = [
+            self.model.from_page_content(content, versions.get(content.pk))
+            for content in contents
+        ]
+        with transaction.atomic():
+            self.filter(page_content__in=[content.pk for content in contents]).delete()
+            self.bulk_create(rows)
+
+
+class PageContentListing(models.Model):
+    """
+    Denormalised changelist row of a page content.
+
+    Only maintained when ``DJANGOCMS_PAGEADMIN_LISTING_ENABLED`` is set, by
+    the handlers in :mod:`djangocms_pageadmin.handlers`. Run the
+    ``pageadmin_rebuild_listing`` command to build it from scratch.
+    """
+    page_content = models.OneToOneField(
+        PageContent,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="pageadmin_listing",
+    )
+    page = models.ForeignKey(Page, on_delete=models.CASCADE, related_name="+")
+    site = models.ForeignKey(Site, on_delete=models.CASCADE, related_name="+")
+    language = models.CharField(_("language"), max_length=15)
+    title = models.CharField(_("title"), max_length=255)
+    path = models.CharField(_("path"), max_length=255, blank=True)
+    is_home = models.BooleanField(_("is home"), default=False)
+    template = models.CharField(_("template"), max_length=100, blank=True)
+    state = models.CharField(_("state"), max_length=100, blank=True)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    modified = models.DateTimeField(_("modified"), null=True)
+    lock_owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    expires = models.DateTimeField(_("expires"), null=True)
+    compliance_number = models.CharField(_("compliance number"), max_length=255, blank=True)
+
+    objects = PageContentListingManager()
+
+    class Meta:
+        verbose_name = _("page listing")
+        verbose_name_plural = _("page listings")
+        indexes = [
+            models.Index(
+                fields=["site", "language", "-modified"], name="pageadmin_listing_lang_idx"
+            ),
+            models.Index(
+                fields=["site", "state", "-modified"], name="pageadmin_listing_state_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def from_page_content(cls, page_content, version=None):
+        """Unsaved listing row of ``page_content`` and its ``version``"""
+        listing = cls(
+            page_content=page_content,
+            page=page_content.page,
+            site_id=page_content.page.node.site_id,
+            language=page_content.language,
+            title=page_content.title,
+            path=page_content._path or "",
+            is_home=page_content.page.is_home,
+            template=page_content.template,
+        )
+        if version is None:
+            return listing
+        lock = getattr(version, "versionlock", None)
+        expiry = getattr(version, "contentexpiry", None)
+        listing.state = version.state
+        listing.author_id = version.created_by_id
+        listing.modified = version.modified
+        listing.lock_owner_id = lock.created_by_id if lock else None
+        if expiry is not None:
+            listing.expires = expiry.expires
+            listing.compliance_number = expiry.compliance_number or ""
+        return listing
+
+
+class ExportJobQuerySet(models.QuerySet):
+
+    def _running_since(self):
+        return timezone.now() - timedelta(seconds=conf.EXPORT_JOB_TIMEOUT)
+
+    def active(self):
+        """Jobs waiting for or being processed by the worker"""
+        return self.filter(
+            Q(status=ExportJob.PENDING)
+            | Q(status=ExportJob.RUNNING, started__gte=self._running_since())
+        )
+
+    def stale(self):
+        """Jobs running for more than EXPORT_JOB_TIMEOUT seconds, whose
+        worker died or was killed
+        """
+        return self.filter(status=ExportJob.RUNNING, started__lt=self._running_since())
+
+    def finished(self):
+        return self.filter(status__in=[ExportJob.DONE, ExportJob.FAILED])
+
+    def expired(self):
+        """Jobs created more than the retention period of the artifacts ago"""
+        return self.filter(
+            created__lt=timezone.now() - timedelta(days=conf.EXPORT_JOB_RETENTION_DAYS)
+        )
+
+    def claim(self, job):
+        """Marks the pending ``job`` as running, unless another worker did"""
+        return bool(
+            self.filter(pk=job.pk, status=ExportJob.PENDING).update(
+                status=ExportJob.RUNNING, started=timezone.now()
+            )
+        )
+
+
+class ExportJob(models.Model):
+    """
+    Export of the changelist of a site requested from the admin and
+    generated into the default storage by the ``pageadmin_export_jobs``
+    worker command.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = (
+        (PENDING, _("Pending")),
+        (RUNNING, _("Running")),
+        (DONE, _("Done")),
+        (FAILED, _("Failed")),
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    site = models.ForeignKey(Site, on_delete=models.CASCADE, related_name="+")
+    export_format = models.CharField(_("format"), max_length=10)
+    params = models.JSONField(_("parameters"), default=dict, blank=True)
+    status = models.CharField(
+        _("status"), max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    file = models.FileField(_("file"), upload_to="djangocms_pageadmin/exports/", blank=True)
+    rows = models.PositiveIntegerField(_("rows"), null=True)
+    error = models.TextField(_("error"), blank=True)
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+    started = models.DateTimeField(_("started"), null=True)
+    finished = models.DateTimeField(_("finished"), null=True)
+    notified = models.BooleanField(_("notified"), default=False)
+
+    objects = ExportJobQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("export job")
+        verbose_name_plural = _("export jobs")
+        indexes = [
+            models.Index(fields=["user", "status"], name="pageadmin_exportjob_user_idx"),
+            models.Index(fields=["status", "created"], name="pageadmin_exportjob_status_idx"),
+        ]
+
+    def __str__(self):
+        return "{} export of {} ({})".format(self.export_format, self.site, self.get_status_display())
+
+
+class PendingDuplicateQuerySet(models.QuerySet):
+
+    def stale(self, age):
+        """Duplicates started more than the ``age`` timedelta ago"""
+        return self.filter(started__lt=timezone.now() - age)
+
+
+class PendingDuplicate(models.Model):
+    """
+    Page created by a duplicate whose content is copied in batches, until
+    the copy completes. A page still pending long after it was started was
+    left behind by a request that didn't finish, the
+    ``pageadmin_cleanup_duplicates`` command deletes it.
+    """
+    page = models.OneToOneField(
+        Page,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+    )
+    started = models.DateTimeField(_("started"), auto_now_add=True)
+
+    objects = PendingDuplicateQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("pending duplicate")
+        verbose_name_plural = _("pending duplicates")
+
+    def __str__(self):
+        return str(self.page)
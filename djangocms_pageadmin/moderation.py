@@ -0,0 +1,220 @@
+from django import forms
+from django.apps import apps
+from django.contrib import messages
+from django.contrib.admin.views.main import PAGE_VAR
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models import Q
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.utils.translation import gettext_lazy as _, ngettext
+
+from cms.models import PageContent
+
+from djangocms_moderation.admin_actions import (
+    add_items_to_collection as moderation_add_items_to_collection,
+)
+from djangocms_moderation.forms import CollectionItemsForm
+from djangocms_moderation.models import (
+    ModerationRequest,
+    ModerationRequestTreeNode,
+)
+from djangocms_moderation.views import CollectionItemsView
+from djangocms_versioning.models import Version
+
+from .helpers import get_export_request, get_request_context
+
+
+# Session key of the page contents selected for a moderation collection
+COLLECTION_SELECTION_SESSION_KEY = "_pageadmin_collection_selection"
+
+
+def _get_versions(contents):
+    return Version.objects.filter(
+        content_type=ContentType.objects.get_for_model(PageContent),
+        object_id__in=contents.values("pk"),
+    )
+
+
+def add_items_to_collection(modeladmin, request, queryset):
+    """
+    Action to add the selected page contents to a moderation collection,
+    using the batched add to collection view of the admin.
+
+    The selection is kept in the session, as the filters of the changelist
+    when all its pages are selected, since it doesn't fit in a url.
+    """
+    referer = request.META.get("HTTP_REFERER", "")
+    if not _get_versions(queryset).exists():
+        modeladmin.message_user(
+            request, _("No suitable items found to add to moderation collection")
+        )
+        return HttpResponseRedirect(referer)
+
+    if request.POST.get("select_across") == "1":
+        selection = {
+            "site": get_request_context(request).site.pk,
+            "params": {key: value for key, value in request.GET.items() if key != PAGE_VAR},
+        }
+    else:
+        selection = {"ids": list(queryset.values_list("pk", flat=True))}
+    request.session[COLLECTION_SELECTION_SESSION_KEY] = selection
+
+    info = modeladmin.model._meta.app_label, modeladmin.model._meta.model_name
+    url = "{}?{}".format(
+        reverse("admin:{}_{}_add_to_collection".format(*info)),
+        urlencode({"return_to_url": referer}),
+    )
+    return HttpResponseRedirect(url)
+
+
+def get_selected_versions(model_admin, request):
+    """The versions of the page contents selected by
+    ``add_items_to_collection`` in the session of ``request``
+    """
+    selection = request.session.get(COLLECTION_SELECTION_SESSION_KEY) or {}
+    if "params" in selection:
+        export_request = get_export_request(
+            Site.objects.get(pk=selection["site"]), selection["params"], request.user
+        )
+        # The versions are written to the default database
+        get_request_context(export_request).database = None
+        contents = model_admin.get_exported_queryset(export_request)
+    else:
+        contents = PageContent._base_manager.filter(pk__in=selection.get("ids", []))
+    return _get_versions(contents)
+
+
+add_items_to_collection.short_description = moderation_add_items_to_collection.short_description
+
+
+def add_versions_to_collection(collection, versions, user):
+    """
+    Adds ``versions`` to ``collection`` the way ModerationCollection.add_version
+    does for each of them, with the moderation requests inserted in bulk.
+
+    Moderated children of the pages the user created are added as well.
+
+    :returns: the number of added items
+    """
+    versions = list(versions)
+    moderation_requests = collection.moderation_requests.filter(
+        version__in=versions, author=collection.author
+    )
+    page_content_type = ContentType.objects.get_for_model(PageContent)
+
+    with transaction.atomic():
+        existing = set(moderation_requests.values_list("version_id", flat=True))
+        ModerationRequest.objects.bulk_create([
+            ModerationRequest(collection=collection, version=version, author=collection.author)
+            for version in versions if version.pk not in existing
+        ])
+        added_items = len(versions) - len(existing)
+
+        requests_by_version = {
+            moderation_request.version_id: moderation_request
+            for moderation_request in moderation_requests
+        }
+        root_nodes = {
+            node.moderation_request_id: node
+            for node in ModerationRequestTreeNode.get_root_nodes().filter(
+                moderation_request__in=requests_by_version.values()
+            )
+        }
+        for version in versions:
+            moderation_request = requests_by_version[version.pk]
+            # The children are added under the existing root node
+            node = root_nodes.get(moderation_request.pk)
+            if node is None:
+                node = ModerationRequestTreeNode.add_root(moderation_request=moderation_request)
+            if version.content_type_id == page_content_type.pk and version.created_by_id == user.pk:
+                added_items += collection._add_nested_children(version, node)
+    return added_items
+
+
+class CollectionItemsBulkForm(CollectionItemsForm):
+    """
+    Collection form checking the versions in bulk. With ``versions``, they
+    are the selection of the changelist instead of a field of the form.
+    """
+
+    def __init__(self, user, *args, versions=None, **kwargs):
+        super().__init__(user, *args, **kwargs)
+        self.versions = versions
+        if versions is not None:
+            del self.fields["versions"]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.versions is not None:
+            cleaned_data["versions"] = self._get_eligible_versions(self.versions)
+        return cleaned_data
+
+    def clean_versions(self):
+        return self._get_eligible_versions(self.cleaned_data["versions"])
+
+    def _get_eligible_versions(self, versions):
+        """
+        Keeps the versions that are moderated, not part of an active
+        moderation request and not locked by another user, checking all of
+        them with one query.
+        """
+        moderated_models = apps.get_app_config("djangocms_moderation").cms_extension.moderated_models
+        eligible_versions = (
+            versions.filter(
+                content_type__in=ContentType.objects.get_for_models(*moderated_models).values(),
+            )
+            .filter(Q(versionlock__isnull=True) | Q(versionlock__created_by=self.user))
+            .exclude(pk__in=ModerationRequest.objects.filter(is_active=True).values("version_id"))
+            .order_by("pk")
+        )
+        if not eligible_versions.exists():
+            raise forms.ValidationError(
+                ngettext(
+                    "Your item is either locked, not enabled for moderation,"
+                    "or is part of another active moderation request",
+                    "Your items are either locked, not enabled for moderation,"
+                    "or are part of another active moderation request",
+                    versions.count(),
+                )
+            )
+        return eligible_versions
+
+
+class CollectionItemsBulkView(CollectionItemsView):
+    form_class = CollectionItemsBulkForm
+    model_admin = None
+
+    def get_versions(self):
+        if not hasattr(self, "_versions"):
+            self._versions = get_selected_versions(self.model_admin, self.request)
+        return self._versions
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs["versions"] = self.get_versions()
+        return kwargs
+
+    def get_initial(self):
+        initial = super().get_initial()
+        # The template only tells a single item from several
+        initial["versions"] = list(self.get_versions()[:2])
+        return initial
+
+    def form_valid(self, form):
+        total_added = add_versions_to_collection(
+            form.cleaned_data["collection"], form.cleaned_data["versions"], self.request.user
+        )
+        self.request.session.pop(COLLECTION_SELECTION_SESSION_KEY, None)
+        messages.success(
+            self.request,
+            ngettext(
+                "%(count)d item successfully added to moderation collection",
+                "%(count)d items successfully added to moderation collection",
+                total_added,
+            )
+            % {"count": total_added},
+        )
+        return self._get_success_redirect()
@@ -0,0 +1,74 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+
+
+class PageContentRow:
+    """
+    Read-only row of the columns of a page content shown by the changelist
+    and the export, built from ``values_list()`` instead of a model
+    instance with its prefetched versions.
+
+    ``instance`` loads the page content when something needs the model.
+    """
+    __slots__ = (
+        "pk",
+        "title",
+        "language",
+        "path",
+        "is_home",
+        "state",
+        "author",
+        "modified",
+        "expires",
+        "compliance_number",
+        "_model",
+        "_instance",
+    )
+
+    def __init__(self, model, pk, title, language, path, is_home, state, author, modified,
+                 expires=None, compliance_number=None):
+        self.pk = pk
+        self.title = title
+        self.language = language
+        self.path = path
+        self.is_home = is_home
+        self.state = state
+        self.author = author
+        self.modified = modified
+        self.expires = expires
+        self.compliance_number = compliance_number
+        self._model = model
+        self._instance = None
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._instance = self._model._base_manager.get(pk=self.pk)
+        return self._instance
+
+    @classmethod
+    def get_fields(cls):
+        """Lookups of the page content queryset fetched for each row"""
+        fields = [
+            "pk",
+            "title",
+            "language",
+            "_path",
+            "page__is_home",
+            "versions__state",
+            "versions__created_by__{}".format(get_user_model().USERNAME_FIELD),
+            "versions__modified",
+        ]
+        if apps.is_installed("djangocms_content_expiry"):
+            fields += [
+                "versions__contentexpiry__expires",
+                "versions__contentexpiry__compliance_number",
+            ]
+        return fields
+
+    @classmethod
+    def from_queryset(cls, queryset, chunk_size=2000):
+        """Iterates over the rows of a page content queryset"""
+        values = queryset.prefetch_related(None).values_list(*cls.get_fields())
+        for row in values.iterator(chunk_size=chunk_size):
+            yield cls(queryset.model, *row)
@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+
+# Sent when a heavy operation of the page admin is refused because the site
+# or the user already run as many of them as allowed. Arguments: operation,
+# scope ("site" or "user") and request.
+concurrency_limit_reached = Signal()
@@ -0,0 +1,62 @@
+"use strict";
+
+(function () {
+  var DELAY = 300;
+
+  document.addEventListener('DOMContentLoaded', function () {
+    var form = document.querySelector('.js-page-admin-duplicate-form');
+
+    if (!form) {
+      return;
+    }
+
+    var slugInput = form.querySelector('input[name="slug"]');
+    var siteInput = form.querySelector('select[name="site"]');
+    var checkUrl = form.getAttribute('data-check-slug-url');
+    var timeout;
+
+    if (!slugInput || !siteInput || !checkUrl) {
+      return;
+    }
+
+    /* status line shown below the slug field */
+    var status = document.createElement('P');
+    status.className = 'help cms-page-admin-slug-status';
+    slugInput.parentNode.appendChild(status);
+
+    var check = function check() {
+      var url = checkUrl + '?slug=' + encodeURIComponent(slugInput.value) +
+        '&site=' + encodeURIComponent(siteInput.value);
+
+      fetch(url, { credentials: 'same-origin' })
+        .then(function (response) {
+          return response.ok ? response.json() : null;
+        })
+        .then(function (data) {
+          status.textContent = '';
+          if (!data || data.available || !data.suggestion) {
+            return;
+          }
+          /* offer the free slug, clicking it fills in the field */
+          var suggestion = document.createElement('A');
+          suggestion.href = '#';
+          suggestion.textContent = data.suggestion;
+          suggestion.addEventListener('click', function (event) {
+            event.preventDefault();
+            slugInput.value = data.suggestion;
+            status.textContent = '';
+          });
+          status.appendChild(document.createTextNode('✗ '));
+          status.appendChild(suggestion);
+        });
+    };
+
+    var scheduleCheck = function scheduleCheck() {
+      clearTimeout(timeout);
+      timeout = setTimeout(check, DELAY);
+    };
+
+    slugInput.addEventListener('input', scheduleCheck);
+    siteInput.addEventListener('change', scheduleCheck);
+  });
+})();
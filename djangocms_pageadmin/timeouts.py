@@ -0,0 +1,127 @@
+import logging
+import time
+from contextlib import contextmanager
+
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    OperationalError,
+    connections,
+    transaction,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE of the statements postgres cancelled
+QUERY_CANCELED = "57014"
+# Number of virtual machine instructions between the checks of the SQLite
+# progress handler
+SQLITE_PROGRESS_STEPS = 1000
+
+
+class StatementTimeout(Exception):
+
+    def __init__(self, seconds, sql):
+        super().__init__(seconds, sql)
+        self.seconds = seconds
+        self.sql = sql
+
+
+class _LastQuery:
+    """Execute wrapper keeping the SQL of the last statement, without its
+    parameters, for the log of a timeout.
+    """
+
+    def __init__(self):
+        self.sql = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.sql = sql
+        return execute(sql, params, many, context)
+
+
+def _is_query_canceled(error):
+    cause = error.__cause__
+    # psycopg2 and psycopg 3
+    return QUERY_CANCELED in (getattr(cause, "pgcode", None), getattr(cause, "sqlstate", None))
+
+
+@contextmanager
+def _postgresql_timeout(connection, seconds):
+    # SET LOCAL only lasts until the end of the transaction
+    nested = connection.in_atomic_block
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                if nested:
+                    # The timeout of the outer transaction, which may have
+                    # one of its own
+                    cursor.execute("SHOW statement_timeout")
+                    previous = cursor.fetchone()[0]
+                cursor.execute("SET LOCAL statement_timeout = %s", [int(seconds * 1000)])
+            yield
+            if nested:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT set_config('statement_timeout', %s, true)", [previous])
+    except OperationalError as error:
+        if _is_query_canceled(error):
+            raise StatementTimeout(seconds, None) from error
+        raise
+
+
+@contextmanager
+def _sqlite_timeout(connection, seconds):
+    deadline = time.monotonic() + seconds
+    timed_out = False
+
+    def progress():
+        nonlocal timed_out
+        timed_out = time.monotonic() > deadline
+        # A true value interrupts the running statement
+        return timed_out
+
+    connection.ensure_connection()
+    connection.connection.set_progress_handler(progress, SQLITE_PROGRESS_STEPS)
+    try:
+        yield
+    except OperationalError as error:
+        if timed_out:
+            raise StatementTimeout(seconds, None) from error
+        raise
+    finally:
+        connection.connection.set_progress_handler(None, SQLITE_PROGRESS_STEPS)
+
+
+@contextmanager
+def statement_timeout(seconds, using=None, label=None):
+    """
+    Cancels the statements of the database ``using`` that run longer than
+    ``seconds`` in the block and raises StatementTimeout instead. Postgres
+    and SQLite are supported, there is no limit on other databases or
+    without ``seconds``.
+
+    Timeouts are logged with ``label`` and the SQL of the cancelled
+    statement, without its parameters.
+    """
+    connection = connections[using or DEFAULT_DB_ALIAS]
+    if connection.vendor == "postgresql":
+        timeout = _postgresql_timeout
+    elif connection.vendor == "sqlite":
+        timeout = _sqlite_timeout
+    else:
+        timeout = None
+    if not seconds or timeout is None:
+        yield
+        return
+
+    last_query = _LastQuery()
+    try:
+        with connection.execute_wrapper(last_query), timeout(connection, seconds):
+            yield
+    except StatementTimeout as error:
+        error.sql = last_query.sql
+        logger.warning(
+            "Statement cancelled after %s seconds in %s: %s",
+            seconds, label or "page admin", last_query.sql,
+        )
+        raise
@@ -1,29 +1,48 @@
 import datetime
+import gzip
+import io
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from unittest import skip
+from unittest import skip, skipUnless
 from unittest.mock import MagicMock, patch
 
 from django.contrib import admin
 from django.contrib.sites.models import Site
-from django.test import TestCase, TransactionTestCase
-from django.test.utils import override_settings
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Model
+from django.test import Client, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
 
 from cms.api import add_plugin
-from cms.models import PageContent, PageUrl
+from cms.models import Page, PageContent, PageUrl
 from cms.test_utils.testcases import CMSTestCase
 from cms.toolbar.utils import get_object_preview_url
 from cms.utils.conf import get_cms_setting
 from cms.utils.plugins import downcast_plugins
 
 from bs4 import BeautifulSoup
-from djangocms_moderation.admin_actions import add_items_to_collection
-from djangocms_versioning.constants import ARCHIVED, PUBLISHED
+from djangocms_version_locking.models import VersionLock
+from djangocms_versioning.conditions import Conditions
+from djangocms_versioning.constants import (
+    ARCHIVED,
+    DRAFT,
+    PUBLISHED,
+    UNPUBLISHED,
+)
+from djangocms_versioning.exceptions import ConditionFailed
 from djangocms_versioning.helpers import version_list_url
 from djangocms_versioning.models import Version
 
 from djangocms_pageadmin.admin import PageContentAdmin
+from djangocms_pageadmin.filters import AuthorFilter
+from djangocms_pageadmin.models import PendingDuplicate
+from djangocms_pageadmin.moderation import add_items_to_collection
 from djangocms_pageadmin.test_utils.factories import (
     PageContentWithVersionFactory,
     PageUrlFactory,
@@ -302,16 +321,50 @@ class SetHomeViewTestCase(CMSTestCase):
         PageVersionFactory(
             content__page__node__depth=1, content__page__is_home=1, state=PUBLISHED
         )
-        version = PageVersionFactory(content__page__node__depth=1, state=PUBLISHED)
+        version = PageVersionFactory(
+            content__page__node__depth=1,
+            content__page__application_urls="SampleApp",
+            content__language="en",
+            state=PUBLISHED,
+        )
         to_be_homepage = version.content
+        PageUrlFactory(
+            page=to_be_homepage.page, language="en", slug="foo", path="foo", managed=True
+        )
         with self.login_user_context(self.get_superuser()), patch(
-            "cms.models.query.PageQuerySet.has_apphooks", return_value=True
-        ), patch("djangocms_pageadmin.admin.set_restart_trigger") as mock_handler:
+            "djangocms_pageadmin.admin.set_restart_trigger"
+        ) as mock_handler:
             self.client.post(
                 self.get_admin_url(PageContent, "set_home_content", to_be_homepage.pk)
             )
             mock_handler.assert_called_once_with()
 
+    def test_when_apphook_urls_are_unchanged_shouldnt_trigger_signal(self):
+        PageVersionFactory(
+            content__page__node__depth=1, content__page__is_home=1, state=PUBLISHED
+        )
+        version = PageVersionFactory(
+            content__page__node__depth=1,
+            content__page__application_urls="SampleApp",
+            content__language="en",
+            state=PUBLISHED,
+        )
+        to_be_homepage = version.content
+        # Unmanaged urls keep their path when the home page changes
+        PageUrlFactory(
+            page=to_be_homepage.page, language="en", slug="foo", path="foo", managed=False
+        )
+        with self.login_user_context(self.get_superuser()), patch(
+            "djangocms_pageadmin.admin.set_restart_trigger"
+        ) as mock_handler:
+            self.client.post(
+                self.get_admin_url(PageContent, "set_home_content", to_be_homepage.pk)
+            )
+
+        to_be_homepage.page.refresh_from_db()
+        self.assertTrue(to_be_homepage.page.is_home)
+        mock_handler.assert_not_called()
+
     def test_when_old_homepage_tree_has_no_apphooks_shouldnt_trigger_signal(self):
         PageVersionFactory(
             content__page__node__depth=1, content__page__is_home=1, state=PUBLISHED
@@ -320,15 +373,39 @@ class SetHomeViewTestCase(CMSTestCase):
         to_be_homepage = version.content
         with self.login_user_context(self.get_superuser()), patch(
             "djangocms_pageadmin.admin.set_restart_trigger"
-        ) as mock_handler, patch(
-            "cms.models.query.PageQuerySet.has_apphooks", return_value=False
-        ):
+        ) as mock_handler:
             self.client.post(
                 self.get_admin_url(PageContent, "set_home_content", to_be_homepage.pk)
             )
 
             mock_handler.assert_not_called()
 
+    def test_page_already_home_is_left_untouched(self):
+        version = PageVersionFactory(
+            content__page__node__depth=1, content__page__is_home=True, state=PUBLISHED
+        )
+        pagecontent = version.content
+        with self.login_user_context(self.get_superuser()), patch(
+            "cms.models.pagemodel.Page.set_as_homepage"
+        ) as mock_set_as_homepage:
+            response = self.client.post(
+                self.get_admin_url(PageContent, "set_home_content", pagecontent.pk)
+            )
+
+        self.assertEqual(response.status_code, 302)
+        mock_set_as_homepage.assert_not_called()
+
+    def test_page_made_home_while_waiting_for_the_lock_is_left_untouched(self):
+        version = PageVersionFactory(content__page__node__depth=1, state=PUBLISHED)
+        page = version.content.page
+        # A concurrent request made the page home after this one loaded it
+        Page.objects.filter(pk=page.pk).update(is_home=True)
+
+        with patch("cms.models.pagemodel.Page.set_as_homepage") as mock_set_as_homepage:
+            admin.site._registry[PageContent]._set_as_homepage(page, self.get_superuser())
+
+        mock_set_as_homepage.assert_not_called()
+
     def test_when_old_home_tree_is_none_should_not_trigger_signal(self):
         version = PageVersionFactory(content__page__node__depth=1, state=PUBLISHED)
         pagecontent = version.content
@@ -359,9 +436,9 @@ class SetHomeViewTransactionTestCase(TransactionTestCase):
         # Asserting to make sure page is not set as homepage
         self.assertFalse(page_content.page.is_home)
 
-        # Patching has_apphooks which is get called after setting home on view so transaction
-        # should roll back in event of error
-        with patch("cms.models.query.PageQuerySet.has_apphooks", side_effect=FakeError):
+        # Patching _get_apphook_urls which is called again after setting home on view so
+        # transaction should roll back in event of error
+        with patch.object(PageContentAdmin, "_get_apphook_urls", side_effect=[{}, FakeError]):
             try:
                 self.client.post(
                     reverse(
@@ -376,6 +453,143 @@ class SetHomeViewTransactionTestCase(TransactionTestCase):
         self.assertFalse(page_content.page.is_home)
 
 
+# Runs on the databases with row locks, like the postgres tox environment
+@skipUnless(connection.features.has_select_for_update, "The database doesn't support row locks")
+class SetHomeViewConcurrencyTestCase(TransactionTestCase):
+    def setUp(self):
+        self.user = UserFactory(is_staff=True, is_superuser=True)
+
+    def _set_home(self, page_content):
+        client = Client()
+        client.force_login(self.user)
+        try:
+            return client.post(
+                reverse("admin:cms_pagecontent_set_home_content", args=[page_content.pk])
+            ).status_code
+        finally:
+            connection.close()
+
+    def test_parallel_requests_leave_a_single_home_page(self):
+        site = Site.objects.first()
+        page_contents = [
+            PageVersionFactory(
+                content__page__node__depth=1,
+                content__page__node__site=site,
+                state=PUBLISHED,
+            ).content
+            for _ in range(4)
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(page_contents)) as executor:
+            status_codes = list(executor.map(self._set_home, page_contents * 2))
+
+        self.assertEqual(set(status_codes), {302})
+        self.assertEqual(
+            PageContent._base_manager.filter(
+                page__is_home=True, page__node__site=site
+            ).count(),
+            1,
+        )
+
+
+class DuplicateViewTransactionTestCase(TransactionTestCase):
+    def setUp(self):
+        self.user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+
+    def test_failed_content_copy_removes_the_new_page(self):
+        class FakeError(Exception):
+            pass
+
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+        PlaceholderFactory(slot="content", source=pagecontent)
+
+        with patch.object(PageContentAdmin, "_copy_placeholders", side_effect=FakeError):
+            with self.assertRaises(FakeError):
+                self.client.post(
+                    reverse("admin:cms_pagecontent_duplicate", args=[pagecontent.pk]),
+                    data={"site": Site.objects.first().pk, "slug": "foo"},
+                )
+
+        self.assertEqual(PageContent._base_manager.count(), 1)
+        self.assertFalse(PageUrl.objects.filter(slug="foo").exists())
+
+    @patch("djangocms_pageadmin.conf.DUPLICATE_BATCH_THRESHOLD", -1)
+    def test_failed_batched_copy_removes_the_new_page(self):
+        class FakeError(Exception):
+            pass
+
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+        PlaceholderFactory(slot="content", source=pagecontent)
+
+        with patch.object(PageContentAdmin, "_copy_placeholders", side_effect=FakeError):
+            with self.assertRaises(FakeError):
+                self.client.post(
+                    reverse("admin:cms_pagecontent_duplicate", args=[pagecontent.pk]),
+                    data={"site": Site.objects.first().pk, "slug": "foo"},
+                )
+
+        self.assertEqual(PageContent._base_manager.count(), 1)
+        self.assertFalse(PendingDuplicate.objects.exists())
+
+    def test_small_page_is_copied_in_the_transaction_of_the_page(self):
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+
+        def assert_in_transaction(obj, new_page_content, batched=False):
+            self.assertFalse(batched)
+            self.assertTrue(transaction.get_connection().in_atomic_block)
+
+        with patch.object(
+            PageContentAdmin, "_copy_duplicate_content", side_effect=assert_in_transaction
+        ) as mock_copy:
+            self.client.post(
+                reverse("admin:cms_pagecontent_duplicate", args=[pagecontent.pk]),
+                data={"site": Site.objects.first().pk, "slug": "foo"},
+            )
+
+        mock_copy.assert_called_once()
+        self.assertFalse(PendingDuplicate.objects.exists())
+
+    @patch("djangocms_pageadmin.conf.DUPLICATE_BATCH_THRESHOLD", -1)
+    def test_large_page_is_copied_after_the_page_is_committed(self):
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+
+        def assert_page_committed(obj, new_page_content, batched=False):
+            # Another connection would see the new page while the content is
+            # copied, recorded as pending until the copy completes
+            self.assertTrue(PageContent._base_manager.filter(pk=new_page_content.pk).exists())
+            self.assertTrue(PendingDuplicate.objects.filter(page=new_page_content.page).exists())
+            self.assertFalse(transaction.get_connection().in_atomic_block)
+
+        with patch.object(
+            PageContentAdmin, "_copy_duplicate_content", side_effect=assert_page_committed
+        ) as mock_copy:
+            self.client.post(
+                reverse("admin:cms_pagecontent_duplicate", args=[pagecontent.pk]),
+                data={"site": Site.objects.first().pk, "slug": "foo"},
+            )
+
+        mock_copy.assert_called_once()
+        self.assertFalse(PendingDuplicate.objects.exists())
+
+
+class CleanupDuplicatesCommandTestCase(CMSTestCase):
+    def test_interrupted_duplicates_are_deleted(self):
+        interrupted = PageContentWithVersionFactory()
+        running = PageContentWithVersionFactory()
+        PendingDuplicate.objects.create(page=interrupted.page)
+        PendingDuplicate.objects.create(page=running.page)
+        PendingDuplicate.objects.filter(page=interrupted.page).update(
+            started=timezone.now() - datetime.timedelta(hours=2)
+        )
+
+        call_command("pageadmin_cleanup_duplicates", stdout=io.StringIO())
+
+        self.assertFalse(Page.objects.filter(pk=interrupted.page.pk).exists())
+        self.assertTrue(Page.objects.filter(pk=running.page.pk).exists())
+        self.assertEqual(list(PendingDuplicate.objects.values_list("page", flat=True)), [running.page.pk])
+
+
 class DuplicateViewTestCase(CMSTestCase):
     def test_obj_does_not_exist(self):
         with self.login_user_context(self.get_superuser()), patch(
@@ -457,6 +671,77 @@ class DuplicateViewTestCase(CMSTestCase):
         self.assertEqual(new_plugins[0].plugin_type, "TextPlugin")
         self.assertEqual(new_plugins[0].body, "Test text")
 
+    def test_get_suggests_unique_slug(self):
+        pagecontent = PageContentWithVersionFactory(language="en")
+        PageUrl.objects.create(
+            slug="foo", path="foo", language="en", page=pagecontent.page,
+        )
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(
+                self.get_admin_url(PageContent, "duplicate", pagecontent.pk)
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["form"].initial["slug"], "foo-2")
+
+    def test_get_shows_estimate(self):
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+        placeholder = PlaceholderFactory(slot="content", source=pagecontent)
+        add_plugin(placeholder, "TextPlugin", pagecontent.language, body="Test text")
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(
+                self.get_admin_url(PageContent, "duplicate", pagecontent.pk)
+            )
+        estimate = response.context["estimate"]
+        self.assertEqual(estimate["placeholders"], 1)
+        self.assertEqual(estimate["plugins"], 1)
+        self.assertEqual(estimate["extensions"], 0)
+        self.assertFalse(estimate["batched"])
+
+    @patch("djangocms_pageadmin.conf.DUPLICATE_BATCH_THRESHOLD", 0)
+    def test_post_large_page_is_copied_in_batches(self):
+        pagecontent = PageContentWithVersionFactory(template="page.html")
+        placeholder = PlaceholderFactory(slot="content", source=pagecontent)
+        add_plugin(placeholder, "TextPlugin", pagecontent.language, body="Test text")
+        with self.login_user_context(self.get_superuser()), patch.object(
+            PageContentAdmin, "_copy_placeholders", autospec=True,
+            side_effect=PageContentAdmin._copy_placeholders,
+        ) as mock_copy:
+            self.client.post(
+                self.get_admin_url(PageContent, "duplicate", pagecontent.pk),
+                data={"site": Site.objects.first().pk, "slug": "foo bar"},
+            )
+        self.assertTrue(mock_copy.call_args[1]["batched"])
+        new_pagecontent = PageContent._base_manager.latest("pk")
+        new_placeholder = new_pagecontent.placeholders.get(slot="content")
+        self.assertEqual(len(new_placeholder.get_plugins_list()), 1)
+
+    def test_check_slug(self):
+        pagecontent = PageContentWithVersionFactory(language="en")
+        PageUrl.objects.create(
+            slug="foo", path="foo", language="en", page=pagecontent.page,
+        )
+        url = self.get_admin_url(PageContent, "duplicate_check_slug", pagecontent.pk)
+        site = Site.objects.first()
+        with self.login_user_context(self.get_superuser()):
+            taken = self.client.get(url, data={"slug": "foo", "site": site.pk})
+            free = self.client.get(url, data={"slug": "Foo Bar", "site": site.pk})
+
+        self.assertEqual(taken.status_code, 200)
+        self.assertEqual(
+            taken.json(), {"slug": "foo", "available": False, "suggestion": "foo-2"}
+        )
+        self.assertEqual(
+            free.json(), {"slug": "foo-bar", "available": True, "suggestion": "foo-bar"}
+        )
+
+    def test_check_slug_invalid_site(self):
+        pagecontent = PageContentWithVersionFactory()
+        url = self.get_admin_url(PageContent, "duplicate_check_slug", pagecontent.pk)
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(url, data={"slug": "foo", "site": "bar"})
+
+        self.assertEqual(response.status_code, 400)
+
     def test_post_with_parent(self):
         pagecontent1 = PageContentWithVersionFactory(
             template="page.html",
@@ -764,7 +1049,7 @@ class PageAdminCsvExportFileTestCase(CMSTestCase):
         with self.login_user_context(self.get_superuser()):
             response = self.client.get(self.export_admin_endpoint)
 
-        csv_headings = response.content.decode().splitlines()[0].split(",")
+        csv_headings = response.getvalue().decode().splitlines()[0].split(",")
 
         self.assertEqual(response.status_code, 200)
 
@@ -805,7 +1090,7 @@ class PageAdminCsvExportFileTestCase(CMSTestCase):
 
         self.assertEqual(response.status_code, 200)
 
-        csv_lines = response.content.decode().splitlines()
+        csv_lines = response.getvalue().decode().splitlines()
 
         content_row_1 = csv_lines[1].split(",")
 
@@ -906,6 +1191,21 @@ class TestPageContentAdminActions(CMSTestCase):
             )
         })
 
+    @patch("djangocms_pageadmin.admin.is_moderation_enabled")
+    def test_get_actions_for_user_with_change_permission(self, is_moderation_enabled):
+        """
+        Users that can change pages get the bulk publish and unpublish actions.
+        """
+        is_moderation_enabled.return_value = False
+        pagecontent_admin = PageContentAdmin(PageContent, admin.AdminSite())
+        request = self.get_request('/')
+        request.user = self.get_superuser()
+
+        actions = pagecontent_admin.get_actions(request)
+
+        self.assertIn("publish_selected", actions)
+        self.assertIn("unpublish_selected", actions)
+
     @patch("djangocms_pageadmin.admin.is_moderation_enabled")
     def test_get_actions_when_moderation_not_enabled(self, is_moderation_enabled):
         """
@@ -921,3 +1221,516 @@ class TestPageContentAdminActions(CMSTestCase):
         is_moderation_enabled.assert_called_once()
         self.assertNotIn("add_items_to_collection", actions)
         self.assertEqual(actions, {})
+
+
+class BulkStateActionsTestCase(CMSTestCase):
+    def setUp(self):
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+
+    def _post_action(self, action, versions):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.post(self.changelist_url, {
+                "action": action,
+                "_selected_action": [version.content.pk for version in versions],
+            })
+
+    def test_publish_selected(self):
+        versions = PageVersionFactory.create_batch(3, content__language="en")
+
+        response = self._post_action("publish_selected", versions)
+
+        self.assertRedirects(response, self.changelist_url)
+        self.assertEqual(
+            set(Version.objects.filter(pk__in=[v.pk for v in versions]).values_list("state", flat=True)),
+            {PUBLISHED},
+        )
+
+    def test_publish_selected_skips_versions_not_in_draft(self):
+        draft = PageVersionFactory(content__language="en")
+        published = PageVersionFactory(content__language="en", state=PUBLISHED)
+
+        response = self._post_action("publish_selected", [draft, published])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "djangocms_pageadmin/admin/bulk_action_summary.html")
+        self.assertEqual(response.context["changed"], 1)
+        self.assertEqual(
+            response.context["skipped"],
+            [(published.content.title, "Version is not in draft state")],
+        )
+        draft.refresh_from_db()
+        self.assertEqual(draft.state, PUBLISHED)
+
+    def test_unpublish_selected(self):
+        versions = PageVersionFactory.create_batch(2, content__language="en", state=PUBLISHED)
+
+        response = self._post_action("unpublish_selected", versions)
+
+        self.assertRedirects(response, self.changelist_url)
+        for version in versions:
+            version.refresh_from_db()
+            self.assertEqual(version.state, "unpublished")
+
+    def test_unpublish_selected_skips_pages_with_a_draft_locked_by_another_user(self):
+        published = PageVersionFactory(content__language="en", state=PUBLISHED)
+        draft = PageVersionFactory(
+            content__page=published.content.page, content__language="en", state=DRAFT
+        )
+        VersionLock.objects.create(version=draft, created_by=UserFactory())
+
+        response = self._post_action("unpublish_selected", [published])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["changed"], 0)
+        self.assertEqual(
+            response.context["skipped"],
+            [(published.content.title, "Version is locked by another user")],
+        )
+        published.refresh_from_db()
+        self.assertEqual(published.state, PUBLISHED)
+
+    def test_publish_selected_skips_versions_failing_the_versioning_conditions(self):
+        def in_active_moderation(version, user):
+            if version.pk == moderated.pk:
+                raise ConditionFailed("Version is in moderation")
+
+        moderated = PageVersionFactory(content__language="en")
+        draft = PageVersionFactory(content__language="en")
+
+        with patch.object(
+            Version, "check_publish", Conditions(Version.check_publish + [in_active_moderation])
+        ):
+            response = self._post_action("publish_selected", [moderated, draft])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["changed"], 1)
+        self.assertEqual(
+            response.context["skipped"], [(moderated.content.title, "Version is in moderation")]
+        )
+        moderated.refresh_from_db()
+        self.assertEqual(moderated.state, DRAFT)
+
+    def test_unpublish_selected_checks_the_versioning_conditions(self):
+        def denied(version, user):
+            raise ConditionFailed("Denied")
+
+        published = PageVersionFactory(content__language="en", state=PUBLISHED)
+
+        with patch.object(Version, "check_unpublish", Conditions([denied])):
+            response = self._post_action("unpublish_selected", [published])
+
+        self.assertEqual(response.context["skipped"], [(published.content.title, "Denied")])
+        published.refresh_from_db()
+        self.assertEqual(published.state, PUBLISHED)
+
+    @patch("djangocms_pageadmin.conf.BULK_ACTION_CHUNK_SIZE", 2)
+    def test_state_changes_are_applied_in_chunks(self):
+        versions = PageVersionFactory.create_batch(5, content__language="en")
+
+        response = self._post_action("publish_selected", versions)
+
+        self.assertRedirects(response, self.changelist_url)
+        self.assertEqual(
+            Version.objects.filter(pk__in=[v.pk for v in versions], state=PUBLISHED).count(), 5
+        )
+
+    def test_select_across_applies_the_action_to_the_whole_changelist(self):
+        versions = PageVersionFactory.create_batch(3, content__language="en")
+
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.post(self.changelist_url, {
+                "action": "publish_selected",
+                "select_across": "1",
+                "_selected_action": [versions[0].content.pk],
+            })
+
+        self.assertRedirects(response, self.changelist_url)
+        self.assertEqual(
+            Version.objects.filter(pk__in=[v.pk for v in versions], state=PUBLISHED).count(), 3
+        )
+
+    def test_actions_receive_a_lean_queryset(self):
+        version = PageVersionFactory(content__language="en")
+
+        with patch.object(PageContentAdmin, "_change_selected_state", return_value=None) as mock:
+            self._post_action("publish_selected", [version])
+
+        queryset = mock.call_args[0][1]
+        self.assertEqual(
+            queryset.query.deferred_loading,
+            (frozenset(["pk", "page_id", "language", "title"]), False),
+        )
+        self.assertEqual(queryset.query.select_related, False)
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+        self.assertEqual(list(queryset), [version.content])
+
+
+class ConditionalGetTestCase(CMSTestCase):
+    def setUp(self):
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+        self.export_url = self.get_admin_url(PageContent, "export_csv")
+        self.superuser = self.get_superuser()
+        # Stays logged in, a new login starts a new session
+        self.client.force_login(self.superuser)
+
+    def test_unchanged_changelist_is_not_modified(self):
+        PageVersionFactory(content__language="en")
+        response = self.client.get(self.changelist_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("no-store", response["Cache-Control"])
+        response = self.client.get(self.changelist_url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_unchanged_export_is_not_modified(self):
+        PageVersionFactory(content__language="en")
+        response = self.client.get(self.export_url)
+
+        self.assertFalse(response.has_header("Last-Modified"))
+        response = self.client.get(self.export_url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_version_changes_the_etag(self):
+        PageVersionFactory(content__language="en")
+        etag = self.client.get(self.export_url)["ETag"]
+        PageVersionFactory(content__language="en")
+
+        response = self.client.get(self.export_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_title_change_changes_the_etag(self):
+        version = PageVersionFactory(content__language="en")
+        etag = self.client.get(self.export_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            version.content.title = "renamed"
+            version.content.save()
+        response = self.client.get(self.export_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_set_home_changes_the_etag(self):
+        version = PageVersionFactory(content__language="en", state=PUBLISHED)
+        etag = self.client.get(self.changelist_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.get_admin_url(PageContent, "set_home_content", version.content.pk)
+            )
+        response = self.client.get(self.changelist_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_depends_on_the_session(self):
+        PageVersionFactory(content__language="en")
+        etag = self.client.get(self.changelist_url)["ETag"]
+        self.client.logout()
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(self.changelist_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_depends_on_the_user(self):
+        PageVersionFactory(content__language="en")
+        etag = self.client.get(self.changelist_url)["ETag"]
+        other_user = self._create_user("other", is_staff=True, is_superuser=True)
+        self.client.force_login(other_user)
+
+        response = self.client.get(self.changelist_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+
+class ListingQuerysetTestCase(CMSTestCase):
+    def setUp(self):
+        PageVersionFactory.create_batch(3, content__language="en")
+        self.superuser = self.get_superuser()
+
+    def _get(self, name):
+        with self.login_user_context(self.superuser):
+            return self.client.get(self.get_admin_url(PageContent, name))
+
+    def test_unread_columns_are_deferred(self):
+        model_admin = admin.site._registry[PageContent]
+        request = self.get_request("/")
+        request.user = self.superuser
+
+        obj = model_admin.get_listing_queryset(request)[0]
+
+        self.assertTrue({"meta_description", "page_title", "menu_title"} <= obj.get_deferred_fields())
+        self.assertIn("creation_date", obj.page.get_deferred_fields())
+        self.assertIn("password", model_admin.get_version(obj).created_by.get_deferred_fields())
+
+    def test_changelist_does_not_load_deferred_fields(self):
+        with patch.object(Model, "refresh_from_db", side_effect=AssertionError("Deferred field loaded")):
+            response = self._get("changelist")
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_export_does_not_load_deferred_fields(self):
+        with patch.object(Model, "refresh_from_db", side_effect=AssertionError("Deferred field loaded")):
+            # The rows are only read when the response is streamed
+            content = self._get("export_csv").getvalue()
+
+        self.assertEqual(len(content.decode().splitlines()), 4)
+
+
+class ValuesExportRowsTestCase(CMSTestCase):
+    def _export(self):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.get(self.get_admin_url(PageContent, "export_csv")).getvalue()
+
+    def test_export_is_identical_to_the_instances_export(self):
+        PageVersionFactory.create_batch(3, content__language="en")
+        home = PageVersionFactory(content__language="en", state=PUBLISHED)
+        home.content.page.is_home = True
+        home.content.page.save()
+        PageUrlFactory(page=PageVersionFactory(content__language="en").content.page, path="some/path")
+
+        expected = self._export()
+        with patch("djangocms_pageadmin.conf.EXPORT_VALUES_ROWS", True):
+            self.assertEqual(self._export(), expected)
+
+
+class ExportedQuerysetTestCase(CMSTestCase):
+    def setUp(self):
+        self.model_admin = admin.site._registry[PageContent]
+        self.author = UserFactory()
+        PageVersionFactory.create_batch(2, content__language="en", created_by=self.author)
+        PageVersionFactory(content__language="en", content__title="Some title")
+        PageVersionFactory(content__language="en", state=PUBLISHED)
+        PageVersionFactory(content__language="de")
+
+    def _get_changelist_queryset(self, request):
+        changelist = self.model_admin.get_changelist_instance(request)
+        return changelist.get_queryset(request)
+
+    def test_matches_the_changelist_queryset(self):
+        for query_string in [
+            "",
+            "?language=de",
+            "?created_by={}".format(self.author.pk),
+            "?q=some",
+            "?o=3",
+            "?o=-5.3",
+            "?unpublished=1",
+        ]:
+            with self.subTest(query_string=query_string):
+                request = self.get_request("/" + query_string)
+                request.user = self.get_superuser()
+
+                self.assertEqual(
+                    list(self.model_admin.get_exported_queryset(request)),
+                    list(self._get_changelist_queryset(request)),
+                )
+
+    def test_ordering_matches_the_changelist_columns(self):
+        changelist_url = self.get_admin_url(PageContent, "changelist")
+        for query_string in ["?o=3", "?o=-5.3", "?o=2.-5"]:
+            with self.subTest(query_string=query_string):
+                with self.login_user_context(self.get_superuser()):
+                    response = self.client.get(changelist_url + query_string)
+                changelist = response.context["cl"]
+                expected = []
+                for index, direction in changelist.get_ordering_field_columns().items():
+                    # Columns without an ordering, like the url, are ignored
+                    field = changelist.get_ordering_field(changelist.list_display[index])
+                    if field:
+                        expected.append(("-" if direction == "desc" else "") + field)
+
+                ordering = self.model_admin.get_exported_queryset(response.wsgi_request).query.order_by
+
+                self.assertTrue(expected)
+                self.assertEqual(list(ordering[:len(expected)]), expected)
+
+    def test_filters_added_by_subclasses(self):
+        class TitleStartFilter(admin.SimpleListFilter):
+            title = "title start"
+            parameter_name = "starts"
+
+            def lookups(self, request, model_admin):
+                return [("Some", "Some")]
+
+            def queryset(self, request, queryset):
+                if self.value():
+                    return queryset.filter(title__startswith=self.value())
+
+        class FilteredPageContentAdmin(PageContentAdmin):
+            list_filter = PageContentAdmin.list_filter + (
+                "template",
+                ("title", admin.AllValuesFieldListFilter),
+                TitleStartFilter,
+            )
+
+        model_admin = FilteredPageContentAdmin(PageContent, admin.site)
+        for query_string, count in [
+            ("", 4),
+            ("?starts=Some", 1),
+            ("?title=Some+title", 1),
+            ("?template__exact=INHERIT", 0),
+        ]:
+            with self.subTest(query_string=query_string):
+                request = self.get_request("/" + query_string)
+                request.user = self.get_superuser()
+
+                exported = list(model_admin.get_exported_queryset(request))
+
+                changelist = model_admin.get_changelist_instance(request)
+                self.assertEqual(exported, list(changelist.get_queryset(request)))
+                self.assertEqual(len(exported), count)
+
+    def test_filter_choices_are_not_computed(self):
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+
+        with patch.object(AuthorFilter, "lookups", side_effect=AssertionError("lookups computed")):
+            list(self.model_admin.get_exported_queryset(request))
+
+
+class RequestContextTestCase(CMSTestCase):
+    def setUp(self):
+        self.superuser = self.get_superuser()
+        self.author = UserFactory()
+        self.versions = [
+            PageVersionFactory(content__language="en", content__template="page.html", created_by=self.author)
+            for _ in range(3)
+        ]
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+
+    def _count_changelist_queries(self, params=None):
+        with self.login_user_context(self.superuser):
+            self.client.get(self.changelist_url, params)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.changelist_url, params)
+        self.assertEqual(response.status_code, 200)
+        # Every combination lists the same rows, only the filters differ
+        self.assertEqual(response.context["cl"].result_count, len(self.versions))
+        return len(queries)
+
+    def test_changelist_queries_do_not_depend_on_the_filters(self):
+        Version.objects.filter(pk__in=[version.pk for version in self.versions]).update(state=UNPUBLISHED)
+        expected = self._count_changelist_queries({"unpublished": "1"})
+
+        self.assertEqual(self._count_changelist_queries({"unpublished": "1", "language": "en"}), expected)
+        self.assertEqual(
+            self._count_changelist_queries({
+                "language": "en",
+                "template": "page.html",
+                "unpublished": "1",
+                "created_by": self.author.pk,
+            }),
+            expected,
+        )
+
+    def test_base_queryset_is_built_once_per_request(self):
+        build = patch.object(
+            PageContentAdmin, "_build_queryset", autospec=True, side_effect=PageContentAdmin._build_queryset
+        )
+
+        with self.login_user_context(self.superuser), build as build_queryset:
+            self.client.get(self.changelist_url, {"created_by": self.versions[0].created_by_id})
+            self.assertEqual(build_queryset.call_count, 1)
+
+            self.client.get(self.changelist_url)
+            self.assertEqual(build_queryset.call_count, 2)
+
+    def test_shared_queryset_is_returned_as_a_copy(self):
+        model_admin = admin.site._registry[PageContent]
+        request = self.get_request("/")
+
+        queryset = model_admin.get_queryset(request)
+        list(queryset)
+
+        self.assertIsNot(model_admin.get_queryset(request), queryset)
+        self.assertIsNone(model_admin.get_queryset(request)._result_cache)
+
+
+class ExportFormatsTestCase(CMSTestCase):
+    def setUp(self):
+        self.version = PageVersionFactory(content__language="en", state=PUBLISHED)
+
+    def _export(self, export_format):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.get(self.get_admin_url(PageContent, "export", export_format))
+
+    def test_json_lines_export(self):
+        response = self._export("jsonl")
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], "attachment; filename=cms.pagecontent.jsonl")
+        rows = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], self.version.content.title)
+        self.assertEqual(rows[0]["state"], "Published")
+        self.assertEqual(rows[0]["author"], self.version.created_by.username)
+
+    def test_xlsx_export(self):
+        response = self._export("xlsx")
+
+        archive = zipfile.ZipFile(io.BytesIO(response.getvalue()))
+        self.assertIn(self.version.content.title, archive.read("xl/worksheets/sheet1.xml").decode())
+
+    def test_unknown_format(self):
+        self.assertEqual(self._export("pdf").status_code, 404)
+
+    def test_custom_columns(self):
+        model_admin = admin.site._registry[PageContent]
+        columns = model_admin.export_columns + (("page_language", "Language"),)
+
+        with patch.object(PageContentAdmin, "export_columns", columns), \
+                patch.object(PageContentAdmin, "page_language", lambda self, row: row["language"], create=True):
+            response = self._export("csv")
+
+        lines = response.getvalue().decode().splitlines()
+        self.assertEqual(lines[0].split(",")[-1], "Language")
+        self.assertEqual(lines[1].split(",")[-1], "en")
+
+    def test_format_links_are_visible(self):
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(self.get_admin_url(PageContent, "changelist"))
+
+        self.assertContains(
+            response,
+            '<a class="historylink" href="/en/admin/cms/pagecontent/export/xlsx/?">Export XLSX</a>',
+            html=True,
+        )
+        self.assertContains(
+            response,
+            '<a class="historylink" href="/en/admin/cms/pagecontent/export/jsonl/?">Export JSON Lines</a>',
+            html=True,
+        )
+
+    def test_export_is_compressed_for_clients_accepting_gzip(self):
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(
+                self.get_admin_url(PageContent, "export_csv"), HTTP_ACCEPT_ENCODING="gzip, deflate"
+            )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith("W/"))
+        self.assertIn(self.version.content.title, gzip.decompress(response.getvalue()).decode())
+
+    def test_explicit_gzip_download(self):
+        response = self._export("csv.gz")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertEqual(response["Content-Disposition"], "attachment; filename=cms.pagecontent.csv.gz")
+        self.assertIn(self.version.content.title, gzip.decompress(response.getvalue()).decode())
+
+    def test_xlsx_is_not_compressed_again(self):
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(
+                self.get_admin_url(PageContent, "export", "xlsx"), HTTP_ACCEPT_ENCODING="gzip"
+            )
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(self._export("xlsx.gz").status_code, 404)
@@ -0,0 +1,159 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_version_locking.models import VersionLock
+from djangocms_versioning.constants import DRAFT, PUBLISHED
+
+from djangocms_pageadmin.admin import PageContentAdmin
+from djangocms_pageadmin.limiter import ConcurrencySlot
+from djangocms_pageadmin.test_utils.factories import (
+    PageVersionFactory,
+    UserFactory,
+)
+from djangocms_pageadmin.timeouts import StatementTimeout
+
+
+class JSONAPITestCase(CMSTestCase):
+    def setUp(self):
+        self.api_url = self.get_admin_url(PageContent, "api")
+
+    def _get(self, **params):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.get(self.api_url, params)
+
+    def test_requires_staff(self):
+        response = self.client.get(self.api_url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_requires_the_view_permission(self):
+        staff_user = self._create_user("staff", is_staff=True)
+
+        with self.login_user_context(staff_user):
+            response = self.client.get(self.api_url)
+
+        self.assertEqual(response.status_code, 403)
+
+    @patch("djangocms_pageadmin.conf.CONCURRENCY_LIMITS", {"search": {"site": 1}})
+    def test_busy_search(self):
+        cache.clear()
+        request = self.get_request("/")
+        request.user = UserFactory()
+        slot = ConcurrencySlot("search", request).acquire()
+
+        self.assertEqual(self._get(fields="title").status_code, 200)
+        response = self._get(fields="title", q="title")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "10")
+
+        slot.release()
+        self.assertEqual(self._get(fields="title", q="title").status_code, 200)
+
+    @patch("djangocms_pageadmin.conf.STATEMENT_TIMEOUTS", {"search": 0.1})
+    def test_slow_search(self):
+        with patch(
+            "djangocms_pageadmin.admin.statement_timeout", side_effect=StatementTimeout(0.1, None)
+        ) as timeout:
+            response = self._get(fields="title", q="title")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("error", response.json())
+        self.assertEqual(timeout.call_args[0], (0.1,))
+        self.assertEqual(timeout.call_args[1]["label"], "search")
+
+    def test_all_fields(self):
+        version = PageVersionFactory(
+            content__language="en", content__page__node__depth=1, state=PUBLISHED
+        )
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        result = response.json()["results"][0]
+        self.assertEqual(result["id"], version.content.pk)
+        self.assertEqual(result["title"], version.content.title)
+        self.assertEqual(result["state"], PUBLISHED)
+        self.assertEqual(result["author"], version.created_by.username)
+        self.assertIsNone(result["lock"])
+        self.assertEqual(set(result), {
+            "id", "title", "url", "state", "author", "modified", "lock", "expiry",
+        })
+
+    def test_sparse_fields(self):
+        PageVersionFactory(content__language="en")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get(fields="title,state")
+
+        self.assertEqual(set(response.json()["results"][0]), {"id", "title", "state"})
+        # The lock table is only joined for the lock field
+        self.assertFalse(any("versionlock" in query["sql"] for query in queries.captured_queries))
+
+    def test_unknown_fields(self):
+        response = self._get(fields="title,secret")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", response.json()["error"])
+
+    def test_lock(self):
+        version = PageVersionFactory(content__language="en", state=DRAFT)
+        user = UserFactory()
+        VersionLock.objects.create(version=version, created_by=user)
+
+        response = self._get(fields="lock")
+
+        self.assertEqual(response.json()["results"][0]["lock"], user.username)
+
+    def test_filters_and_search(self):
+        PageVersionFactory(content__language="en", content__title="news")
+        PageVersionFactory(content__language="en", content__title="about")
+        PageVersionFactory(content__language="de", content__title="news")
+
+        response = self._get(fields="title", q="news", language="en")
+
+        self.assertEqual([result["title"] for result in response.json()["results"]], ["news"])
+
+    def test_cursor_pagination(self):
+        versions = PageVersionFactory.create_batch(5, content__language="en")
+        expected = sorted((version.content.pk for version in versions), reverse=True)
+
+        pages = []
+        response = self._get(fields="title", limit=2)
+        while True:
+            data = response.json()
+            pages.append([result["id"] for result in data["results"]])
+            if not data["next"]:
+                break
+            with self.login_user_context(self.get_superuser()):
+                response = self.client.get(data["next"])
+
+        self.assertEqual(pages, [expected[:2], expected[2:4], expected[4:]])
+
+    def test_cursor_is_a_primary_key_lookup(self):
+        PageVersionFactory.create_batch(3, content__language="en")
+        cursor = self._get(fields="title", limit=1).json()["next_cursor"]
+
+        with CaptureQueriesContext(connection) as queries:
+            self._get(fields="title", limit=1, cursor=cursor)
+
+        sql = next(query["sql"] for query in queries.captured_queries if "LIMIT 2" in query["sql"])
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor_and_limit(self):
+        self.assertEqual(self._get(cursor="not a cursor").status_code, 400)
+        self.assertEqual(self._get(limit="many").status_code, 400)
+        self.assertEqual(self._get(limit=0).status_code, 400)
+
+    @patch.object(PageContentAdmin, "api_max_page_size", 2)
+    def test_limit_is_capped(self):
+        PageVersionFactory.create_batch(3, content__language="en")
+
+        response = self._get(fields="title", limit=10)
+
+        self.assertEqual(len(response.json()["results"]), 2)
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_pageadmin.helpers import (
+    bump_changelist_generation,
+    get_changelist_generation,
+)
+from djangocms_pageadmin.test_utils.factories import PageVersionFactory
+
+
+@patch("djangocms_pageadmin.conf.CHANGELIST_CACHE_TIMEOUT", 60)
+class CachedChangeListTestCase(CMSTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+        self.get_results = patch.object(
+            ChangeList, "get_results", autospec=True, side_effect=ChangeList.get_results
+        )
+
+    def _get_changelist(self, **params):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.get(self.changelist_url, params)
+
+    def test_results_are_cached(self):
+        versions = PageVersionFactory.create_batch(2, content__language="en")
+
+        with self.get_results as get_results:
+            self._get_changelist()
+            response = self._get_changelist()
+
+        self.assertEqual(get_results.call_count, 1)
+        self.assertEqual(response.context["cl"].result_count, 2)
+        self.assertEqual(
+            {obj.pk for obj in response.context["cl"].result_list},
+            {version.content.pk for version in versions},
+        )
+        for version in versions:
+            self.assertContains(response, version.content.title)
+
+    def test_query_string_is_part_of_the_key(self):
+        PageVersionFactory(content__language="en")
+
+        with self.get_results as get_results:
+            self._get_changelist()
+            self._get_changelist(q="something")
+
+        self.assertEqual(get_results.call_count, 2)
+
+    @patch("djangocms_pageadmin.conf.READ_DATABASE", "replica")
+    def test_database_is_part_of_the_key(self):
+        # The pages are only created in the default database
+        PageVersionFactory(content__language="en")
+
+        self.assertEqual(self._get_changelist().context["cl"].result_count, 0)
+        with patch("djangocms_pageadmin.conf.READ_DATABASE", None):
+            response = self._get_changelist()
+
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_page_changes_invalidate_the_cache(self):
+        PageVersionFactory(content__language="en")
+
+        with self.get_results as get_results:
+            self._get_changelist()
+            with self.captureOnCommitCallbacks(execute=True):
+                PageVersionFactory(content__language="en")
+            response = self._get_changelist()
+
+        self.assertEqual(get_results.call_count, 2)
+        self.assertEqual(response.context["cl"].result_count, 2)
+
+    def test_cache_is_invalidated_when_the_change_commits(self):
+        site = Site.objects.get_current()
+        generation = get_changelist_generation(site.pk)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            PageVersionFactory(content__language="en", content__page__node__site=site)
+            # The uncommitted change doesn't invalidate the cache yet
+            self.assertEqual(get_changelist_generation(site.pk), generation)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_changelist_generation(site.pk), generation)
+
+    def test_version_handlers_only_receive_versions(self):
+        with patch(
+            "djangocms_pageadmin.handlers._is_page_content_version", return_value=False
+        ) as is_page_content_version:
+            Site.objects.create(domain="other.example.com", name="other")
+
+        is_page_content_version.assert_not_called()
+
+
+class ChangelistGenerationTestCase(CMSTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_bump_changes_the_generation_of_the_site(self):
+        site = Site.objects.get_current()
+        generation = get_changelist_generation(site.pk)
+
+        bump_changelist_generation([site.pk])
+
+        self.assertNotEqual(get_changelist_generation(site.pk), generation)
+
+    def test_bump_of_another_site(self):
+        site = Site.objects.get_current()
+        generation = get_changelist_generation(site.pk)
+
+        bump_changelist_generation([site.pk + 1])
+
+        self.assertEqual(get_changelist_generation(site.pk), generation)
@@ -0,0 +1,391 @@
+import datetime
+import gzip
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from unittest import skipUnless
+from unittest.mock import patch
+from xml.dom import minidom
+
+from django.contrib import admin
+from django.contrib.sites.models import Site
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_versioning.constants import UNPUBLISHED
+from djangocms_versioning.models import Version
+from factory.random import reseed_random
+
+from djangocms_pageadmin.exporters import (
+    CSVExporter,
+    JSONLinesExporter,
+    XLSXExporter,
+    gzip_stream,
+)
+from djangocms_pageadmin.models import ExportJob
+from djangocms_pageadmin.test_utils.factories import (
+    PageVersionFactory,
+    SiteFactory,
+    UserFactory,
+)
+
+
+COLUMNS = (("title", "Title"), ("author", "Author"))
+
+
+class ExportersTestCase(SimpleTestCase):
+    def test_csv_rows_are_written_in_chunks(self):
+        exporter = CSVExporter(COLUMNS)
+        exporter.rows_per_chunk = 2
+
+        chunks = list(exporter.stream([["a", "b"], ["c", None], ["d", "e"]]))
+
+        self.assertEqual(chunks, [b"Title,Author\r\n", b"a,b\r\nc,\r\n", b"d,e\r\n"])
+
+    def test_json_lines_are_keyed_by_column(self):
+        content = b"".join(JSONLinesExporter(COLUMNS).stream([["a", None], ["b", 1]]))
+
+        self.assertEqual(
+            [json.loads(line) for line in content.decode().splitlines()],
+            [{"title": "a", "author": ""}, {"title": "b", "author": "1"}],
+        )
+
+    def test_xlsx_is_a_workbook_of_inline_strings(self):
+        exporter = XLSXExporter(COLUMNS)
+        exporter.rows_per_chunk = 1
+
+        content = b"".join(exporter.stream(iter([["<a> & b", "\x01c"], ["d", None]])))
+
+        archive = zipfile.ZipFile(io.BytesIO(content))
+        self.assertIsNone(archive.testzip())
+        self.assertIn("xl/workbook.xml", archive.namelist())
+        sheet = minidom.parseString(archive.read("xl/worksheets/sheet1.xml"))
+        self.assertEqual(
+            [
+                ["".join(node.data for node in cell.childNodes) for cell in row.getElementsByTagName("t")]
+                for row in sheet.getElementsByTagName("row")
+            ],
+            [["Title", "Author"], ["<a> & b", "c"], ["d", ""]],
+        )
+
+    def test_gzip_stream_compresses_chunk_by_chunk(self):
+        chunks = [b"Title,Author\r\n", b"a,b\r\n" * 1000, b"c,d\r\n"]
+
+        compressed = list(gzip_stream(iter(chunks)))
+
+        self.assertEqual(gzip.decompress(b"".join(compressed)), b"".join(chunks))
+
+
+@skipUnless(os.environ.get("PAGEADMIN_BENCHMARK"), "Set PAGEADMIN_BENCHMARK to run the benchmarks")
+class GzipExportBenchmark(CMSTestCase):
+    """Throughput and compression ratio of the gzip csv export of 10k pages"""
+
+    rows = 10000
+
+    def setUp(self):
+        reseed_random("djangocms-pageadmin")
+        PageVersionFactory.create_batch(self.rows, content__language="en")
+        self.model_admin = admin.site._registry[PageContent]
+        request = self.get_request("/")
+        request.user = self.get_superuser()
+        self.queryset = self.model_admin.get_exported_queryset(request)
+
+    def test_gzip_export(self):
+        exporter = CSVExporter(self.model_admin.export_columns)
+        rows = list(self.model_admin.get_export_rows(self.queryset))
+        csv_size = sum(map(len, exporter.stream(rows)))
+
+        start = time.perf_counter()
+        gzip_size = sum(map(len, gzip_stream(exporter.stream(rows))))
+        elapsed = time.perf_counter() - start
+        print("gzip: {:.1f} MiB/s, {} to {} bytes, ratio {:.1f}".format(
+            csv_size / elapsed / 2 ** 20, csv_size, gzip_size, csv_size / gzip_size
+        ))
+
+
+class ExportCommandTestCase(CMSTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.output = os.path.join(self.directory.name, "pages.csv")
+
+    def _export(self, **options):
+        call_command("pageadmin_export", output=self.output, stderr=io.StringIO(), **options)
+        with open(self.output, "rb") as export:
+            content = export.read()
+        if options.get("gzip"):
+            content = gzip.decompress(content)
+        return [row.split(",")[0] for row in content.decode().splitlines()[1:]]
+
+    def test_export_of_the_default_language(self):
+        version = PageVersionFactory(content__language="en")
+        PageVersionFactory(content__language="de")
+
+        self.assertEqual(self._export(), [version.content.title])
+
+    def test_filters(self):
+        author = UserFactory()
+        version = PageVersionFactory(content__language="de", state=UNPUBLISHED, created_by=author)
+        PageVersionFactory(content__language="de", state=UNPUBLISHED)
+        PageVersionFactory(content__language="de", created_by=author)
+
+        self.assertEqual(
+            self._export(language="de", unpublished=True, author=author.username),
+            [version.content.title],
+        )
+
+    def test_search(self):
+        version = PageVersionFactory(content__language="en", content__title="Some title")
+        PageVersionFactory(content__language="en", content__title="Other")
+
+        self.assertEqual(self._export(search="some", gzip=True), [version.content.title])
+
+    def test_since_exports_recently_changed_pages(self):
+        old = PageVersionFactory(content__language="en")
+        Version.objects.filter(pk=old.pk).update(modified=timezone.now() - datetime.timedelta(days=2))
+        version = PageVersionFactory(content__language="en")
+
+        since = (timezone.now() - datetime.timedelta(days=1)).isoformat()
+        self.assertEqual(self._export(since=since), [version.content.title])
+
+    def test_progress_is_reported(self):
+        PageVersionFactory.create_batch(3, content__language="en")
+        stderr = io.StringIO()
+
+        with patch.object(CSVExporter, "rows_per_chunk", 2):
+            call_command("pageadmin_export", output=self.output, stderr=stderr)
+
+        self.assertEqual(stderr.getvalue().splitlines(), ["Exported 2 rows", "Exported 3 rows"])
+
+    def test_unknown_format(self):
+        with self.assertRaises(CommandError):
+            call_command("pageadmin_export", output=self.output, format="pdf")
+
+
+# The forked workers open connections of their own, which only see the
+# committed pages
+class MultiSiteExportCommandTestCase(TransactionTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.sites = [Site.objects.get_current(), SiteFactory()]
+        self.versions = {
+            site.pk: PageVersionFactory.create_batch(
+                index + 1, content__language="en", content__page__node__site=site
+            )
+            for index, site in enumerate(self.sites)
+        }
+
+    def _read_manifest(self):
+        with open(os.path.join(self.directory.name, "manifest.json")) as manifest:
+            return json.load(manifest)
+
+    def _read_titles(self, name):
+        with open(os.path.join(self.directory.name, name)) as export:
+            return {row.split(",")[0] for row in export.read().splitlines()[1:]}
+
+    def test_sites_are_exported_in_parallel(self):
+        call_command(
+            "pageadmin_export",
+            all_sites=True,
+            language="en",
+            output_dir=self.directory.name,
+            processes=2,
+            stderr=io.StringIO(),
+        )
+
+        manifest = self._read_manifest()
+        self.assertEqual(manifest["rows"], 3)
+        self.assertEqual([entry["site"] for entry in manifest["sites"]], [site.pk for site in self.sites])
+        for entry in manifest["sites"]:
+            self.assertEqual(entry["rows"], len(self.versions[entry["site"]]))
+            self.assertEqual(
+                self._read_titles(entry["file"]),
+                {version.content.title for version in self.versions[entry["site"]]},
+            )
+
+    def test_chosen_sites(self):
+        site = self.sites[1]
+
+        call_command(
+            "pageadmin_export",
+            site=[site.pk],
+            language="en",
+            output_dir=self.directory.name,
+            processes=1,
+            stderr=io.StringIO(),
+        )
+
+        self.assertEqual([entry["site"] for entry in self._read_manifest()["sites"]], [site.pk])
+
+    def test_several_sites_need_an_output_directory(self):
+        with self.assertRaises(CommandError):
+            call_command("pageadmin_export", all_sites=True, output=os.path.join(self.directory.name, "pages.csv"))
+
+
+class ExportJobTestCase(CMSTestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.superuser = self.get_superuser()
+        self.version = PageVersionFactory(content__language="en")
+        PageVersionFactory(content__language="de")
+        self.job_url = self.get_admin_url(PageContent, "export_job")
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+
+    def _queue(self, export_format="csv", query="?language=en"):
+        with self.login_user_context(self.superuser):
+            return self.client.post(self.job_url + query, {"export_format": export_format})
+
+    def _run_worker(self):
+        call_command("pageadmin_export_jobs", once=True, stdout=io.StringIO())
+
+    def test_job_is_queued_with_the_filters(self):
+        response = self._queue(query="?language=en&p=2")
+
+        self.assertRedirects(
+            response, self.changelist_url + "?language=en&p=2", fetch_redirect_response=False
+        )
+        job = ExportJob.objects.get()
+        self.assertEqual(job.user, self.superuser)
+        self.assertEqual(job.site, Site.objects.get_current())
+        self.assertEqual(job.params, {"language": "en"})
+        self.assertEqual(job.status, ExportJob.PENDING)
+
+    @patch("djangocms_pageadmin.helpers.get_site_language_from_request", return_value="de")
+    def test_job_keeps_the_language_of_the_changelist(self, get_language):
+        self._queue(query="")
+
+        self.assertEqual(ExportJob.objects.get().params, {"language": "de"})
+
+    @patch("djangocms_pageadmin.conf.EXPORT_JOB_LIMIT", 1)
+    def test_active_jobs_are_capped_per_user(self):
+        self._queue()
+        self._queue()
+        ExportJob.objects.create(user=UserFactory(), site=Site.objects.get_current(), export_format="csv")
+
+        self.assertEqual(ExportJob.objects.filter(user=self.superuser).count(), 1)
+
+        self._run_worker()
+        self._queue()
+
+        self.assertEqual(ExportJob.objects.filter(user=self.superuser).count(), 2)
+
+    def test_unknown_format(self):
+        self.assertEqual(self._queue(export_format="pdf").status_code, 400)
+
+    def test_worker_generates_the_file(self):
+        self._queue()
+
+        self._run_worker()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.DONE)
+        self.assertEqual(job.rows, 1)
+        with job.file.open("rb") as export:
+            self.assertIn(self.version.content.title, export.read().decode())
+
+    def test_failed_job(self):
+        self._queue()
+
+        with patch.object(CSVExporter, "stream", side_effect=ValueError("Broken")):
+            self._run_worker()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.FAILED)
+        self.assertEqual(job.error, "Broken")
+
+    def test_user_is_notified_once_and_downloads_the_file(self):
+        self._queue()
+        self._run_worker()
+        job = ExportJob.objects.get()
+        download_url = self.get_admin_url(PageContent, "export_job_download", job.pk)
+
+        with self.login_user_context(self.superuser):
+            response = self.client.get(self.changelist_url)
+            self.assertContains(response, download_url)
+            self.assertNotIn("ETag", response)
+            response = self.client.get(self.changelist_url)
+            self.assertNotContains(response, download_url)
+
+            response = self.client.get(download_url)
+
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="{}"'.format(
+            os.path.basename(job.file.name)
+        ))
+        self.assertIn(self.version.content.title, b"".join(response.streaming_content).decode())
+
+    def test_download_of_a_deleted_file(self):
+        self._queue()
+        self._run_worker()
+        job = ExportJob.objects.get()
+        job.file.storage.delete(job.file.name)
+
+        with self.login_user_context(self.superuser):
+            response = self.client.get(self.get_admin_url(PageContent, "export_job_download", job.pk))
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch("djangocms_pageadmin.conf.EXPORT_JOB_LIMIT", 1)
+    @patch("djangocms_pageadmin.conf.EXPORT_JOB_TIMEOUT", 60)
+    def test_worker_fails_interrupted_jobs(self):
+        self._queue()
+        # Claimed by a worker which died since
+        ExportJob.objects.update(
+            status=ExportJob.RUNNING, started=timezone.now() - datetime.timedelta(minutes=5)
+        )
+
+        # Doesn't count against the limit anymore
+        self._queue()
+        self.assertEqual(ExportJob.objects.filter(user=self.superuser).count(), 2)
+
+        ExportJob.objects.filter(status=ExportJob.PENDING).delete()
+        self._run_worker()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.FAILED)
+        self.assertIsNotNone(job.finished)
+        ExportJob.objects.update(created=timezone.now() - datetime.timedelta(days=30))
+        self._run_worker()
+        self.assertFalse(ExportJob.objects.exists())
+
+    @patch("djangocms_pageadmin.conf.EXPORT_JOB_TIMEOUT", 60)
+    def test_worker_keeps_recent_running_jobs(self):
+        self._queue()
+        ExportJob.objects.update(status=ExportJob.RUNNING, started=timezone.now())
+
+        self._run_worker()
+
+        self.assertEqual(ExportJob.objects.get().status, ExportJob.RUNNING)
+
+    def test_download_of_another_user(self):
+        self._queue()
+        self._run_worker()
+        job = ExportJob.objects.get()
+        other_user = self._create_user("other", is_staff=True, is_superuser=True)
+
+        with self.login_user_context(other_user):
+            response = self.client.get(self.get_admin_url(PageContent, "export_job_download", job.pk))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_worker_deletes_expired_jobs(self):
+        self._queue()
+        self._run_worker()
+        job = ExportJob.objects.get()
+        ExportJob.objects.update(created=timezone.now() - datetime.timedelta(days=30))
+
+        self._run_worker()
+
+        self.assertFalse(ExportJob.objects.exists())
+        self.assertFalse(job.file.storage.exists(job.file.name))
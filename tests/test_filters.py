@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.test import override_settings
@@ -9,6 +11,7 @@ from cms.utils.conf import get_cms_setting
 
 from djangocms_versioning.constants import UNPUBLISHED
 
+from djangocms_pageadmin.filters import AuthorFilter, UnpublishedFilter
 from djangocms_pageadmin.test_utils.factories import (
     PageContentWithVersionFactory,
     PageVersionFactory,
@@ -179,3 +182,22 @@ class AuthorFilterTestCase(CMSTestCase):
             transform=lambda x: x.pk,
             ordered=False,
         )
+
+    def test_filter_queryset_applies_the_parameter_without_lookups(self):
+        author = UserFactory()
+        version = PageVersionFactory(created_by=author, content__language="en")
+        PageVersionFactory(content__language="en")
+        request = self.get_request("/?created_by={}".format(author.pk))
+
+        with patch.object(AuthorFilter, "lookups", side_effect=AssertionError("lookups computed")):
+            queryset = AuthorFilter.filter_queryset(request, PageContent._base_manager.all())
+
+        self.assertEqual(list(queryset), [version.content])
+
+    def test_filter_queryset_applies_the_default_of_the_filter(self):
+        PageVersionFactory(content__language="en", state=UNPUBLISHED)
+        shown = PageVersionFactory(content__language="en")
+
+        queryset = UnpublishedFilter.filter_queryset(self.get_request("/"), PageContent._base_manager.all())
+
+        self.assertEqual(list(queryset), [shown.content])
@@ -1,12 +1,33 @@
 from unittest.mock import MagicMock, patch
 
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+from cms.api import add_plugin
+from cms.models import PageContent, PageUrl
 from cms.test_utils.testcases import CMSTestCase
 
-from djangocms_pageadmin.helpers import is_moderation_enabled
+from djangocms_pageadmin.helpers import (
+    get_duplicate_estimate,
+    get_expected_duplicate_duration,
+    get_unique_slug,
+    is_moderation_enabled,
+    record_duplicate_throughput,
+)
+from djangocms_pageadmin.test_utils.factories import (
+    PageContentWithVersionFactory,
+    PlaceholderFactory,
+    SiteFactory,
+)
 
 
 class TestIsModerationEnabled(CMSTestCase):
 
+    def setUp(self):
+        is_moderation_enabled.cache_clear()
+        self.addCleanup(is_moderation_enabled.cache_clear)
+
     @patch("django.apps.apps.get_app_config")
     def test_when_config_not_found(self, mock_get_app_config):
         """
@@ -40,3 +61,94 @@ class TestIsModerationEnabled(CMSTestCase):
         The test environment has djangocms_moderation installed and enabled so this should return True
         """
         self.assertTrue(is_moderation_enabled())
+
+    @patch("django.apps.apps.get_app_config")
+    def test_result_is_cached(self, mock_get_app_config):
+        mock_get_app_config.return_value.cms_extension.moderated_models = [PageContent]
+
+        self.assertTrue(is_moderation_enabled())
+        self.assertTrue(is_moderation_enabled())
+
+        mock_get_app_config.assert_called_once_with("djangocms_moderation")
+
+
+class TestGetUniqueSlug(CMSTestCase):
+
+    def setUp(self):
+        self.site = Site.objects.first()
+
+    def _create_url(self, path, language="en", site=None):
+        pagecontent = PageContentWithVersionFactory(
+            language=language, page__node__site=site or self.site
+        )
+        return PageUrl.objects.create(
+            slug=path.rsplit("/", 1)[-1],
+            path=path,
+            language=language,
+            page=pagecontent.page,
+        )
+
+    def test_free_slug_is_returned_unchanged(self):
+        self._create_url("other")
+
+        self.assertEqual(get_unique_slug(self.site, "en", "foo"), "foo")
+
+    def test_taken_slug_gets_the_first_free_suffix(self):
+        self._create_url("foo")
+        self._create_url("foo-2")
+        self._create_url("foo-4")
+
+        self.assertEqual(get_unique_slug(self.site, "en", "foo"), "foo-3")
+
+    def test_paths_are_checked_under_the_parent(self):
+        self._create_url("foo")
+        self._create_url("parent/foo")
+
+        self.assertEqual(get_unique_slug(self.site, "en", "foo", parent_path="parent"), "foo-2")
+        self.assertEqual(get_unique_slug(self.site, "en", "foo", parent_path="other"), "foo")
+
+    def test_other_languages_and_sites_are_ignored(self):
+        self._create_url("foo", language="de")
+        self._create_url("foo", site=SiteFactory())
+
+        self.assertEqual(get_unique_slug(self.site, "en", "foo"), "foo")
+
+    def test_single_query(self):
+        self._create_url("foo")
+
+        with self.assertNumQueries(1):
+            get_unique_slug(self.site, "en", "foo")
+
+
+class TestDuplicateEstimate(CMSTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_placeholders_and_plugins_in_content_language(self):
+        pagecontent = PageContentWithVersionFactory(language="en")
+        placeholder = PlaceholderFactory(slot="content", source=pagecontent)
+        PlaceholderFactory(slot="navigation", source=pagecontent)
+        add_plugin(placeholder, "TextPlugin", "en", body="Test text")
+        add_plugin(placeholder, "TextPlugin", "en", body="Test text")
+        add_plugin(placeholder, "TextPlugin", "de", body="Test text")
+        # The content type is cached after the first lookup
+        ContentType.objects.get_for_model(PageContent)
+
+        with self.assertNumQueries(1):
+            estimate = get_duplicate_estimate(pagecontent)
+
+        self.assertEqual(estimate, {"placeholders": 2, "plugins": 2, "extensions": 0})
+
+    def test_expected_duration_without_history(self):
+        self.assertIsNone(get_expected_duplicate_duration(10))
+
+    def test_expected_duration_from_recorded_throughput(self):
+        record_duplicate_throughput(10, 5.0)
+
+        self.assertEqual(get_expected_duplicate_duration(4), 2.0)
+
+        record_duplicate_throughput(10, 10.0)
+
+        # moving average of 0.5 and 1 second per item
+        self.assertAlmostEqual(get_expected_duplicate_duration(10), 6.0)
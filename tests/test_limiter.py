@@ -0,0 +1,189 @@
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_pageadmin.limiter import (
+    ConcurrencyLimitReached,
+    ConcurrencySlot,
+)
+from djangocms_pageadmin.models import ExportJob
+from djangocms_pageadmin.signals import concurrency_limit_reached
+from djangocms_pageadmin.test_utils.factories import (
+    PageContentWithVersionFactory,
+    PageVersionFactory,
+    UserFactory,
+)
+
+
+LIMITS = {
+    "export": {"site": 2, "user": 1},
+    "duplicate": {"site": 1},
+    "search": {"site": 1},
+}
+
+
+@patch("djangocms_pageadmin.conf.CONCURRENCY_LIMITS", LIMITS)
+class ConcurrencySlotTestCase(CMSTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _get_request(self, user):
+        request = self.get_request("/")
+        request.user = user
+        return request
+
+    def test_user_limit(self):
+        user = UserFactory()
+        slot = ConcurrencySlot("export", self._get_request(user)).acquire()
+
+        with self.assertRaises(ConcurrencyLimitReached) as error:
+            ConcurrencySlot("export", self._get_request(user)).acquire()
+        self.assertEqual(error.exception.scope, "user")
+
+        slot.release()
+        ConcurrencySlot("export", self._get_request(user)).acquire()
+
+    def test_site_limit(self):
+        ConcurrencySlot("export", self._get_request(UserFactory())).acquire()
+        ConcurrencySlot("export", self._get_request(UserFactory())).acquire()
+
+        with self.assertRaises(ConcurrencyLimitReached) as error:
+            ConcurrencySlot("export", self._get_request(UserFactory())).acquire()
+        self.assertEqual(error.exception.scope, "site")
+
+    def test_refused_slot_does_not_count(self):
+        user = UserFactory()
+        ConcurrencySlot("export", self._get_request(UserFactory())).acquire()
+        slot = ConcurrencySlot("export", self._get_request(user)).acquire()
+        with self.assertRaises(ConcurrencyLimitReached):
+            ConcurrencySlot("export", self._get_request(user)).acquire()
+
+        slot.release()
+
+        ConcurrencySlot("export", self._get_request(UserFactory())).acquire()
+
+    def test_expired_slots_are_not_released_twice(self):
+        slots = [ConcurrencySlot("duplicate", self._get_request(UserFactory())).acquire()]
+        # The slot of a running operation expires, another one takes it
+        cache.delete_many(slots[0].taken)
+        slots.append(ConcurrencySlot("duplicate", self._get_request(UserFactory())).acquire())
+
+        slots[0].release()
+
+        with self.assertRaises(ConcurrencyLimitReached):
+            ConcurrencySlot("duplicate", self._get_request(UserFactory())).acquire()
+        slots[1].release()
+        ConcurrencySlot("duplicate", self._get_request(UserFactory())).acquire()
+
+    def test_operations_without_limits_are_not_counted(self):
+        request = self._get_request(UserFactory())
+
+        for _ in range(3):
+            ConcurrencySlot("other", request).acquire()
+
+    def test_refusal_sends_the_signal(self):
+        request = self._get_request(UserFactory())
+        ConcurrencySlot("duplicate", request).acquire()
+
+        with patch.object(concurrency_limit_reached, "send") as send:
+            with self.assertRaises(ConcurrencyLimitReached):
+                ConcurrencySlot("duplicate", request).acquire()
+
+        send.assert_called_once_with(
+            sender=ConcurrencySlot, operation="duplicate", scope="site", request=request
+        )
+
+    @patch("djangocms_pageadmin.conf.CONCURRENCY_WAIT", 5)
+    def test_waits_for_a_slot(self):
+        request = self._get_request(UserFactory())
+        slot = ConcurrencySlot("duplicate", request).acquire()
+
+        with patch("djangocms_pageadmin.limiter.time.sleep", side_effect=lambda seconds: slot.release()) as sleep:
+            ConcurrencySlot("duplicate", request).acquire()
+
+        sleep.assert_called_once()
+
+
+@patch("djangocms_pageadmin.conf.CONCURRENCY_LIMITS", LIMITS)
+class LimitedViewsTestCase(CMSTestCase):
+    def setUp(self):
+        cache.clear()
+        self.superuser = self.get_superuser()
+        self.request = self._get_request(UserFactory())
+
+    def _get_request(self, user):
+        request = self.get_request("/")
+        request.user = user
+        return request
+
+    def _get(self, url, **params):
+        with self.login_user_context(self.superuser):
+            return self.client.get(url, params)
+
+    def test_busy_export(self):
+        PageVersionFactory(content__language="en")
+        url = self.get_admin_url(PageContent, "export_csv")
+        slots = [ConcurrencySlot("export", self._get_request(UserFactory())).acquire() for _ in range(2)]
+
+        response = self._get(url)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "10")
+        self.assertNotIn("ETag", response)
+        for slot in slots:
+            slot.release()
+        self.assertEqual(self._get(url).status_code, 200)
+
+    def test_streamed_export_releases_its_slot(self):
+        url = self.get_admin_url(PageContent, "export_csv")
+
+        self._get(url).getvalue()
+
+        # The user limit is 1
+        self.assertEqual(self._get(url).status_code, 200)
+
+    def test_busy_duplicate(self):
+        pagecontent = PageContentWithVersionFactory()
+        ConcurrencySlot("duplicate", self.request).acquire()
+
+        with self.login_user_context(self.superuser):
+            response = self.client.post(
+                self.get_admin_url(PageContent, "duplicate", pagecontent.pk),
+                data={"site": pagecontent.page.node.site_id, "slug": "foo"},
+            )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(PageContent._base_manager.count(), 1)
+
+    def test_busy_search(self):
+        url = self.get_admin_url(PageContent, "changelist")
+        slot = ConcurrencySlot("search", self.request).acquire()
+
+        self.assertEqual(self._get(url).status_code, 200)
+        self.assertEqual(self._get(url, q="title").status_code, 429)
+
+        slot.release()
+        self.assertEqual(self._get(url, q="title").status_code, 200)
+
+    def test_busy_search_keeps_the_export_notifications(self):
+        job = ExportJob.objects.create(
+            user=self.superuser,
+            site=Site.objects.get_current(),
+            export_format="csv",
+            status=ExportJob.FAILED,
+        )
+        url = self.get_admin_url(PageContent, "changelist")
+        slot = ConcurrencySlot("search", self.request).acquire()
+
+        self.assertEqual(self._get(url, q="title").status_code, 429)
+        job.refresh_from_db()
+        self.assertFalse(job.notified)
+
+        slot.release()
+        self._get(url, q="title")
+        job.refresh_from_db()
+        self.assertTrue(job.notified)
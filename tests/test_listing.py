@@ -0,0 +1,227 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib import admin
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+
+from cms.models import Page, PageContent, PageUrl, TreeNode
+from cms.operations import CHANGE_PAGE_TRANSLATION, MOVE_PAGE
+from cms.signals import post_obj_operation
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_version_locking.models import VersionLock
+from djangocms_versioning.constants import PUBLISHED
+
+from djangocms_pageadmin.handlers import (
+    connect_listing_handlers,
+    disconnect_listing_handlers,
+)
+from djangocms_pageadmin.models import PageContentListing
+from djangocms_pageadmin.test_utils.factories import (
+    PageUrlFactory,
+    PageVersionFactory,
+    UserFactory,
+)
+
+
+class PageContentListingRefreshTestCase(CMSTestCase):
+    def test_refresh_builds_the_rows_from_the_sources(self):
+        version = PageVersionFactory(content__language="en", state=PUBLISHED)
+        content = version.content
+        PageUrlFactory(page=content.page, language="en", path="some/path")
+        VersionLock.objects.create(version=version, created_by=version.created_by)
+
+        PageContentListing.objects.refresh(PageContent._base_manager.filter(pk=content.pk))
+
+        listing = PageContentListing.objects.get(page_content=content)
+        self.assertEqual(listing.page_id, content.page_id)
+        self.assertEqual(listing.site_id, content.page.node.site_id)
+        self.assertEqual(listing.language, "en")
+        self.assertEqual(listing.title, content.title)
+        self.assertEqual(listing.path, "some/path")
+        self.assertEqual(listing.template, content.template)
+        self.assertEqual(listing.state, PUBLISHED)
+        self.assertEqual(listing.author_id, version.created_by_id)
+        self.assertEqual(listing.modified, version.modified)
+        self.assertEqual(listing.lock_owner_id, version.created_by_id)
+        self.assertIsNone(listing.expires)
+
+    def test_refresh_replaces_existing_rows(self):
+        version = PageVersionFactory(content__language="en")
+        queryset = PageContent._base_manager.filter(pk=version.content.pk)
+        PageContentListing.objects.refresh(queryset)
+        PageContent._base_manager.filter(pk=version.content.pk).update(title="New title")
+
+        PageContentListing.objects.refresh(queryset)
+
+        self.assertEqual(
+            list(PageContentListing.objects.values_list("title", flat=True)), ["New title"]
+        )
+
+    def test_rebuild_command(self):
+        versions = PageVersionFactory.create_batch(3, content__language="en")
+        PageContentListing.objects.refresh(PageContent._base_manager.filter(pk=versions[0].content.pk))
+        PageContentListing.objects.update(title="Stale title")
+
+        call_command("pageadmin_rebuild_listing", chunk_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            set(PageContentListing.objects.values_list("page_content_id", "title")),
+            {(version.content.pk, version.content.title) for version in versions},
+        )
+
+
+class PageContentListingHandlersTestCase(CMSTestCase):
+    def setUp(self):
+        connect_listing_handlers()
+        self.addCleanup(disconnect_listing_handlers)
+
+    def test_new_version_is_listed(self):
+        version = PageVersionFactory(content__language="en")
+
+        listing = PageContentListing.objects.get(page_content=version.content)
+        self.assertEqual(listing.state, version.state)
+        self.assertEqual(listing.author_id, version.created_by_id)
+
+    def test_state_change_updates_the_row(self):
+        version = PageVersionFactory(content__language="en")
+
+        version.publish(version.created_by)
+
+        self.assertEqual(PageContentListing.objects.get(page_content=version.content).state, PUBLISHED)
+
+    def test_lock_changes_update_the_row(self):
+        version = PageVersionFactory(content__language="en")
+        user = UserFactory()
+
+        lock = VersionLock.objects.create(version=version, created_by=user)
+        self.assertEqual(PageContentListing.objects.get(page_content=version.content).lock_owner, user)
+
+        lock.delete()
+        self.assertIsNone(PageContentListing.objects.get(page_content=version.content).lock_owner)
+
+    def test_url_changes_update_the_row(self):
+        version = PageVersionFactory(content__language="en")
+
+        PageUrlFactory(page=version.content.page, language="en", path="new/path")
+
+        self.assertEqual(PageContentListing.objects.get(page_content=version.content).path, "new/path")
+
+
+class PageContentListingTreeTestCase(CMSTestCase):
+    """
+    The cms rewrites the urls of the descendants of a page with queryset
+    updates, the operations of its page admin are replayed here.
+    """
+
+    def setUp(self):
+        connect_listing_handlers()
+        self.addCleanup(disconnect_listing_handlers)
+        site = Site.objects.get_current()
+        parent_node = TreeNode.add_root(site=site)
+        self.other_node = TreeNode.add_root(site=site)
+        self.parent = self._create_page(parent_node, "parent", "parent")
+        self.child = self._create_page(parent_node.add_child(site=site), "child", "parent/child")
+        self.request = self.get_request("/")
+        self.request.user = self.get_superuser()
+
+    def _create_page(self, node, slug, path):
+        page = PageVersionFactory(content__language="en", content__page__node=node).content.page
+        PageUrlFactory(page=page, language="en", slug=slug, path=path, managed=True)
+        return page
+
+    def _send_operation(self, operation, page, **kwargs):
+        post_obj_operation.send(
+            sender=Page, operation=operation, request=self.request, token="token", obj=page, **kwargs
+        )
+
+    def _listed_path(self, page):
+        return PageContentListing.objects.get(page=page).path
+
+    def test_parent_slug_change_updates_the_descendants(self):
+        self.parent.update_urls("en", slug="renamed", path="renamed")
+        self.parent._update_url_path_recursive("en")
+
+        self._send_operation(CHANGE_PAGE_TRANSLATION, self.parent, language="en")
+
+        self.assertEqual(self._listed_path(self.parent), "renamed")
+        self.assertEqual(self._listed_path(self.child), "renamed/child")
+
+    def test_move_updates_the_moved_tree(self):
+        self.child.move_page(self.other_node, position="first-child")
+
+        self._send_operation(MOVE_PAGE, self.child)
+
+        self.assertEqual(self._listed_path(self.child), "child")
+
+    def test_parent_url_save_refreshes_the_descendants(self):
+        PageUrl.objects.filter(page=self.child).update(path="moved/child")
+        url = PageUrl.objects.get(page=self.parent)
+
+        url.path = "moved"
+        url.save()
+
+        self.assertEqual(self._listed_path(self.parent), "moved")
+        self.assertEqual(self._listed_path(self.child), "moved/child")
+
+
+class PageContentListingExportTestCase(CMSTestCase):
+    @patch("djangocms_pageadmin.conf.LISTING_ENABLED", True)
+    def test_export_is_read_from_the_listing(self):
+        version = PageVersionFactory(content__language="en", state=PUBLISHED)
+        PageContentListing.objects.refresh(PageContent._base_manager.filter(pk=version.content.pk))
+        PageContentListing.objects.update(title="Listed title")
+
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(self.get_admin_url(PageContent, "export_csv"))
+
+        row = response.getvalue().decode().splitlines()[1].split(",")
+        self.assertEqual(row[0], "Listed title")
+        self.assertEqual(row[2], "Published")
+        self.assertEqual(row[3], version.created_by.username)
+
+    @patch("djangocms_pageadmin.conf.LISTING_ENABLED", True)
+    def test_export_from_the_listing_keeps_the_ordering(self):
+        versions = [
+            PageVersionFactory(content__language="en", content__title=title)
+            for title in ("b", "c", "a")
+        ]
+        PageContentListing.objects.refresh(
+            PageContent._base_manager.filter(pk__in=[version.content.pk for version in versions])
+        )
+        model_admin = admin.site._registry[PageContent]
+        queryset = model_admin.get_exported_queryset(self.get_request("/")).order_by("title", "-pk")
+
+        titles = [row["title"] for row in model_admin.get_export_values(queryset)]
+
+        self.assertEqual(titles, ["a", "b", "c"])
+
+    def test_listing_ordering(self):
+        model_admin = admin.site._registry[PageContent]
+
+        self.assertEqual(
+            model_admin._get_listing_ordering(["-versions__modified", "title", "page__node__path", "-pk"]),
+            ["-modified", "title", "page_content__page__node__path", "-page_content_id"],
+        )
+
+
+class PageContentListingSetHomeTestCase(CMSTestCase):
+    @patch("djangocms_pageadmin.conf.LISTING_ENABLED", True)
+    def test_set_home_refreshes_the_listing_of_both_pages(self):
+        old_home = PageVersionFactory(
+            content__language="en", content__page__node__depth=1, content__page__is_home=True,
+            state=PUBLISHED,
+        ).content
+        new_home = PageVersionFactory(
+            content__language="en", content__page__node__depth=1, state=PUBLISHED
+        ).content
+        PageContentListing.objects.refresh(
+            PageContent._base_manager.filter(pk__in=[old_home.pk, new_home.pk])
+        )
+
+        with self.login_user_context(self.get_superuser()):
+            self.client.post(self.get_admin_url(PageContent, "set_home_content", new_home.pk))
+
+        self.assertFalse(PageContentListing.objects.get(page_content=old_home).is_home)
+        self.assertTrue(PageContentListing.objects.get(page_content=new_home).is_home)
@@ -0,0 +1,247 @@
+from unittest.mock import patch
+
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_moderation.models import (
+    ModerationCollection,
+    ModerationRequestTreeNode,
+    Workflow,
+)
+from djangocms_version_locking.models import VersionLock
+from djangocms_versioning.models import Version
+
+from djangocms_pageadmin.moderation import (
+    COLLECTION_SELECTION_SESSION_KEY,
+    CollectionItemsBulkForm,
+    add_versions_to_collection,
+)
+from djangocms_pageadmin.test_utils.factories import (
+    PageVersionFactory,
+    UserFactory,
+)
+
+
+class ModerationTestCase(CMSTestCase):
+    def setUp(self):
+        self.user = self.get_superuser()
+        self.workflow = Workflow.objects.create(name="Workflow")
+        self.collection = ModerationCollection.objects.create(
+            name="Collection", author=self.user, workflow=self.workflow
+        )
+
+    def _single_item_tree(self, versions):
+        """Adds ``versions`` to a new collection with the single item path"""
+        collection = ModerationCollection.objects.create(
+            name="Single", author=self.user, workflow=self.workflow
+        )
+        for version in versions:
+            collection.add_version(version)
+        return collection
+
+
+class TestCollectionItemsBulkForm(ModerationTestCase):
+    def _clean(self, versions):
+        form = CollectionItemsBulkForm(self.user, data={
+            "collection": self.collection.pk,
+            "versions": [version.pk for version in versions],
+        })
+        form.is_valid()
+        return form
+
+    def test_keeps_versions_not_in_active_requests_or_locked(self):
+        free = PageVersionFactory(created_by=self.user)
+        own_lock = PageVersionFactory(created_by=self.user)
+        VersionLock.objects.create(version=own_lock, created_by=self.user)
+        locked = PageVersionFactory()
+        VersionLock.objects.create(version=locked, created_by=UserFactory())
+        in_moderation = PageVersionFactory(created_by=self.user)
+        self.collection.add_version(in_moderation)
+
+        form = self._clean([free, own_lock, locked, in_moderation])
+
+        self.assertEqual(list(form.cleaned_data["versions"]), [free, own_lock])
+
+    def test_checks_all_the_versions_with_one_query(self):
+        versions = PageVersionFactory.create_batch(5, created_by=self.user)
+        form = CollectionItemsBulkForm(self.user)
+        form.cleaned_data = {"versions": Version.objects.filter(pk__in=[v.pk for v in versions])}
+        ContentType.objects.get_for_model(PageContent)
+
+        # One query to check that any is eligible and one to load them
+        with self.assertNumQueries(2):
+            self.assertEqual(len(form.clean_versions()), 5)
+
+    def test_no_eligible_versions(self):
+        version = PageVersionFactory()
+        VersionLock.objects.create(version=version, created_by=UserFactory())
+
+        form = self._clean([version])
+
+        self.assertIn("versions", form.errors)
+
+
+class TestAddVersionsToCollection(ModerationTestCase):
+    def test_matches_the_single_item_path(self):
+        versions = PageVersionFactory.create_batch(3, created_by=UserFactory())
+        single = self._single_item_tree(versions)
+
+        added = add_versions_to_collection(
+            self.collection, Version.objects.filter(pk__in=[v.pk for v in versions]), self.user
+        )
+
+        self.assertEqual(added, 3)
+        for collection in (single, self.collection):
+            self.assertEqual(
+                list(collection.moderation_requests.values_list("version_id", "author_id")),
+                [(version.pk, self.user.pk) for version in versions],
+            )
+        roots = ModerationRequestTreeNode.get_root_nodes()
+        self.assertEqual(
+            list(roots.filter(moderation_request__collection=self.collection)
+                 .values_list("moderation_request__version_id", flat=True)),
+            [version.pk for version in versions],
+        )
+
+    def test_versions_already_in_the_collection_are_not_added_again(self):
+        versions = PageVersionFactory.create_batch(2, created_by=UserFactory())
+        self.collection.add_version(versions[0])
+
+        added = add_versions_to_collection(
+            self.collection, Version.objects.filter(pk__in=[v.pk for v in versions]), self.user
+        )
+
+        self.assertEqual(added, 1)
+        self.assertEqual(self.collection.moderation_requests.count(), 2)
+        self.assertEqual(
+            ModerationRequestTreeNode.get_root_nodes()
+            .filter(moderation_request__collection=self.collection).count(),
+            2,
+        )
+
+    def test_children_of_the_pages_of_the_user_go_under_their_root_node(self):
+        versions = PageVersionFactory.create_batch(2, created_by=self.user)
+        self.collection.add_version(versions[0])
+        existing_node = ModerationRequestTreeNode.get_root_nodes().get(
+            moderation_request__version=versions[0]
+        )
+
+        with patch.object(
+            ModerationCollection, "_add_nested_children", autospec=True, return_value=0
+        ) as add_nested_children:
+            add_versions_to_collection(
+                self.collection, Version.objects.filter(pk__in=[v.pk for v in versions]), self.user
+            )
+
+        parents = [call[0][2] for call in add_nested_children.call_args_list]
+        self.assertEqual(parents[0], existing_node)
+        self.assertEqual(parents[1].moderation_request.version, versions[1])
+        self.assertTrue(all(parent.pk and parent.depth == 1 for parent in parents))
+
+    def test_pages_of_the_user(self):
+        versions = PageVersionFactory.create_batch(2, created_by=self.user)
+        self.collection.add_version(versions[0])
+
+        added = add_versions_to_collection(
+            self.collection, Version.objects.filter(pk__in=[v.pk for v in versions]), self.user
+        )
+
+        self.assertEqual(added, 1)
+        self.assertEqual(
+            ModerationRequestTreeNode.get_root_nodes()
+            .filter(moderation_request__collection=self.collection).count(),
+            2,
+        )
+
+
+class TestAddToCollectionView(ModerationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+        self.collection_url = self.get_admin_url(PageContent, "add_to_collection")
+
+    def _run_action(self, contents, query_string="", **data):
+        return self.client.post(self.changelist_url + query_string, {
+            "action": "add_items_to_collection",
+            "_selected_action": [content.pk for content in contents],
+            **data,
+        })
+
+    def test_action_keeps_the_selection_out_of_the_url(self):
+        versions = PageVersionFactory.create_batch(2, content__language="en")
+
+        with self.login_user_context(self.user):
+            response = self._run_action([version.content for version in versions])
+            session = self.client.session
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith(self.collection_url))
+        self.assertNotIn(str(versions[0].content.pk), response.url.split("?")[1])
+        self.assertEqual(
+            sorted(session[COLLECTION_SELECTION_SESSION_KEY]["ids"]),
+            sorted(version.content.pk for version in versions),
+        )
+
+    def test_adds_the_selected_versions_to_the_collection(self):
+        versions = PageVersionFactory.create_batch(3, content__language="en", created_by=UserFactory())
+
+        with self.login_user_context(self.user):
+            self._run_action([version.content for version in versions[:2]])
+            response = self.client.get(self.collection_url)
+            self.assertContains(response, "Add items to collection")
+            response = self.client.post(self.collection_url, {"collection": self.collection.pk})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(self.collection.moderation_requests.values_list("version_id", flat=True)),
+            {version.pk for version in versions[:2]},
+        )
+
+    def test_select_across_keeps_the_filters(self):
+        versions = PageVersionFactory.create_batch(2, content__language="en", created_by=UserFactory())
+        PageVersionFactory(content__language="de", created_by=UserFactory())
+
+        with self.login_user_context(self.user):
+            self._run_action(
+                [versions[0].content], query_string="?language=en", select_across="1"
+            )
+            session = self.client.session
+            response = self.client.post(self.collection_url, {"collection": self.collection.pk})
+
+        self.assertEqual(session[COLLECTION_SELECTION_SESSION_KEY]["params"], {"language": "en"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(self.collection.moderation_requests.values_list("version_id", flat=True)),
+            {version.pk for version in versions},
+        )
+
+
+class TestModerationColumn(ModerationTestCase):
+    def _get_changelist(self):
+        with self.login_user_context(self.user):
+            return self.client.get(self.get_admin_url(PageContent, "changelist"))
+
+    def test_shows_the_collection_of_the_version(self):
+        version = PageVersionFactory(content__language="en")
+        self.collection.add_version(version)
+
+        response = self._get_changelist()
+
+        self.assertContains(response, "Collection (Collecting)")
+
+    def test_column_is_computed_from_the_prefetched_versions(self):
+        for version in PageVersionFactory.create_batch(3, content__language="en"):
+            self.collection.add_version(version)
+        PageVersionFactory(content__language="en")
+        model_admin = admin.site._registry[PageContent]
+        request = self.get_request("/")
+        request.user = self.user
+        contents = list(model_admin.get_queryset(request))
+
+        with self.assertNumQueries(0):
+            values = [model_admin.moderation(content) for content in contents]
+
+        self.assertEqual(sorted(values), [""] + ["Collection (Collecting)"] * 3)
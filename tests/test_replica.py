@@ -0,0 +1,127 @@
+from unittest.mock import patch
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_versioning.constants import PUBLISHED
+
+from djangocms_pageadmin.helpers import (
+    get_request_context,
+    is_pinned_to_primary,
+    pin_to_primary,
+    use_read_database,
+)
+from djangocms_pageadmin.test_utils.factories import PageVersionFactory
+
+
+@patch("djangocms_pageadmin.conf.READ_DATABASE", "replica")
+class ReadDatabaseTestCase(CMSTestCase):
+    """
+    The pages are only created in the default database, so reads routed to
+    the empty "replica" database don't find them.
+    """
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.version = PageVersionFactory(
+            content__language="en", content__page__node__depth=1, state=PUBLISHED
+        )
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+
+    def _get(self, url, **params):
+        with self.login_user_context(self.get_superuser()):
+            return self.client.get(url, params)
+
+    def test_changelist_reads_from_the_read_database(self):
+        response = self._get(self.changelist_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].queryset.db, "replica")
+        self.assertEqual(response.context["cl"].result_count, 0)
+
+    def test_search_and_filters_read_from_the_read_database(self):
+        response = self._get(
+            self.changelist_url,
+            q=self.version.content.title,
+            created_by=self.version.created_by.pk,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].queryset.db, "replica")
+        self.assertEqual(response.context["cl"].result_count, 0)
+
+    def test_export_reads_from_the_read_database(self):
+        response = self._get(self.get_admin_url(PageContent, "export_csv"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(self.version.content.title, response.getvalue().decode())
+
+    @patch("djangocms_pageadmin.conf.READ_DATABASE", None)
+    def test_default_database_without_read_database(self):
+        response = self._get(self.changelist_url)
+
+        self.assertEqual(response.context["cl"].queryset.db, "default")
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_set_home_pins_the_user_to_the_default_database(self):
+        with self.login_user_context(self.get_superuser()):
+            self.client.post(
+                self.get_admin_url(PageContent, "set_home_content", self.version.content.pk)
+            )
+            response = self.client.get(self.changelist_url)
+
+        self.assertEqual(response.context["cl"].queryset.db, "default")
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    @patch("djangocms_pageadmin.conf.PRIMARY_PIN_SECONDS", -1)
+    def test_pin_expires(self):
+        with self.login_user_context(self.get_superuser()):
+            self.client.post(
+                self.get_admin_url(PageContent, "set_home_content", self.version.content.pk)
+            )
+            response = self.client.get(self.changelist_url)
+
+        self.assertEqual(response.context["cl"].queryset.db, "replica")
+
+    def test_duplicate_pins_the_user_to_the_default_database(self):
+        with self.login_user_context(self.get_superuser()):
+            self.client.post(
+                self.get_admin_url(PageContent, "duplicate", self.version.content.pk),
+                data={"site": self.version.content.page.node.site_id, "slug": "new-slug"},
+            )
+            response = self.client.get(self.changelist_url)
+
+        self.assertEqual(response.context["cl"].queryset.db, "default")
+        self.assertEqual(response.context["cl"].result_count, 2)
+
+
+@patch("djangocms_pageadmin.conf.READ_DATABASE", "replica")
+class ReadDatabaseHelpersTestCase(CMSTestCase):
+    def _get_request(self):
+        request = self.get_request("/")
+        request.session = {}
+        return request
+
+    def test_use_read_database(self):
+        request = self._get_request()
+
+        use_read_database(request)
+
+        self.assertEqual(get_request_context(request).database, "replica")
+
+    def test_pinned_request_uses_the_default_database(self):
+        request = self._get_request()
+
+        pin_to_primary(request)
+        use_read_database(request)
+
+        self.assertTrue(is_pinned_to_primary(request))
+        self.assertIsNone(get_request_context(request).database)
+
+    @patch("djangocms_pageadmin.conf.READ_DATABASE", None)
+    def test_no_pin_without_read_database(self):
+        request = self._get_request()
+
+        pin_to_primary(request)
+
+        self.assertFalse(is_pinned_to_primary(request))
@@ -0,0 +1,67 @@
+import os
+import time
+import tracemalloc
+from unittest import skipUnless
+
+from django.contrib import admin
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_pageadmin.rows import PageContentRow
+from djangocms_pageadmin.test_utils.factories import PageVersionFactory
+
+
+class PageContentRowTestCase(CMSTestCase):
+    def setUp(self):
+        self.model_admin = admin.site._registry[PageContent]
+        self.request = self.get_request("/")
+        self.request.user = self.get_superuser()
+
+    def test_rows_hold_the_display_columns(self):
+        version = PageVersionFactory(content__language="en")
+
+        row, = PageContentRow.from_queryset(self.model_admin.get_listing_queryset(self.request))
+
+        self.assertEqual(row.pk, version.content.pk)
+        self.assertEqual(row.title, version.content.title)
+        self.assertEqual(row.language, "en")
+        self.assertEqual(row.state, version.state)
+        self.assertEqual(row.author, version.created_by.username)
+        self.assertEqual(row.modified, version.modified)
+        self.assertFalse(hasattr(row, "__dict__"))
+
+    def test_instance_is_loaded_lazily(self):
+        version = PageVersionFactory(content__language="en")
+        row, = PageContentRow.from_queryset(self.model_admin.get_listing_queryset(self.request))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(row.instance, version.content)
+            self.assertEqual(row.instance, version.content)
+
+
+@skipUnless(os.environ.get("PAGEADMIN_BENCHMARK"), "Set PAGEADMIN_BENCHMARK to run the benchmarks")
+class ExportRowsBenchmark(CMSTestCase):
+    """Time and peak memory to build 10k export rows from instances and values"""
+
+    rows = 10000
+
+    def setUp(self):
+        PageVersionFactory.create_batch(self.rows, content__language="en")
+        self.model_admin = admin.site._registry[PageContent]
+        self.request = self.get_request("/")
+        self.request.user = self.get_superuser()
+
+    def _measure(self, name, get_rows):
+        tracemalloc.start()
+        start = time.perf_counter()
+        rows = list(get_rows())
+        elapsed = time.perf_counter() - start
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{}: {} rows in {:.2f}s, peak {:.1f} MiB".format(name, len(rows), elapsed, peak / 2 ** 20))
+
+    def test_export_rows(self):
+        queryset = self.model_admin.get_listing_queryset(self.request)
+        self._measure("instances", lambda: self.model_admin.get_export_rows(queryset))
+        self._measure("values", lambda: self.model_admin._get_values_export_rows(queryset))
@@ -0,0 +1,101 @@
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.contrib.admin.views.main import ChangeList
+from django.db import connection
+
+from cms.models import PageContent
+from cms.test_utils.testcases import CMSTestCase
+
+from djangocms_pageadmin.test_utils.factories import PageVersionFactory
+from djangocms_pageadmin.timeouts import StatementTimeout, statement_timeout
+
+
+# Counts long enough to outlast any timeout of these tests
+SLOW_QUERY = (
+    "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < %s) "
+    "SELECT COUNT(*) FROM numbers"
+)
+
+
+def run_slow_query(*args, **kwargs):
+    with connection.cursor() as cursor:
+        cursor.execute(SLOW_QUERY, [10 ** 12])
+
+
+class StatementTimeoutTestCase(CMSTestCase):
+    def test_slow_statement_is_cancelled(self):
+        with self.assertLogs("djangocms_pageadmin.timeouts", "WARNING") as logs:
+            with self.assertRaises(StatementTimeout) as error:
+                with statement_timeout(0.1, label="search"):
+                    run_slow_query()
+
+        self.assertEqual(error.exception.sql, SLOW_QUERY)
+        self.assertIn("search", logs.output[0])
+        # The parameters of the statement aren't logged
+        self.assertNotIn(str(10 ** 12), logs.output[0])
+
+    def test_fast_statement(self):
+        with statement_timeout(5):
+            with connection.cursor() as cursor:
+                cursor.execute(SLOW_QUERY, [10])
+                self.assertEqual(cursor.fetchone(), (10,))
+
+    def test_no_timeout(self):
+        with statement_timeout(None):
+            with connection.cursor() as cursor:
+                cursor.execute(SLOW_QUERY, [10])
+                self.assertEqual(cursor.fetchone(), (10,))
+
+    def test_timeout_is_removed_after_the_block(self):
+        with statement_timeout(0.1):
+            pass
+
+        with connection.cursor() as cursor:
+            cursor.execute(SLOW_QUERY, [10 ** 5])
+            self.assertEqual(cursor.fetchone(), (10 ** 5,))
+
+    @skipUnless(connection.vendor == "postgresql", "SET LOCAL is specific to postgres")
+    def test_nested_timeout_restores_the_outer_timeout(self):
+        with statement_timeout(5):
+            with statement_timeout(0.1):
+                pass
+
+            with connection.cursor() as cursor:
+                cursor.execute("SHOW statement_timeout")
+                self.assertEqual(cursor.fetchone()[0], "5s")
+
+
+class ChangelistTimeoutTestCase(CMSTestCase):
+    def setUp(self):
+        PageVersionFactory(content__language="en", content__title="something")
+        self.changelist_url = self.get_admin_url(PageContent, "changelist")
+
+    def _get_changelist(self, **params):
+        with self.login_user_context(self.get_superuser()):
+            with patch.object(ChangeList, "get_results", run_slow_query):
+                return self.client.get(self.changelist_url, params)
+
+    @patch("djangocms_pageadmin.conf.STATEMENT_TIMEOUTS", {"search": 0.1})
+    def test_slow_search_renders_the_fallback(self):
+        response = self._get_changelist(q="something")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertTemplateUsed(response, "djangocms_pageadmin/admin/refine_search.html")
+        self.assertContains(response, 'value="something"', status_code=503)
+        self.assertFalse(response.has_header("ETag"))
+
+    @patch("djangocms_pageadmin.conf.STATEMENT_TIMEOUTS", {"changelist": 0.1})
+    def test_slow_changelist_renders_the_fallback(self):
+        response = self._get_changelist()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertTemplateUsed(response, "djangocms_pageadmin/admin/refine_search.html")
+
+    @patch("djangocms_pageadmin.conf.STATEMENT_TIMEOUTS", {"search": 0.1})
+    def test_timeout_of_another_view(self):
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.get(self.changelist_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].result_count, 1)